@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_COOLDOWN = 300  # seconds
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+logger = logging.getLogger(__name__)
+
+
+class _Circuit:
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+
+class CircuitBreaker:
+    """Per-domain circuit breakers.
+
+    A domain's circuit opens after ``failure_threshold`` consecutive
+    failures. While open, ``allow`` refuses requests until ``cooldown``
+    seconds have passed; then a single probe is let through, and its outcome
+    closes the circuit again or restarts the cooldown.
+    """
+
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, cooldown=DEFAULT_COOLDOWN, clock=time.monotonic):
+        self._lock = threading.Lock()
+        self._circuits = {}
+        self._clock = clock
+        self.failure_threshold = DEFAULT_FAILURE_THRESHOLD
+        self.cooldown = DEFAULT_COOLDOWN
+        self.configure(failure_threshold, cooldown)
+
+    def configure(self, failure_threshold=None, cooldown=None):
+        with self._lock:
+            if failure_threshold:
+                self.failure_threshold = max(1, int(failure_threshold))
+            if cooldown:
+                self.cooldown = max(1, float(cooldown))
+
+    def allow(self, key):
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state == CLOSED:
+                return True
+            if circuit.state == OPEN and self._clock() - circuit.opened_at >= self.cooldown:
+                circuit.state = HALF_OPEN
+                logger.info("Probing %s after circuit cooldown", key)
+                return True
+            return False
+
+    def record_success(self, key):
+        with self._lock:
+            circuit = self._circuits.pop(key, None)
+        if circuit is not None and circuit.state != CLOSED:
+            logger.info("Circuit for %s closed", key)
+
+    def record_failure(self, key):
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or (
+                circuit.state == CLOSED and circuit.failures >= self.failure_threshold
+            ):
+                circuit.state = OPEN
+                circuit.opened_at = self._clock()
+                logger.warning(
+                    "Circuit for %s opened after %d consecutive failures",
+                    key,
+                    circuit.failures,
+                )
+
+    def state(self, key):
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit else CLOSED
+
+    def snapshot(self):
+        with self._lock:
+            now = self._clock()
+            return {
+                key: {
+                    "state": circuit.state,
+                    "failures": circuit.failures,
+                    "retry_in": max(0.0, circuit.opened_at + self.cooldown - now)
+                    if circuit.state == OPEN else 0.0,
+                }
+                for key, circuit in self._circuits.items()
+            }
@@ -1,34 +1,289 @@
 import datetime
+import json
+import logging
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import polling
+import telemetry
 
 DEFAULT_UPDATE_FREQUENCY = 1  # days
 DEFAULT_FREE_ONLY = False
+CONNECTION_MAX_AGE = 300  # seconds
+DEFAULT_BACKOFF_CAP_HOURS = 168
+DEFAULT_TELEMETRY_RAW_HOURS = 24
+DEFAULT_TELEMETRY_RETENTION_DAYS = 30
+SCRAPE_JOB_RETENTION = 7 * 86400  # seconds finished jobs are kept
+SCRAPE_LEASE_SECONDS = 300
+SCRAPE_LINK_MAX_LEASES = 3  # expired leases before a link is given up on
+SCRAPE_WORKER_RETENTION = 86400  # seconds a silent worker stays listed
+
+logger = logging.getLogger(__name__)
+
+# Marker recorded when a write affects every category.
+_ALL_CATEGORIES = object()
 
 _DEFAULT_CATEGORIES = [
     ("main", 1),
 ]
 
+# Columns link_due_at needs, joined from links/latest_entries/categories.
+_SCHEDULE_COLUMNS = """
+    l.url, l.category, l.update_frequency, l.last_attempt, l.next_check_at, l.failure_count,
+    le.last_found, le.timestamp, c.update_interval_hours
+"""
+_SCHEDULE_JOINS = """
+    FROM links l
+    LEFT JOIN latest_entries le ON le.link_id = l.id
+    LEFT JOIN categories c ON c.name = l.category
+"""
+
+
+def _parse_datetime(value, fmt=None):
+    if not value:
+        return None
+    try:
+        return datetime.datetime.strptime(value, fmt) if fmt else datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _interval_hours(row) -> int:
+    try:
+        return max(1, int(row.get("update_interval_hours") or 1))
+    except (TypeError, ValueError):
+        return 1
+
+
+def failure_backoff_until(row, cap_hours=DEFAULT_BACKOFF_CAP_HOURS):
+    """Earliest retry for a link failing repeatedly, or ``None``.
+
+    The category interval doubles with every consecutive failure after the
+    first, up to ``cap_hours``.
+    """
+    try:
+        failures = int(row.get("failure_count") or 0)
+    except (TypeError, ValueError):
+        failures = 0
+    last_attempt = _parse_datetime(row.get("last_attempt"))
+    if failures < 2 or last_attempt is None:
+        return None
+    interval_hours = _interval_hours(row)
+    hours = min(interval_hours * 2 ** min(failures - 1, 16), max(cap_hours, interval_hours))
+    return last_attempt + datetime.timedelta(hours=hours)
+
+
+def link_due_at(row, now=None, backoff_cap_hours=DEFAULT_BACKOFF_CAP_HOURS):
+    """Return when a link next needs scraping.
+
+    A link is retried once per category interval after its last attempt, and
+    not before ``update_frequency`` full days have passed since its latest
+    release. Links that were never attempted are due immediately; links that
+    keep failing back off (see ``failure_backoff_until``).
+    """
+    now = now or datetime.datetime.now()
+    interval_hours = _interval_hours(row)
+    last_attempt = _parse_datetime(row.get("last_attempt"))
+    due = last_attempt + datetime.timedelta(hours=interval_hours) if last_attempt else now
+
+    last_found = row.get("last_found")
+    release = None
+    if last_found and last_found != "No data":
+        release = _parse_datetime(row.get("timestamp"), "%Y/%m/%d")
+    if release:
+        try:
+            freq = int(row.get("update_frequency"))
+        except (TypeError, ValueError):
+            freq = DEFAULT_UPDATE_FREQUENCY
+        due = max(due, release + datetime.timedelta(days=freq + 1))
+    backoff = failure_backoff_until(row, backoff_cap_hours)
+    return max(due, backoff) if backoff else due
+
+
+def _rollup_group(row):
+    group = {"attempts": 0, "failures": 0, "requests": 0, "bytes": 0,
+             "histogram": telemetry.histogram([])}
+    if row is not None:
+        for field in ("attempts", "failures", "requests", "bytes"):
+            group[field] = row[field]
+        try:
+            telemetry.merge_histograms(group["histogram"], json.loads(row["histogram"]))
+        except (TypeError, ValueError):
+            pass
+    return group
+
+
+def _add_attempt(group, row):
+    group["attempts"] += 1
+    if row["outcome"] != telemetry.SUCCESS:
+        group["failures"] += 1
+    group["requests"] += row["requests"] or 0
+    group["bytes"] += row["bytes"] or 0
+    group["histogram"][telemetry.bucket_index(row["duration_ms"])] += 1
+
 
 class ChapterDatabase:
     """SQLite-backed store for links and scraped entries."""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, connection_max_age: float = CONNECTION_MAX_AGE):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection_max_age = connection_max_age
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._writer = None
+        self._writer_opened_at = 0.0
+        self._readers: Dict[int, Tuple[threading.Thread, sqlite3.Connection]] = {}
+        self._readers_lock = threading.Lock()
+        self._generation = 0
+        self._changed = None
+        self._listeners = []
+        self._query_observer = None
         self._ensure_schema()
 
-    def _connect(self):
-        conn = sqlite3.connect(self.db_path)
+    def _open_connection(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         conn.execute("PRAGMA journal_mode = WAL")
         conn.execute("PRAGMA synchronous = NORMAL")
         return conn
 
+    def _expired(self, opened_at: float) -> bool:
+        return time.monotonic() - opened_at > self.connection_max_age
+
+    def set_query_observer(self, callback):
+        """Call ``callback(operation, kind, seconds)`` after every read/write.
+
+        ``operation`` is the name of the public method that ran the query and
+        ``kind`` is ``"read"`` or ``"write"``; write timings include waiting
+        for the write lock.
+        """
+        self._query_observer = callback
+
+    def _observe(self, operation, kind, started):
+        observer = self._query_observer
+        if observer is None:
+            return
+        try:
+            observer(operation, kind, time.perf_counter() - started)
+        except Exception:
+            logger.exception("Query observer failed")
+
+    @contextmanager
+    def _read(self, operation: str):
+        """Yield this thread's read connection, reopening it once it is too old.
+
+        ``operation`` names the read for the query observer.
+        """
+        started = time.perf_counter()
+        state = getattr(self._local, "reader", None)
+        if state and (state[2] != self._generation or self._expired(state[1])):
+            self._drop_reader(state[0])
+            state = None
+        if state is None:
+            conn = self._open_connection()
+            state = (conn, time.monotonic(), self._generation)
+            self._local.reader = state
+            self._register_reader(conn)
+        try:
+            yield state[0]
+        finally:
+            self._observe(operation, "read", started)
+
+    def _register_reader(self, conn):
+        current = threading.current_thread()
+        with self._readers_lock:
+            # Readers owned by threads that have exited are closed here so
+            # short-lived request/background threads do not leak handles.
+            for ident, (thread, reader) in list(self._readers.items()):
+                if thread is current or not thread.is_alive():
+                    del self._readers[ident]
+                    if thread is not current:
+                        reader.close()
+            self._readers[current.ident] = (current, conn)
+
+    def _drop_reader(self, conn):
+        with self._readers_lock:
+            entry = self._readers.get(threading.get_ident())
+            if entry and entry[1] is conn:
+                del self._readers[threading.get_ident()]
+        conn.close()
+        self._local.reader = None
+
+    @contextmanager
+    def _write(self, operation: str):
+        """Serialize writes through one shared connection and commit on exit.
+
+        ``operation`` names the write for the query observer.
+        """
+        started = time.perf_counter()
+        with self._write_lock:
+            if self._writer is not None and self._expired(self._writer_opened_at):
+                self._writer.close()
+                self._writer = None
+            if self._writer is None:
+                self._writer = self._open_connection()
+                self._writer_opened_at = time.monotonic()
+            self._changed = set()
+            try:
+                with self._writer:
+                    yield self._writer
+                changed = self._changed
+            finally:
+                self._changed = None
+                self._observe(operation, "write", started)
+        if changed:
+            self._notify_change(None if _ALL_CATEGORIES in changed else changed)
+
+    def add_change_listener(self, callback):
+        """Call ``callback(categories)`` after a committed write changes data.
+
+        ``categories`` is a set of affected category names, or ``None`` when
+        the change may affect every category.
+        """
+        self._listeners.append(callback)
+
+    def _notify_change(self, categories):
+        for callback in list(self._listeners):
+            try:
+                callback(categories)
+            except Exception:
+                logger.exception("Change listener failed")
+
+    def _mark_changed(self, conn, urls=None, categories=None):
+        if self._changed is None:
+            return
+        if urls is None and categories is None:
+            self._changed.add(_ALL_CATEGORIES)
+            return
+        self._changed.update(category for category in categories or () if category)
+        if urls:
+            rows = conn.execute(
+                "SELECT DISTINCT category FROM links WHERE url IN (SELECT value FROM json_each(?))",
+                (json.dumps(list(urls)),),
+            ).fetchall()
+            self._changed.update(row["category"] for row in rows)
+
+    def close(self):
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            with self._readers_lock:
+                readers = [conn for _, conn in self._readers.values()]
+                self._readers.clear()
+                # Threads holding a reader from before close() reopen lazily.
+                self._generation += 1
+        for conn in readers:
+            conn.close()
+
     def _ensure_schema(self):
-        with self._connect() as conn:
+        with self._write("ensure_schema") as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS links (
@@ -48,10 +303,22 @@ class ChapterDatabase:
             )
             self._ensure_links_columns(conn)
             self._ensure_scraped_entries_table(conn)
+            self._ensure_latest_entries_table(conn)
             self._ensure_categories_table(conn)
             self._ensure_settings_table(conn)
+            self._ensure_feed_cache_table(conn)
+            self._ensure_telemetry_tables(conn)
+            self._ensure_scrape_jobs_table(conn)
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_links_category ON links(category)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_links_due ON links(category, next_check_at)")
+            # Covers get_category_unsaved_counts so it never reads link rows.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_links_unsaved ON links(category, last_saved)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_links_failures ON links(failure_count)")
+            self._refresh_next_check(conn, "l.next_check_at IS NULL")
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_scraped_entries_link ON scraped_entries(link_id)"
             )
@@ -99,6 +366,58 @@ class ChapterDatabase:
             )
             conn.execute("DROP TABLE scraped_entries_old")
 
+    def _ensure_latest_entries_table(self, conn):
+        # Denormalized copy of the newest scraped_entries row per link so that
+        # page queries can join instead of running correlated subqueries.
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'latest_entries'"
+        ).fetchone()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS latest_entries (
+                link_id INTEGER PRIMARY KEY,
+                entry_id INTEGER NOT NULL,
+                last_found TEXT,
+                last_found_url TEXT,
+                timestamp TEXT,
+                FOREIGN KEY(link_id) REFERENCES links(id) ON DELETE CASCADE
+            )
+            """
+        )
+        if not exists:
+            self._refresh_latest_entries(conn)
+
+    def _refresh_latest_entries(self, conn, link_ids: Optional[List[int]] = None):
+        if link_ids is not None and not link_ids:
+            return
+        condition = "1"
+        params: List[Any] = []
+        if link_ids is not None:
+            condition = "link_id IN (SELECT value FROM json_each(?))"
+            params = [json.dumps(list(link_ids))]
+        conn.execute(
+            f"""
+            DELETE FROM latest_entries
+            WHERE {condition}
+              AND link_id NOT IN (SELECT link_id FROM scraped_entries)
+            """,
+            params,
+        )
+        conn.execute(
+            f"""
+            INSERT OR REPLACE INTO latest_entries (link_id, entry_id, last_found, last_found_url, timestamp)
+            SELECT link_id, id, last_found, last_found_url, timestamp
+            FROM scraped_entries
+            WHERE id IN (
+                SELECT MAX(id)
+                FROM scraped_entries
+                WHERE {condition}
+                GROUP BY link_id
+            )
+            """,
+            params,
+        )
+
     def _ensure_categories_table(self, conn):
         conn.execute(
             """
@@ -129,7 +448,42 @@ class ChapterDatabase:
             "password_hash": "",
             "share_local": "0",
             "port": "555",
-            "start_on_startup": "0"
+            "start_on_startup": "0",
+            "scrape_max_workers": "8",
+            "scrape_max_per_domain": "2",
+            "http_pool_connections": "10",
+            "http_pool_maxsize": "10",
+            "browser_pool_size": "2",
+            "browser_max_uses": "50",
+            "browser_max_memory_mb": "512",
+            "browser_idle_timeout": "300",
+            "circuit_failure_threshold": "5",
+            "circuit_cooldown_seconds": "300",
+            "failure_backoff_max_hours": "168",
+            "rate_limit_rps": "1",
+            "rate_limit_burst": "3",
+            "rate_limit_overrides": json.dumps({"nyaa.si": {"rate": 0.5, "burst": 1}}),
+            "retry_policy": json.dumps({
+                "connect_timeout": 5,
+                "read_timeout": 20,
+                "retries": 2,
+                "backoff": 1,
+                "backoff_max": 10,
+                "retry_statuses": [429, 500, 502, 503, 504],
+            }),
+            "retry_policy_overrides": json.dumps({
+                "scribblehub.com": {"retry_statuses": [403, 429, 500, 502, 503, 504]},
+            }),
+            "link_time_budget_seconds": "120",
+            "scrape_mode": "inline",
+            "telemetry_raw_hours": str(DEFAULT_TELEMETRY_RAW_HOURS),
+            "telemetry_retention_days": str(DEFAULT_TELEMETRY_RETENTION_DAYS),
+            "startup_stagger_seconds": "300",
+            "schedule_jitter_seconds": "60",
+            "max_concurrent_categories": "2",
+            "adaptive_polling": "0",
+            "adaptive_min_hours": "1",
+            "adaptive_max_hours": "168",
         }
         for key, val in defaults.items():
             conn.execute(
@@ -137,6 +491,104 @@ class ChapterDatabase:
                 (key, val)
             )
 
+    def _ensure_feed_cache_table(self, conn):
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS feed_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                result TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+
+    def _ensure_telemetry_tables(self, conn):
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scrape_attempts (
+                id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL,
+                plugin TEXT NOT NULL,
+                domain TEXT NOT NULL,
+                started_at REAL NOT NULL,
+                duration_ms REAL NOT NULL,
+                requests INTEGER NOT NULL DEFAULT 0,
+                bytes INTEGER NOT NULL DEFAULT 0,
+                outcome TEXT NOT NULL,
+                error_class TEXT
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_scrape_attempts_started ON scrape_attempts(started_at)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scrape_rollups (
+                hour REAL NOT NULL,
+                plugin TEXT NOT NULL,
+                domain TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                failures INTEGER NOT NULL,
+                requests INTEGER NOT NULL,
+                bytes INTEGER NOT NULL,
+                histogram TEXT NOT NULL,
+                PRIMARY KEY (hour, plugin, domain)
+            )
+            """
+        )
+
+    def _ensure_scrape_jobs_table(self, conn):
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scrape_jobs (
+                id INTEGER PRIMARY KEY,
+                category TEXT NOT NULL,
+                urls TEXT,
+                status TEXT NOT NULL DEFAULT 'queued',
+                enqueued_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL,
+                progress INTEGER NOT NULL DEFAULT 0,
+                total INTEGER
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_scrape_jobs_status ON scrape_jobs(status, category)")
+        # One row per link of a job; workers lease links in batches.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scrape_job_links (
+                job_id INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                worker TEXT,
+                lease_expires_at REAL,
+                leases INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (job_id, url),
+                FOREIGN KEY(job_id) REFERENCES scrape_jobs(id) ON DELETE CASCADE
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_scrape_job_links_status ON scrape_job_links(status, job_id)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_scrape_job_links_worker ON scrape_job_links(worker, status)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scrape_workers (
+                id TEXT PRIMARY KEY,
+                host TEXT,
+                pid INTEGER,
+                started_at REAL NOT NULL,
+                heartbeat_at REAL NOT NULL,
+                links_done INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+
     def _ensure_category_columns(self, conn):
         columns = {
             row["name"]: row for row in conn.execute("PRAGMA table_info(categories)").fetchall()
@@ -224,7 +676,10 @@ class ChapterDatabase:
     def _ensure_links_columns(self, conn):
         columns = [row["name"] for row in conn.execute(
             "PRAGMA table_info(links)").fetchall()]
-        needed = {"added_at", "favorite", "last_attempt", "last_error", "last_saved_url"}
+        needed = {
+            "added_at", "favorite", "last_attempt", "last_error", "last_saved_url",
+            "next_check_at", "failure_count",
+        }
         missing = needed - set(columns)
         for col in missing:
             if col == "last_attempt":
@@ -239,6 +694,96 @@ class ChapterDatabase:
                     "ALTER TABLE links ADD COLUMN favorite INTEGER NOT NULL DEFAULT 0")
             elif col == "last_saved_url":
                 conn.execute("ALTER TABLE links ADD COLUMN last_saved_url TEXT")
+            elif col == "next_check_at":
+                conn.execute("ALTER TABLE links ADD COLUMN next_check_at REAL")
+            elif col == "failure_count":
+                conn.execute(
+                    "ALTER TABLE links ADD COLUMN failure_count INTEGER NOT NULL DEFAULT 0")
+
+    def _refresh_next_check(self, conn, condition: str = "", params=()):
+        """Recompute ``next_check_at`` (epoch seconds) for the matching links."""
+        where = f"WHERE {condition}" if condition else ""
+        rows = conn.execute(
+            f"SELECT {_SCHEDULE_COLUMNS} {_SCHEDULE_JOINS} {where}", params
+        ).fetchall()
+        now = datetime.datetime.now()
+        bounds = self._adaptive_bounds(conn)
+        histories = self._release_histories(conn, where, params) if bounds else {}
+        cap_row = conn.execute(
+            "SELECT value FROM settings WHERE key = 'failure_backoff_max_hours'").fetchone()
+        try:
+            cap_hours = max(1.0, float(cap_row["value"])) if cap_row else DEFAULT_BACKOFF_CAP_HOURS
+        except (TypeError, ValueError):
+            cap_hours = DEFAULT_BACKOFF_CAP_HOURS
+        updates = []
+        for row in rows:
+            row = dict(row)
+            due = None
+            if bounds:
+                due = polling.adaptive_next_check(
+                    histories.get(row["url"], []),
+                    _parse_datetime(row["last_attempt"]),
+                    now,
+                    *bounds,
+                )
+                backoff = failure_backoff_until(row, cap_hours)
+                if due is not None and backoff is not None:
+                    due = max(due, backoff)
+            if due is None:
+                due = link_due_at(row, now, cap_hours)
+            updates.append((due.timestamp(), row["url"]))
+        conn.executemany("UPDATE links SET next_check_at = ? WHERE url = ?", updates)
+
+    @staticmethod
+    def _adaptive_bounds(conn) -> Optional[Tuple[float, float]]:
+        settings = dict(conn.execute(
+            "SELECT key, value FROM settings WHERE key IN (?, ?, ?)",
+            ("adaptive_polling", "adaptive_min_hours", "adaptive_max_hours"),
+        ).fetchall())
+        if settings.get("adaptive_polling") != "1":
+            return None
+        try:
+            min_hours = max(1.0, float(settings.get("adaptive_min_hours")))
+        except (TypeError, ValueError):
+            min_hours = polling.DEFAULT_MIN_HOURS
+        try:
+            max_hours = max(min_hours, float(settings.get("adaptive_max_hours")))
+        except (TypeError, ValueError):
+            max_hours = max(min_hours, polling.DEFAULT_MAX_HOURS)
+        return min_hours, max_hours
+
+    @staticmethod
+    def _release_histories(conn, where: str, params) -> Dict[str, List[datetime.datetime]]:
+        rows = conn.execute(
+            f"""
+            SELECT l.url, se.retrieved_at
+            FROM scraped_entries se
+            JOIN links l ON l.id = se.link_id
+            {where}
+            ORDER BY se.link_id, se.id
+            """,
+            params,
+        ).fetchall()
+        histories: Dict[str, List[datetime.datetime]] = {}
+        seen = set()
+        for row in rows:
+            if row["url"] not in seen:
+                # The first entry marks when tracking began, not a release.
+                seen.add(row["url"])
+                continue
+            moment = _parse_datetime(row["retrieved_at"])
+            if moment:
+                histories.setdefault(row["url"], []).append(moment.replace(tzinfo=None))
+        return histories
+
+    def refresh_schedule(self):
+        """Recompute every link's ``next_check_at``, e.g. after polling settings change."""
+        with self._write("refresh_schedule") as conn:
+            self._refresh_next_check(conn)
+
+    def _refresh_next_check_urls(self, conn, urls):
+        self._refresh_next_check(
+            conn, "l.url IN (SELECT value FROM json_each(?))", (json.dumps(list(urls)),))
 
     @staticmethod
     def _normalize_frequency(value):
@@ -273,17 +818,35 @@ class ChapterDatabase:
         except (TypeError, ValueError):
             return 1
 
-    def _get_link_id(self, url: str) -> Optional[int]:
-        with self._connect() as conn:
+    def _get_link_id(self, url: str, operation: str) -> Optional[int]:
+        with self._read(operation) as conn:
             row = conn.execute(
                 "SELECT id FROM links WHERE url = ?", (url,)).fetchone()
         return row["id"] if row else None
 
-    def get_links(self, category: str) -> List[Dict]:
-        with self._connect() as conn:
+    @staticmethod
+    def _get_link_ids(conn, urls) -> Dict[str, int]:
+        # json_each keeps this to a single statement regardless of how many
+        # URLs are passed (no bound-parameter limit).
+        rows = conn.execute(
+            "SELECT id, url FROM links WHERE url IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(urls)),),
+        ).fetchall()
+        return {row["url"]: row["id"] for row in rows}
+
+    @staticmethod
+    def _url_filter(column: str, urls: Optional[List[str]]) -> Tuple[str, tuple]:
+        if urls is None:
+            return "", ()
+        return f" AND {column} IN (SELECT value FROM json_each(?))", (json.dumps(list(urls)),)
+
+    def get_links(self, category: str, urls: Optional[List[str]] = None) -> List[Dict]:
+        url_clause, url_params = self._url_filter("url", urls)
+        with self._read("get_links") as conn:
             rows = conn.execute(
-                "SELECT url, name, update_frequency, free_only, favorite FROM links WHERE category = ? ORDER BY id",
-                (category,),
+                "SELECT url, name, update_frequency, free_only, favorite FROM links "
+                f"WHERE category = ?{url_clause} ORDER BY id",
+                (category, *url_params),
             ).fetchall()
         return [
             {
@@ -309,7 +872,7 @@ class ChapterDatabase:
         flag = self._to_flag(free_only)
         added_at = datetime.datetime.now().isoformat()
         favorite_flag = self._to_flag(favorite)
-        with self._connect() as conn:
+        with self._write("add_link") as conn:
             conn.execute(
                 """
                 INSERT INTO links (url, name, category, update_frequency, free_only, added_at, favorite)
@@ -322,6 +885,8 @@ class ChapterDatabase:
                 """,
                 (url, name, category, freq, flag, added_at, favorite_flag),
             )
+            self._refresh_next_check_urls(conn, [url])
+            self._mark_changed(conn, urls=[url], categories=[category])
 
     def update_link(
         self,
@@ -345,7 +910,8 @@ class ChapterDatabase:
         set_clause = ", ".join(clause for clause, _ in updates)
         params = [value for _, value in updates]
         params.append(original_url)
-        with self._connect() as conn:
+        with self._write("update_link") as conn:
+            self._mark_changed(conn, urls=[original_url])
             conn.execute(
                 f"""
                 UPDATE links
@@ -354,15 +920,19 @@ class ChapterDatabase:
                 """,
                 params,
             )
+            self._refresh_next_check_urls(conn, [new_url])
+            self._mark_changed(conn, urls=[new_url])
 
     def remove_link(self, url: str):
-        with self._connect() as conn:
+        with self._write("remove_link") as conn:
+            self._mark_changed(conn, urls=[url])
             conn.execute("DELETE FROM links WHERE url = ?", (url,))
 
-    def get_scraped_data(self, category: str) -> Dict[str, Dict]:
-        with self._connect() as conn:
+    def get_scraped_data(self, category: str, urls: Optional[List[str]] = None) -> Dict[str, Dict]:
+        url_clause, url_params = self._url_filter("l.url", urls)
+        with self._read("get_scraped_data") as conn:
             rows = conn.execute(
-                """
+                f"""
                 SELECT
                     l.url,
                     l.name,
@@ -374,31 +944,14 @@ class ChapterDatabase:
                     l.last_error,
                     l.added_at,
                     l.favorite,
-                    (
-                        SELECT last_found
-                        FROM scraped_entries se2
-                        WHERE se2.link_id = l.id
-                        ORDER BY se2.id DESC
-                        LIMIT 1
-                    ) AS last_found,
-                    (
-                        SELECT last_found_url
-                        FROM scraped_entries se2
-                        WHERE se2.link_id = l.id
-                        ORDER BY se2.id DESC
-                        LIMIT 1
-                    ) AS last_found_url,
-                    (
-                        SELECT timestamp
-                        FROM scraped_entries se2
-                        WHERE se2.link_id = l.id
-                        ORDER BY se2.id DESC
-                        LIMIT 1
-                    ) AS timestamp
+                    le.last_found,
+                    le.last_found_url,
+                    le.timestamp
                 FROM links l
-                WHERE l.category = ?
+                LEFT JOIN latest_entries le ON le.link_id = l.id
+                WHERE l.category = ?{url_clause}
                 """,
-                (category,),
+                (category, *url_params),
             ).fetchall()
         result = {}
         for row in rows:
@@ -418,8 +971,81 @@ class ChapterDatabase:
             }
         return result
 
+    def get_link_schedule(
+        self, category: Optional[str] = None, urls: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Rows needed to compute when each link is next due."""
+        clauses, params = [], []
+        if category is not None:
+            clauses.append("l.category = ?")
+            params.append(category)
+        if urls is not None:
+            clauses.append("l.url IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(list(urls)))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._read("get_link_schedule") as conn:
+            rows = conn.execute(
+                f"SELECT {_SCHEDULE_COLUMNS} {_SCHEDULE_JOINS} {where}", params
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_backed_off_links(self, min_failures: int = 2) -> List[Dict[str, Any]]:
+        """Links that failed ``min_failures`` times in a row, worst first."""
+        with self._read("get_backed_off_links") as conn:
+            rows = conn.execute(
+                """
+                SELECT url, name, category, failure_count, last_error, last_attempt, next_check_at
+                FROM links
+                WHERE failure_count >= ?
+                ORDER BY failure_count DESC, url
+                """,
+                (min_failures,),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def reset_failures(self, urls: List[str]) -> int:
+        """Clear the failure streak of ``urls`` so they are retried normally."""
+        with self._write("reset_failures") as conn:
+            result = conn.execute(
+                """
+                UPDATE links SET failure_count = 0
+                WHERE failure_count > 0 AND url IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(list(urls)),),
+            )
+            self._refresh_next_check_urls(conn, urls)
+            self._mark_changed(conn, urls=list(urls))
+        return result.rowcount
+
+    def get_due_links(
+        self, category: str, now: Optional[float] = None, limit: Optional[int] = None
+    ) -> List[Dict]:
+        """Links whose ``next_check_at`` has passed, earliest first."""
+        now = time.time() if now is None else now
+        with self._read("get_due_links") as conn:
+            rows = conn.execute(
+                """
+                SELECT url, name, update_frequency, free_only, favorite
+                FROM links
+                WHERE category = ? AND next_check_at <= ?
+                ORDER BY next_check_at
+                LIMIT ?
+                """,
+                (category, now, limit if limit else -1),
+            ).fetchall()
+        return [
+            {
+                "url": row["url"],
+                "name": row["name"],
+                "update_frequency": row["update_frequency"],
+                "free_only": bool(row["free_only"]),
+                "favorite": bool(row["favorite"]),
+            }
+            for row in rows
+        ]
+
     def get_link_history(self, url: str) -> Optional[Dict[str, Any]]:
-        with self._connect() as conn:
+        with self._read("get_link_history") as conn:
             link = conn.execute(
                 """
                 SELECT id, url, name, last_saved, last_saved_url, last_attempt, added_at, update_frequency, free_only
@@ -463,10 +1089,10 @@ class ChapterDatabase:
         }
 
     def get_history_entry(self, url: str, entry_id: int) -> Optional[Dict[str, Any]]:
-        link_id = self._get_link_id(url)
+        link_id = self._get_link_id(url, "get_history_entry")
         if not link_id:
             return None
-        with self._connect() as conn:
+        with self._read("get_history_entry") as conn:
             row = conn.execute(
                 """
                 SELECT id, last_found, last_found_url
@@ -478,21 +1104,15 @@ class ChapterDatabase:
         return row
 
     def delete_history_entry(self, url: str, entry_id: int) -> bool:
-        link_id = self._get_link_id(url)
+        link_id = self._get_link_id(url, "delete_history_entry")
         if not link_id:
             return False
-        with self._connect() as conn:
+        with self._write("delete_history_entry") as conn:
             latest = conn.execute(
-                """
-                SELECT id
-                FROM scraped_entries
-                WHERE link_id = ?
-                ORDER BY id DESC
-                LIMIT 1
-                """,
+                "SELECT entry_id FROM latest_entries WHERE link_id = ?",
                 (link_id,),
             ).fetchone()
-            if latest and latest["id"] == entry_id:
+            if latest and latest["entry_id"] == entry_id:
                 raise ValueError("Cannot delete the latest history entry")
             result = conn.execute(
                 """
@@ -501,6 +1121,10 @@ class ChapterDatabase:
                 """,
                 (link_id, entry_id),
             )
+            if result.rowcount:
+                self._refresh_latest_entries(conn, [link_id])
+                self._refresh_next_check_urls(conn, [url])
+                self._mark_changed(conn, urls=[url])
         return result.rowcount > 0
 
     def update_scraped_entry(
@@ -511,13 +1135,13 @@ class ChapterDatabase:
         retrieved_at: Optional[str] = None,
         last_found_url: Optional[str] = None,
     ):
-        link_id = self._get_link_id(url)
+        link_id = self._get_link_id(url, "update_scraped_entry")
         if not link_id:
             return
         retrieved_at = retrieved_at or datetime.datetime.now().isoformat()
-        with self._connect() as conn:
+        with self._write("update_scraped_entry") as conn:
             existing = conn.execute(
-                "SELECT last_found, timestamp, last_found_url FROM scraped_entries WHERE link_id = ? ORDER BY id DESC LIMIT 1",
+                "SELECT last_found, timestamp, last_found_url FROM latest_entries WHERE link_id = ?",
                 (link_id,),
             ).fetchone()
             if (
@@ -527,71 +1151,87 @@ class ChapterDatabase:
                 and existing["last_found_url"] == last_found_url
             ):
                 return
-            conn.execute(
+            cursor = conn.execute(
                 """
                 INSERT INTO scraped_entries (link_id, last_found, last_found_url, timestamp, retrieved_at)
                 VALUES (?, ?, ?, ?, ?)
                 """,
                 (link_id, last_found, last_found_url, timestamp, retrieved_at),
             )
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO latest_entries (link_id, entry_id, last_found, last_found_url, timestamp)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (link_id, cursor.lastrowid, last_found, last_found_url, timestamp),
+            )
+            self._refresh_next_check_urls(conn, [url])
+            self._mark_changed(conn, urls=[url])
 
     def record_failures(self, failures: Dict[str, Dict]):
         if not failures:
             return
-        with self._connect() as conn:
-            for url, info in failures.items():
-                now = datetime.datetime.now().isoformat()
-                conn.execute(
-                    """
-                    UPDATE links
-                    SET last_attempt = ?, last_error = ?
-                    WHERE url = ?
-                    """,
-                    (now, info.get("error"), url),
-                )
+        with self._write("record_failures") as conn:
+            self._record_failures(conn, failures)
+
+    def _record_failures(self, conn, failures):
+        if not failures:
+            return
+        now = datetime.datetime.now().isoformat()
+        conn.executemany(
+            """
+            UPDATE links
+            SET last_attempt = ?,
+                last_error = ?,
+                failure_count = failure_count + ?
+            WHERE url = ?
+            """,
+            [
+                # Domain-wide outages don't count against the link itself.
+                (now, info.get("error"), 0 if info.get("domain_unavailable") else 1, url)
+                for url, info in failures.items()
+            ],
+        )
+        self._refresh_next_check_urls(conn, failures)
+        self._mark_changed(conn, urls=list(failures))
 
     def record_success(self, url: str, when: Optional[str] = None):
         when = when or datetime.datetime.now().isoformat()
-        with self._connect() as conn:
+        with self._write("record_success") as conn:
             conn.execute(
                 """
                 UPDATE links
-                SET last_attempt = ?, last_error = NULL
+                SET last_attempt = ?, last_error = NULL, failure_count = 0
                 WHERE url = ?
                 """,
                 (when, url),
             )
+            self._refresh_next_check_urls(conn, [url])
+            self._mark_changed(conn, urls=[url])
 
     def mark_saved(self, url: str):
-        with self._connect() as conn:
+        with self._write("mark_saved") as conn:
             conn.execute(
                 """
                 UPDATE links
-                SET last_saved = (
-                    SELECT IFNULL(last_found, 'N/A')
-                    FROM scraped_entries
+                SET (last_saved, last_saved_url) = (
+                    SELECT IFNULL(last_found, 'N/A'), last_found_url
+                    FROM latest_entries
                     WHERE link_id = links.id
-                    ORDER BY id DESC
-                    LIMIT 1
-                ),
-                last_saved_url = (
-                    SELECT last_found_url
-                    FROM scraped_entries
-                    WHERE link_id = links.id
-                    ORDER BY id DESC
-                    LIMIT 1
                 )
                 WHERE url = ?
                 """,
                 (url,),
             )
+            self._mark_changed(conn, urls=[url])
 
     def set_last_saved(self, url: str, value: str, chapter_url: Optional[str] = None):
-        with self._connect() as conn:
+        with self._write("set_last_saved") as conn:
             conn.execute(
                 "UPDATE links SET last_saved = ?, last_saved_url = ? WHERE url = ?",
                 (value or "N/A", chapter_url, url),
             )
+            self._mark_changed(conn, urls=[url])
 
     def update_link_metadata(
         self,
@@ -614,30 +1254,103 @@ class ChapterDatabase:
         if not updates:
             return
         params.append(url)
-        with self._connect() as conn:
+        with self._write("update_link_metadata") as conn:
             conn.execute(
                 f"UPDATE links SET {', '.join(updates)} WHERE url = ?", tuple(
                     params)
             )
+            self._mark_changed(conn, urls=[url])
 
     def merge_scraped(self, entries: Dict[str, Dict]):
+        if not any(entry.get("last_found") for entry in entries.values()):
+            return
+        with self._write("merge_scraped") as conn:
+            self._merge_scraped(conn, entries)
+
+    def _merge_scraped(self, conn, entries):
+        entries = {
+            url: entry for url, entry in entries.items() if entry.get("last_found")
+        }
+        if not entries:
+            return
+        now = datetime.datetime.now().isoformat()
+        metadata_rows = []
+        insert_rows = []
+        success_rows = []
+        link_ids = self._get_link_ids(conn, entries)
+        latest = {
+            row["link_id"]: row
+            for row in conn.execute(
+                """
+                SELECT link_id, last_found, last_found_url, timestamp
+                FROM latest_entries
+                WHERE link_id IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(list(link_ids.values())),),
+            ).fetchall()
+        }
         for url, entry in entries.items():
-            if not entry.get("last_found"):
+            free_only = entry.get("free_only")
+            metadata_rows.append(
+                (
+                    entry.get("name") or None,
+                    None if free_only is None else self._to_flag(free_only),
+                    url,
+                )
+            )
+            retrieved_at = entry.get("retrieved_at") or now
+            success_rows.append((retrieved_at, url))
+            link_id = link_ids.get(url)
+            if not link_id:
                 continue
-            if entry.get("name"):
-                self.update_link_metadata(url, name=entry["name"])
-            if "free_only" in entry:
-                self.update_link_metadata(url, free_only=entry["free_only"])
-            self.update_scraped_entry(
-                url,
-                entry["last_found"],
-                entry["timestamp"],
-                last_found_url=entry.get("last_found_url"),
-            )
-            self.record_success(url, entry.get("retrieved_at"))
+            existing = latest.get(link_id)
+            if (
+                existing
+                and existing["last_found"] == entry["last_found"]
+                and existing["timestamp"] == entry["timestamp"]
+                and existing["last_found_url"] == entry.get("last_found_url")
+            ):
+                continue
+            insert_rows.append(
+                (
+                    link_id,
+                    entry["last_found"],
+                    entry.get("last_found_url"),
+                    entry["timestamp"],
+                    retrieved_at,
+                )
+            )
+
+        conn.executemany(
+            """
+            UPDATE links
+            SET name = COALESCE(?, name),
+                free_only = COALESCE(?, free_only)
+            WHERE url = ?
+            """,
+            metadata_rows,
+        )
+        conn.executemany(
+            """
+            INSERT INTO scraped_entries (link_id, last_found, last_found_url, timestamp, retrieved_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            insert_rows,
+        )
+        self._refresh_latest_entries(conn, [row[0] for row in insert_rows])
+        conn.executemany(
+            """
+            UPDATE links
+            SET last_attempt = ?, last_error = NULL, failure_count = 0
+            WHERE url = ?
+            """,
+            success_rows,
+        )
+        self._refresh_next_check_urls(conn, entries)
+        self._mark_changed(conn, urls=list(entries))
 
     def get_categories(self) -> List[Dict[str, Any]]:
-        with self._connect() as conn:
+        with self._read("get_categories") as conn:
             rows = conn.execute(
                 """
                 SELECT name,
@@ -665,7 +1378,7 @@ class ChapterDatabase:
         ]
 
     def get_category(self, name: str) -> Optional[Dict[str, Any]]:
-        with self._connect() as conn:
+        with self._read("get_category") as conn:
             row = conn.execute(
                 """
                 SELECT name, update_interval_hours, last_checked, display_name, include_in_nav
@@ -688,40 +1401,22 @@ class ChapterDatabase:
         return [cat["name"] for cat in self.get_categories()]
 
     def set_category_last_checked(self, name: str, timestamp: str):
-        with self._connect() as conn:
+        with self._write("set_category_last_checked") as conn:
             conn.execute(
                 "UPDATE categories SET last_checked = ? WHERE name = ?",
                 (timestamp, name),
             )
+            self._mark_changed(conn, categories=[name])
 
     def get_category_unsaved_counts(self) -> Dict[str, int]:
-        with self._connect() as conn:
+        with self._read("get_category_unsaved_counts") as conn:
             rows = conn.execute(
                 """
-                SELECT
-                    category,
-                    SUM(
-                        CASE
-                            WHEN latest_last_found IS NOT NULL
-                                 AND latest_last_found <> IFNULL(last_saved, '')
-                            THEN 1
-                            ELSE 0
-                        END
-                    ) AS unsaved
-                FROM (
-                    SELECT
-                        l.category AS category,
-                        l.last_saved AS last_saved,
-                        (
-                            SELECT last_found
-                            FROM scraped_entries se
-                            WHERE se.link_id = l.id
-                            ORDER BY se.id DESC
-                            LIMIT 1
-                        ) AS latest_last_found
-                    FROM links l
-                ) data
-                GROUP BY category
+                SELECT l.category AS category, COUNT(le.link_id) AS unsaved
+                FROM links l
+                LEFT JOIN latest_entries le
+                    ON le.link_id = l.id AND le.last_found <> IFNULL(l.last_saved, '')
+                GROUP BY l.category
                 """
             ).fetchall()
         return {row["category"]: row["unsaved"] or 0 for row in rows}
@@ -739,7 +1434,7 @@ class ChapterDatabase:
         display = (display_name or "").strip(
         ) or self._default_display_name(normalized)
         interval = self._sanitize_interval(update_interval_hours or 1)
-        with self._connect() as conn:
+        with self._write("create_category") as conn:
             conn.execute(
                 """
                 INSERT INTO categories (name, update_interval_hours, display_name, include_in_nav, sort_order)
@@ -753,6 +1448,7 @@ class ChapterDatabase:
                     self._get_next_sort_value(conn),
                 ),
             )
+            self._mark_changed(conn)
         return self.get_category(normalized) or {}
 
     def update_category_entry(
@@ -788,16 +1484,20 @@ class ChapterDatabase:
         if not updates:
             return current
 
-        with self._connect() as conn:
+        with self._write("update_category_entry") as conn:
             conn.execute(
                 f"UPDATE categories SET {', '.join(updates)} WHERE name = ?",
                 (*params, name),
             )
+            self._mark_changed(conn)
             if normalized_new_name and normalized_new_name != name:
                 conn.execute(
                     "UPDATE links SET category = ? WHERE category = ?",
                     (normalized_new_name, name),
                 )
+            if update_interval_hours is not None:
+                self._refresh_next_check(
+                    conn, "l.category = ?", (normalized_new_name or name,))
         target_name = normalized_new_name or name
         return self.get_category(target_name)
 
@@ -805,12 +1505,13 @@ class ChapterDatabase:
         normalized = self._normalize_category(name)
         if normalized == "main":
             raise ValueError("Main category cannot be removed")
-        with self._connect() as conn:
+        with self._write("delete_category") as conn:
             conn.execute("DELETE FROM links WHERE category = ?", (normalized,))
             result = conn.execute(
                 "DELETE FROM categories WHERE name = ?",
                 (normalized,),
             )
+            self._mark_changed(conn)
         return result.rowcount > 0
 
     def reorder_categories(self, ordered_names: List[str]) -> List[Dict[str, Any]]:
@@ -833,21 +1534,519 @@ class ChapterDatabase:
             if name not in order_map:
                 order_map[name] = index
                 index += 1
-        with self._connect() as conn:
+        with self._write("reorder_categories") as conn:
             for name, position in order_map.items():
                 conn.execute(
                     "UPDATE categories SET sort_order = ? WHERE name = ?",
                     (position, name),
                 )
+            self._mark_changed(conn)
         return self.get_categories()
 
+    def get_feed_cache(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._read("get_feed_cache") as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified, result FROM feed_cache WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if not row:
+            return None
+        try:
+            result = json.loads(row["result"])
+        except ValueError:
+            return None
+        return {
+            "etag": row["etag"],
+            "last_modified": row["last_modified"],
+            "result": result,
+        }
+
+    def store_feed_cache(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        result: Any,
+    ):
+        with self._write("store_feed_cache") as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO feed_cache (url, etag, last_modified, result, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    url,
+                    etag,
+                    last_modified,
+                    json.dumps(result),
+                    datetime.datetime.now().isoformat(),
+                ),
+            )
+
+    def record_scrape_attempts(self, attempts: List[Dict[str, Any]]):
+        """Store scrape attempts as recorded by ``scraping.process_link``."""
+        if not attempts:
+            return
+        with self._write("record_scrape_attempts") as conn:
+            conn.executemany(
+                """
+                INSERT INTO scrape_attempts (
+                    url, plugin, domain, started_at, duration_ms,
+                    requests, bytes, outcome, error_class
+                )
+                VALUES (
+                    :url, :plugin, :domain, :started_at, :duration_ms,
+                    :requests, :bytes, :outcome, :error_class
+                )
+                """,
+                attempts,
+            )
+
+    def rollup_scrape_attempts(
+        self,
+        raw_hours: float = DEFAULT_TELEMETRY_RAW_HOURS,
+        retention_days: float = DEFAULT_TELEMETRY_RETENTION_DAYS,
+        now: Optional[float] = None,
+    ) -> int:
+        """Fold attempts older than ``raw_hours`` into hourly rollups.
+
+        Rollups older than ``retention_days`` are deleted. Returns the number
+        of attempts rolled up.
+        """
+        now = time.time() if now is None else now
+        # Only whole hours are folded, so an hour is never split across runs.
+        cutoff = (now - raw_hours * 3600) // 3600 * 3600
+        with self._write("rollup_scrape_attempts") as conn:
+            rows = conn.execute(
+                """
+                SELECT plugin, domain, started_at, duration_ms, requests, bytes, outcome
+                FROM scrape_attempts WHERE started_at < ?
+                """,
+                (cutoff,),
+            ).fetchall()
+            groups = {}
+            for row in rows:
+                key = (row["started_at"] // 3600 * 3600, row["plugin"], row["domain"])
+                group = groups.get(key)
+                if group is None:
+                    existing = conn.execute(
+                        """
+                        SELECT attempts, failures, requests, bytes, histogram FROM scrape_rollups
+                        WHERE hour = ? AND plugin = ? AND domain = ?
+                        """,
+                        key,
+                    ).fetchone()
+                    group = groups[key] = _rollup_group(existing)
+                _add_attempt(group, row)
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO scrape_rollups (
+                    hour, plugin, domain, attempts, failures, requests, bytes, histogram
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (*key, group["attempts"], group["failures"], group["requests"],
+                     group["bytes"], json.dumps(group["histogram"]))
+                    for key, group in groups.items()
+                ],
+            )
+            conn.execute("DELETE FROM scrape_attempts WHERE started_at < ?", (cutoff,))
+            conn.execute(
+                "DELETE FROM scrape_rollups WHERE hour < ?",
+                (now - retention_days * 86400,),
+            )
+        return len(rows)
+
+    def get_scrape_metrics(self, since: float) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Latency percentiles and failure rates per plugin and per domain.
+
+        Covers raw attempts from ``since`` on plus the rollups of the hours
+        they overlap.
+        """
+        by_plugin = {}
+        by_domain = {}
+        with self._read("get_scrape_metrics") as conn:
+            rollups = conn.execute(
+                """
+                SELECT plugin, domain, attempts, failures, requests, bytes, histogram
+                FROM scrape_rollups WHERE hour >= ?
+                """,
+                (since // 3600 * 3600,),
+            ).fetchall()
+            attempts = conn.execute(
+                """
+                SELECT plugin, domain, duration_ms, requests, bytes, outcome
+                FROM scrape_attempts WHERE started_at >= ?
+                """,
+                (since,),
+            ).fetchall()
+        for row in rollups:
+            rolled = _rollup_group(row)
+            for groups, key in ((by_plugin, row["plugin"]), (by_domain, row["domain"])):
+                group = groups.setdefault(key, _rollup_group(None))
+                for field in ("attempts", "failures", "requests", "bytes"):
+                    group[field] += rolled[field]
+                telemetry.merge_histograms(group["histogram"], rolled["histogram"])
+        for row in attempts:
+            for groups, key in ((by_plugin, row["plugin"]), (by_domain, row["domain"])):
+                _add_attempt(groups.setdefault(key, _rollup_group(None)), row)
+        return {
+            "plugins": {key: telemetry.summarize(group) for key, group in sorted(by_plugin.items())},
+            "domains": {key: telemetry.summarize(group) for key, group in sorted(by_domain.items())},
+        }
+
+    @staticmethod
+    def _job_dict(row) -> Dict[str, Any]:
+        job = dict(row)
+        job["urls"] = json.loads(job["urls"]) if job["urls"] is not None else None
+        return job
+
+    def enqueue_scrape_job(
+        self, category: str, urls: Optional[List[str]] = None, now: Optional[float] = None
+    ) -> int:
+        """Queue a scrape of ``urls`` in ``category`` (all links when ``None``).
+
+        An active job for the category absorbs the request by adding the
+        links it lacks, except that a running job does not absorb a request
+        for every link. Returns the id of the job that will do the work.
+        """
+        now = time.time() if now is None else now
+        with self._write("enqueue_scrape_job") as conn:
+            existing = conn.execute(
+                """
+                SELECT id, status, urls FROM scrape_jobs
+                WHERE status IN ('queued', 'running') AND category = ?
+                ORDER BY status = 'queued' DESC, id DESC
+                LIMIT 1
+                """,
+                (category,),
+            ).fetchone()
+            if existing and (existing["status"] == "queued" or urls is not None):
+                job_id = existing["id"]
+                merged = None
+                if urls is not None and existing["urls"] is not None:
+                    merged = json.dumps(sorted(set(json.loads(existing["urls"])) | set(urls)))
+                conn.execute("UPDATE scrape_jobs SET urls = ? WHERE id = ?", (merged, job_id))
+            else:
+                job_id = conn.execute(
+                    "INSERT INTO scrape_jobs (category, urls, enqueued_at) VALUES (?, ?, ?)",
+                    (category, None if urls is None else json.dumps(list(urls)), now),
+                ).lastrowid
+            url_clause, url_params = self._url_filter("url", urls)
+            conn.execute(
+                f"""
+                INSERT OR IGNORE INTO scrape_job_links (job_id, url)
+                SELECT ?, url FROM links WHERE category = ?{url_clause}
+                """,
+                (job_id, category, *url_params),
+            )
+            self._update_scrape_jobs(conn, [job_id], now, recount=True)
+        return job_id
+
+    def claim_scrape_links(
+        self,
+        worker: str,
+        limit: int = 20,
+        lease_seconds: float = SCRAPE_LEASE_SECONDS,
+        now: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Lease up to ``limit`` queued links of the oldest job to ``worker``.
+
+        Expired leases are reclaimed first; links whose lease expired
+        ``SCRAPE_LINK_MAX_LEASES`` times are given up on and recorded as
+        failures. A link leased under another job is never handed out.
+        Returns ``{"job_id", "category", "urls"}`` or ``None``.
+        """
+        now = time.time() if now is None else now
+        with self._write("claim_scrape_links") as conn:
+            self._expire_scrape_leases(conn, now)
+            # A single statement, so concurrent workers never lease the same link.
+            rows = conn.execute(
+                """
+                UPDATE scrape_job_links
+                SET status = 'leased', worker = ?, lease_expires_at = ?, leases = leases + 1
+                WHERE rowid IN (
+                    SELECT rowid FROM scrape_job_links
+                    WHERE status = 'queued'
+                      AND url NOT IN (SELECT url FROM scrape_job_links WHERE status = 'leased')
+                      AND job_id = (
+                          SELECT job_id FROM scrape_job_links
+                          WHERE status = 'queued'
+                            AND url NOT IN (SELECT url FROM scrape_job_links WHERE status = 'leased')
+                          ORDER BY job_id
+                          LIMIT 1
+                      )
+                    LIMIT ?
+                )
+                RETURNING job_id, url
+                """,
+                (worker, now + lease_seconds, max(1, int(limit))),
+            ).fetchall()
+            if not rows:
+                return None
+            job_id = rows[0]["job_id"]
+            self._update_scrape_jobs(conn, [job_id], now)
+            category = conn.execute(
+                "SELECT category FROM scrape_jobs WHERE id = ?", (job_id,)).fetchone()["category"]
+        return {"job_id": job_id, "category": category, "urls": [row["url"] for row in rows]}
+
+    def _expire_scrape_leases(self, conn, now):
+        rows = conn.execute(
+            """
+            UPDATE scrape_job_links
+            SET status = CASE WHEN leases >= ? THEN 'failed' ELSE 'queued' END,
+                worker = NULL,
+                lease_expires_at = NULL
+            WHERE status = 'leased' AND lease_expires_at < ?
+            RETURNING job_id, url, status
+            """,
+            (SCRAPE_LINK_MAX_LEASES, now),
+        ).fetchall()
+        if not rows:
+            return
+        logger.warning("Reclaimed %d expired scrape leases", len(rows))
+        abandoned = [row["url"] for row in rows if row["status"] == "failed"]
+        if abandoned:
+            conn.execute(
+                """
+                UPDATE links
+                SET last_attempt = ?, last_error = ?, failure_count = failure_count + 1
+                WHERE url IN (SELECT value FROM json_each(?))
+                """,
+                (
+                    datetime.datetime.now().isoformat(),
+                    f"Scrape abandoned after {SCRAPE_LINK_MAX_LEASES} expired leases",
+                    json.dumps(abandoned),
+                ),
+            )
+            self._refresh_next_check_urls(conn, abandoned)
+            self._mark_changed(conn, urls=abandoned)
+        self._update_scrape_jobs(conn, {row["job_id"] for row in rows}, now)
+
+    def _update_scrape_jobs(self, conn, job_ids, now, recount=False):
+        """Update progress of ``job_ids``, finishing jobs with no links left.
+
+        Only unfinished links are counted (through the status index), so the
+        job's total is recounted only when links were added (``recount``).
+        """
+        finished = False
+        for job_id in job_ids:
+            if recount:
+                conn.execute(
+                    """
+                    UPDATE scrape_jobs
+                    SET total = (SELECT COUNT(*) FROM scrape_job_links WHERE job_id = ?)
+                    WHERE id = ?
+                    """,
+                    (job_id, job_id),
+                )
+            pending = dict(conn.execute(
+                """
+                SELECT status, COUNT(*) FROM scrape_job_links
+                WHERE status IN ('queued', 'leased') AND job_id = ?
+                GROUP BY status
+                """,
+                (job_id,),
+            ).fetchall())
+            total = conn.execute(
+                "SELECT COALESCE(total, 0) AS total FROM scrape_jobs WHERE id = ?", (job_id,)
+            ).fetchone()["total"]
+            counts = {
+                "total": total,
+                "done": total - pending.get("queued", 0) - pending.get("leased", 0),
+                "leased": pending.get("leased", 0),
+            }
+            if counts["done"] == counts["total"]:
+                status = "done"
+            elif counts["done"] or counts["leased"]:
+                status = "running"
+            else:
+                status = "queued"
+            job = conn.execute(
+                """
+                UPDATE scrape_jobs
+                SET status = ?, progress = ?, total = ?,
+                    started_at = CASE WHEN ? = 'queued' THEN started_at ELSE COALESCE(started_at, ?) END,
+                    finished_at = CASE WHEN ? = 'done' THEN ? END
+                WHERE id = ? AND status <> 'done'
+                RETURNING category
+                """,
+                (status, counts["done"], counts["total"], status, now, status, now, job_id),
+            ).fetchall()
+            if status == "done" and job:
+                finished = True
+                category = job[0]["category"]
+                conn.execute(
+                    "UPDATE categories SET last_checked = ? WHERE name = ?",
+                    (datetime.datetime.fromtimestamp(now).isoformat(), category),
+                )
+                self._mark_changed(conn, categories=[category])
+        if finished:
+            conn.execute(
+                "DELETE FROM scrape_jobs WHERE status = 'done' AND finished_at < ?",
+                (now - SCRAPE_JOB_RETENTION,),
+            )
+        return finished
+
+    def complete_scrape_links(
+        self,
+        worker: str,
+        job_id: int,
+        urls: List[str],
+        new_data: Optional[Dict[str, Dict]] = None,
+        failures: Optional[Dict[str, Dict]] = None,
+        now: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Store ``worker``'s results for ``urls`` of ``job_id`` and mark them done.
+
+        Only links ``worker`` still holds the lease on are written; results
+        for any other url are dropped and reported under ``lease_lost``.
+        Returns ``{"finished": bool, "lease_lost": [...]}``.
+        """
+        now = time.time() if now is None else now
+        new_data = new_data or {}
+        failures = failures or {}
+        with self._write("complete_scrape_links") as conn:
+            held = {
+                row["url"]
+                for row in conn.execute(
+                    """
+                    SELECT url FROM scrape_job_links
+                    WHERE job_id = ? AND worker = ? AND status = 'leased'
+                      AND url IN (SELECT value FROM json_each(?))
+                    """,
+                    (job_id, worker, json.dumps(list(urls))),
+                ).fetchall()
+            }
+            self._merge_scraped(conn, {url: entry for url, entry in new_data.items() if url in held})
+            self._record_failures(conn, {url: info for url, info in failures.items() if url in held})
+            conn.execute(
+                """
+                UPDATE scrape_job_links
+                SET status = 'done', worker = NULL, lease_expires_at = NULL
+                WHERE job_id = ? AND url IN (SELECT value FROM json_each(?))
+                """,
+                (job_id, json.dumps(sorted(held))),
+            )
+            conn.execute(
+                "UPDATE scrape_workers SET links_done = links_done + ?, heartbeat_at = ? WHERE id = ?",
+                (len(held), now, worker),
+            )
+            finished = self._update_scrape_jobs(conn, [job_id], now)
+        lost = sorted((set(urls) | set(new_data) | set(failures)) - held)
+        if lost:
+            logger.warning("Dropped results of %d links whose lease %s lost", len(lost), worker)
+        return {"finished": finished, "lease_lost": lost}
+
+    def heartbeat_scrape_worker(
+        self, worker: str, lease_seconds: float = SCRAPE_LEASE_SECONDS, now: Optional[float] = None
+    ) -> int:
+        """Extend ``worker``'s leases; returns how many links it still holds."""
+        now = time.time() if now is None else now
+        with self._write("heartbeat_scrape_worker") as conn:
+            conn.execute("UPDATE scrape_workers SET heartbeat_at = ? WHERE id = ?", (now, worker))
+            return conn.execute(
+                """
+                UPDATE scrape_job_links SET lease_expires_at = ?
+                WHERE worker = ? AND status = 'leased'
+                """,
+                (now + lease_seconds, worker),
+            ).rowcount
+
+    def register_scrape_worker(
+        self, worker: str, host: Optional[str] = None, pid: Optional[int] = None,
+        now: Optional[float] = None,
+    ):
+        now = time.time() if now is None else now
+        with self._write("register_scrape_worker") as conn:
+            conn.execute(
+                """
+                INSERT INTO scrape_workers (id, host, pid, started_at, heartbeat_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    host = excluded.host,
+                    pid = excluded.pid,
+                    started_at = excluded.started_at,
+                    heartbeat_at = excluded.heartbeat_at
+                """,
+                (worker, host, pid, now, now),
+            )
+            conn.execute(
+                "DELETE FROM scrape_workers WHERE heartbeat_at < ?",
+                (now - SCRAPE_WORKER_RETENTION,),
+            )
+
+    def unregister_scrape_worker(self, worker: str, now: Optional[float] = None):
+        """Forget ``worker`` and hand its leased links back to the queue."""
+        now = time.time() if now is None else now
+        with self._write("unregister_scrape_worker") as conn:
+            rows = conn.execute(
+                """
+                UPDATE scrape_job_links
+                SET status = 'queued', worker = NULL, lease_expires_at = NULL,
+                    leases = MAX(0, leases - 1)
+                WHERE worker = ? AND status = 'leased'
+                RETURNING job_id
+                """,
+                (worker,),
+            ).fetchall()
+            conn.execute("DELETE FROM scrape_workers WHERE id = ?", (worker,))
+            self._update_scrape_jobs(conn, {row["job_id"] for row in rows}, now)
+
+    def get_scrape_workers(self) -> List[Dict[str, Any]]:
+        """Registered workers with the number of links each holds a lease on."""
+        with self._read("get_scrape_workers") as conn:
+            rows = conn.execute(
+                """
+                SELECT w.id, w.host, w.pid, w.started_at, w.heartbeat_at, w.links_done,
+                       (
+                           SELECT COUNT(*) FROM scrape_job_links jl
+                           WHERE jl.worker = w.id AND jl.status = 'leased'
+                       ) AS leased
+                FROM scrape_workers w
+                ORDER BY w.id
+                """
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_active_scrape_jobs(self) -> List[Dict[str, Any]]:
+        """Queued and running jobs, oldest first."""
+        with self._read("get_active_scrape_jobs") as conn:
+            rows = conn.execute(
+                """
+                SELECT * FROM scrape_jobs
+                WHERE status IN ('queued', 'running')
+                ORDER BY id
+                """
+            ).fetchall()
+        return [self._job_dict(row) for row in rows]
+
+    def get_updating_categories(self) -> set:
+        """Categories a scrape worker is currently working on."""
+        with self._read("get_updating_categories") as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT category FROM scrape_jobs WHERE status = 'running'"
+            ).fetchall()
+        return {row["category"] for row in rows}
+
+    def get_scrape_queue_stats(self) -> Dict[str, Any]:
+        """Categories with queued or running jobs and links waiting for a worker."""
+        with self._read("get_scrape_queue_stats") as conn:
+            categories = conn.execute(
+                "SELECT DISTINCT category FROM scrape_jobs WHERE status IN ('queued', 'running')"
+            ).fetchall()
+            queued = conn.execute(
+                "SELECT COUNT(*) FROM scrape_job_links WHERE status = 'queued'").fetchone()[0]
+        return {"categories": {row["category"] for row in categories}, "queued_links": queued}
+
     def get_settings(self) -> Dict[str, str]:
-        with self._connect() as conn:
+        with self._read("get_settings") as conn:
             rows = conn.execute("SELECT key, value FROM settings").fetchall()
         return {row["key"]: row["value"] for row in rows}
 
     def update_setting(self, key: str, value: str):
-        with self._connect() as conn:
+        with self._write("update_setting") as conn:
             conn.execute(
                 "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
                 (key, str(value))
@@ -0,0 +1,91 @@
+import heapq
+import threading
+from datetime import datetime
+
+from db_store import link_due_at
+
+
+def _row_due(row, now=None):
+    # Prefer the due time the database already computed.
+    if row.get("next_check_at") is not None:
+        return datetime.fromtimestamp(row["next_check_at"])
+    return link_due_at(row, now)
+
+
+class LinkScheduler:
+    """Per-category min-heaps of link due times."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._heaps = {}
+        # url -> (category, due); heap items not matching this are stale.
+        self._entries = {}
+
+    def is_loaded(self, category):
+        with self._lock:
+            return category in self._heaps
+
+    def load(self, category, rows, now=None):
+        """Replace the category's heap with due times computed from ``rows``."""
+        heap = []
+        with self._lock:
+            self._drop_entries(category)
+            for row in rows:
+                due = _row_due(row, now)
+                self._entries[row["url"]] = (category, due)
+                heap.append((due, row["url"]))
+            heapq.heapify(heap)
+            self._heaps[category] = heap
+
+    def update(self, rows, now=None):
+        """Recompute due times for individual links after they changed."""
+        with self._lock:
+            for row in rows:
+                category = row["category"]
+                self._discard(row["url"])
+                heap = self._heaps.get(category)
+                if heap is None:
+                    # Picked up when the category is first loaded.
+                    continue
+                due = _row_due(row, now)
+                self._entries[row["url"]] = (category, due)
+                heapq.heappush(heap, (due, row["url"]))
+                if len(heap) > 2 * len(self._entries) + 64:
+                    self._compact(category)
+
+    def discard(self, urls):
+        """Forget ``urls``; returns the categories they were scheduled in."""
+        with self._lock:
+            return {category for category in map(self._discard, urls) if category}
+
+    def drop_category(self, category):
+        with self._lock:
+            self._drop_entries(category)
+            self._heaps.pop(category, None)
+
+    def next_due(self, category):
+        with self._lock:
+            heap = self._heaps.get(category) or []
+            self._skip_stale(category, heap)
+            return heap[0][0] if heap else None
+
+    def _discard(self, url):
+        entry = self._entries.pop(url, None)
+        return entry[0] if entry else None
+
+    def _drop_entries(self, category):
+        for url in [u for u, (cat, _) in self._entries.items() if cat == category]:
+            del self._entries[url]
+
+    def _skip_stale(self, category, heap):
+        while heap and self._entries.get(heap[0][1]) != (category, heap[0][0]):
+            heapq.heappop(heap)
+
+    def _compact(self, category):
+        heap = [
+            (due, url)
+            for url, (cat, due) in self._entries.items()
+            if cat == category
+        ]
+        heapq.heapify(heap)
+        self._heaps[category] = heap
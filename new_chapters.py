@@ -2,9 +2,11 @@ import atexit
 import logging
 import math
 import os
+import random
 import sqlite3
 import sys
 import threading
+import time
 import webbrowser
 from datetime import datetime, timedelta
 from functools import wraps
@@ -13,16 +15,24 @@ from pathlib import Path
 # Ensure we are in the correct directory, especially when running from startup
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
+from apscheduler.events import EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
 from apscheduler.schedulers.background import BackgroundScheduler
-from flask import Flask, jsonify, make_response, redirect, render_template, request, send_from_directory, session, url_for
+from flask import Flask, Response, g, jsonify, make_response, redirect, render_template, request, send_from_directory, session, url_for
 from flask_socketio import SocketIO, join_room, leave_room
 
+import metrics
 import scraping
+import scraper_utils
+import db_store
 from db_store import DEFAULT_FREE_ONLY, DEFAULT_UPDATE_FREQUENCY, ChapterDatabase
-from scraping import category_room_name, process_link, scrape_all_links, is_update_in_progress
+from link_scheduler import LinkScheduler
+from scrape_worker import LocalQueue, scrape_category
+from scraping import category_room_name, get_int_setting, process_link, is_update_in_progress
+from view_cache import GLOBAL_SCOPE, ViewCache
 
 # --------------------- Data Directory ---------------------
-DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DATA_DIR = os.environ.get(
+    "CHAPTER_TRACKER_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
 os.makedirs(DATA_DIR, exist_ok=True)
 
 LOG_FILE = os.path.join(DATA_DIR, "app.log")
@@ -56,9 +66,102 @@ _scheduler = None
 _scheduler_lock = threading.Lock()
 _scheduler_started = False
 client_rooms = {}
+# Spreading policy for category jobs (seconds / job count)
+DEFAULT_STARTUP_STAGGER_SECONDS = 300
+DEFAULT_SCHEDULE_JITTER_SECONDS = 60
+DEFAULT_MAX_CONCURRENT_CATEGORIES = 2
+# "worker" hands category updates to scrape_worker.py processes
+SCRAPE_MODES = ("inline", "worker")
+_schedule_policy = {
+    "stagger": DEFAULT_STARTUP_STAGGER_SECONDS,
+    "jitter": DEFAULT_SCHEDULE_JITTER_SECONDS,
+    "max_concurrent": DEFAULT_MAX_CONCURRENT_CATEGORIES,
+}
+# Category updates running inline; the limit is _schedule_policy["max_concurrent"]
+_running_categories = 0
+_category_slots_changed = threading.Condition()
+# Jobs queued for the scrape worker that this process relays progress for
+SCRAPE_JOB_RELAY_SECONDS = 2
+STALE_SCRAPE_JOB_SECONDS = 300
+_relayed_jobs = {}
+_relayed_jobs_lock = threading.Lock()
+_stale_jobs_warned = set()
 
 # Pass the socketio object to scraping.py
 scraping.socketio = socketio
+scraping.BrowserManager.driver_cache_path = os.path.join(DATA_DIR, "chromedriver.json")
+# Feed validators live next to the chapter data
+scraper_utils.set_feed_cache(db)
+# So does the scrape telemetry
+scraping.telemetry_store = db
+# Updates leased by scrape workers count as in progress too
+scraping.remote_updates = db.get_updating_categories
+# Remote scrape workers reach the queue through /api/worker/<action>
+worker_queue = LocalQueue(db)
+WORKER_MAX_BATCH = 200
+WORKER_LEASE_LIMITS = (30, 3600)  # seconds
+
+# Rendered view models, dropped by the database whenever a category changes
+view_cache = ViewCache()
+db.add_change_listener(view_cache.invalidate)
+
+# Per-link due times; category jobs wake up for the earliest one
+link_schedule = LinkScheduler()
+
+# Prometheus metrics served at /metrics
+metrics_registry = metrics.Registry()
+http_requests_total = metrics_registry.counter(
+    "chapter_tracker_http_requests_total",
+    "HTTP requests by endpoint, method and status.",
+    ("endpoint", "method", "status"),
+)
+http_request_seconds = metrics_registry.histogram(
+    "chapter_tracker_http_request_duration_seconds",
+    "Time spent handling HTTP requests.",
+    ("endpoint",),
+)
+scheduler_job_lag_seconds = metrics_registry.histogram(
+    "chapter_tracker_scheduler_job_lag_seconds",
+    "Delay between a job's scheduled and actual start.",
+    ("job",),
+    buckets=(0.1, 0.5, 1, 5, 15, 60, 300, 900, 3600),
+)
+scheduler_jobs_missed_total = metrics_registry.counter(
+    "chapter_tracker_scheduler_jobs_missed_total",
+    "Job runs skipped because they missed their grace time.",
+    ("job",),
+)
+db_query_seconds = metrics_registry.histogram(
+    "chapter_tracker_db_query_duration_seconds",
+    "SQLite time per ChapterDatabase method.",
+    ("operation", "kind"),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1),
+)
+# Updates run in this process or, in worker mode, through the scrape_jobs queue.
+metrics_registry.gauge(
+    "chapter_tracker_updates_in_progress",
+    "Categories currently being scraped.",
+    callback=lambda: len(
+        scraping.updating_category_names() | db.get_scrape_queue_stats()["categories"]),
+)
+metrics_registry.gauge(
+    "chapter_tracker_scrape_queue_depth",
+    "Links waiting for a scrape worker.",
+    callback=lambda: scraping.queued_links() + db.get_scrape_queue_stats()["queued_links"],
+)
+metrics_registry.gauge(
+    "chapter_tracker_browser_drivers",
+    "Running Selenium drivers.",
+    callback=lambda: len(scraping.BrowserManager.uptimes()),
+)
+metrics_registry.gauge(
+    "chapter_tracker_browser_driver_uptime_seconds",
+    "Age of the oldest running Selenium driver.",
+    callback=lambda: max(scraping.BrowserManager.uptimes(), default=0),
+)
+db.set_query_observer(
+    lambda operation, kind, seconds: db_query_seconds.observe(
+        seconds, operation=operation, kind=kind))
 
 
 def require_auth(f):
@@ -130,7 +233,7 @@ def annotate_timestamp_display(entries):
 
 
 def resolve_category(category=None):
-    names = set(db.get_category_names())
+    names = set(view_cache.get(GLOBAL_SCOPE, "names", db.get_category_names))
     if category in names:
         return category
     path = request.path or ""
@@ -141,11 +244,14 @@ def resolve_category(category=None):
 
 
 def build_nav_context():
-    categories = db.get_categories()
-    counts = db.get_category_unsaved_counts()
-    for category in categories:
-        category["unsaved_count"] = counts.get(category["name"], 0)
-    return categories
+    def build():
+        categories = db.get_categories()
+        counts = db.get_category_unsaved_counts()
+        for category in categories:
+            category["unsaved_count"] = counts.get(category["name"], 0)
+        return categories
+
+    return view_cache.get(GLOBAL_SCOPE, "nav", build)
 
 
 def get_current_nav_info(nav_categories, current_category, fallback_count):
@@ -210,6 +316,35 @@ def parse_update_frequency(value, default):
     return max(1, int(freq) if freq.is_integer() else int(freq) + 1)
 
 
+def configure_scraper_runtime(settings):
+    _schedule_policy["stagger"] = get_int_setting(
+        settings, "startup_stagger_seconds", DEFAULT_STARTUP_STAGGER_SECONDS, minimum=0)
+    _schedule_policy["jitter"] = get_int_setting(
+        settings, "schedule_jitter_seconds", DEFAULT_SCHEDULE_JITTER_SECONDS, minimum=0)
+    max_concurrent = get_int_setting(
+        settings, "max_concurrent_categories", DEFAULT_MAX_CONCURRENT_CATEGORIES)
+    with _category_slots_changed:
+        # Running jobs keep their slot; waiting ones re-check the new limit.
+        _schedule_policy["max_concurrent"] = max_concurrent
+        _category_slots_changed.notify_all()
+    scraping.configure_runtime(settings)
+
+
+def _acquire_category_slot():
+    global _running_categories
+    with _category_slots_changed:
+        _category_slots_changed.wait_for(
+            lambda: _running_categories < _schedule_policy["max_concurrent"])
+        _running_categories += 1
+
+
+def _release_category_slot():
+    global _running_categories
+    with _category_slots_changed:
+        _running_categories -= 1
+        _category_slots_changed.notify_all()
+
+
 def get_link_metadata(payload, existing=None):
     existing_freq = existing.get(
         "update_frequency") if existing else DEFAULT_UPDATE_FREQUENCY
@@ -221,31 +356,204 @@ def get_link_metadata(payload, existing=None):
     free_only = parse_free_only(payload.get("free_only"), existing_free_flag)
     return freq, free_only
 
+configure_scraper_runtime(db.get_settings())
+
 # --------------------- Background Jobs ---------------------
 
 
+def ensure_link_schedule(category):
+    if not link_schedule.is_loaded(category):
+        link_schedule.load(category, db.get_link_schedule(category))
+
+
+def refresh_link_schedule(urls):
+    """Recompute due times after links were added, edited or removed."""
+    rows = db.get_link_schedule(urls=urls)
+    categories = link_schedule.discard(urls) | {row["category"] for row in rows}
+    link_schedule.update(rows)
+    for name in categories:
+        schedule_category(name)
+
+
 def run_update_job(category="main", force_update=False):
     with app.app_context():
+        due_urls = None
+        if not force_update:
+            ensure_link_schedule(category)
+            now = datetime.now()
+            next_due = link_schedule.next_due(category)
+            links = []
+            if next_due is not None and next_due <= now:
+                links = db.get_due_links(category, now.timestamp())
+                if not links:
+                    # The heap drifted from next_check_at; resync it.
+                    link_schedule.load(category, db.get_link_schedule(category))
+            if not links:
+                schedule_category(category)
+                return
+            due_urls = [link["url"] for link in links]
+        if db.get_settings().get("scrape_mode") == "worker":
+            track_scrape_job(db.enqueue_scrape_job(category, due_urls), category, due_urls)
+            logger.info("Queued update of %s for the scrape worker", category)
+            return
+        _acquire_category_slot()
         logger.info(
             f"Starting scheduled update for {category} (force={force_update})...")
         try:
-            links = db.get_links(category)
-            current_data = db.get_scraped_data(category)
-            new_data, failures = scrape_all_links(
-                links, current_data, force_update=force_update, category=category
-            )
-            db.merge_scraped(new_data)
-            db.record_failures(failures)
+            scrape_category(db, category, due_urls)
             logger.info(f"Scheduled update for {category} completed.")
         finally:
-            db.set_category_last_checked(category, datetime.now().isoformat())
+            _release_category_slot()
+            finish_category_update(category, due_urls)
+
+
+def finish_category_update(category, urls=None):
+    """Re-arm the category and tell its viewers that ``urls`` were scraped."""
+    if urls is None:
+        link_schedule.load(category, db.get_link_schedule(category))
+    else:
+        link_schedule.update(db.get_link_schedule(urls=urls))
+    schedule_category(category)
+    if socketio:
+        socketio.emit(
+            "update_complete",
+            {"category": category},
+            namespace="/",
+            to=category_room_name(category),
+        )
+
+
+def track_scrape_job(job_id, category, urls=None):
+    """Watch a job queued for the scrape worker until it finishes."""
+    with _relayed_jobs_lock:
+        _relayed_jobs.setdefault(
+            job_id, {"id": job_id, "category": category, "urls": urls, "status": "queued"})
+
+
+def relay_scrape_jobs():
+    """Forward scrape worker progress to clients and finish completed jobs."""
+    with _relayed_jobs_lock:
+        # The lock spans the read so a job tracked meanwhile is never dropped.
+        jobs = {job["id"]: job for job in db.get_active_scrape_jobs()}
+        previous = dict(_relayed_jobs)
+        _relayed_jobs.clear()
+        _relayed_jobs.update(jobs)
+    for job_id, job in previous.items():
+        if job_id not in jobs:
+            # Results were written by another process, so drop cached views.
+            view_cache.invalidate({job["category"]})
+            finish_category_update(job["category"], job["urls"])
+    now = time.time()
+    for job in jobs.values():
+        seen = previous.get(job["id"], {})
+        if job["status"] == "running" and job["total"] and seen.get("progress") != job["progress"]:
+            # Batches are merged as they finish, so show them straight away.
+            view_cache.invalidate({job["category"]})
             if socketio:
                 socketio.emit(
-                    "update_complete",
-                    {"category": category},
+                    "update_progress",
+                    {
+                        "current": job["progress"],
+                        "total": job["total"],
+                        "category": job["category"],
+                        "refresh": True,
+                    },
                     namespace="/",
-                    to=category_room_name(category),
+                    room=category_room_name(job["category"]),
                 )
+        elif (
+            job["status"] == "queued"
+            and now - job["enqueued_at"] > STALE_SCRAPE_JOB_SECONDS
+            and job["id"] not in _stale_jobs_warned
+        ):
+            _stale_jobs_warned.add(job["id"])
+            logger.warning(
+                "Scrape job %d for %s has been queued for over %ds; is scrape_worker.py running?",
+                job["id"], job["category"], STALE_SCRAPE_JOB_SECONDS)
+
+
+def _relay_scrape_jobs_forever():
+    while True:
+        socketio.sleep(SCRAPE_JOB_RELAY_SECONDS)
+        try:
+            relay_scrape_jobs()
+        except Exception:
+            logger.exception("Relaying scrape jobs failed")
+
+
+def schedule_category(name, category=None, stagger=0):
+    """Arm the category's job for its earliest due link.
+
+    The category interval stays as the trigger so the job still wakes up
+    periodically when nothing is scheduled. ``stagger`` (seconds) holds the
+    run back, and every run gets up to ``schedule_jitter_seconds`` of jitter.
+    """
+    if _scheduler is None:
+        return
+    category = category or db.get_category(name)
+    if not category:
+        link_schedule.drop_category(name)
+        job_id = f"update_{name}"
+        if _scheduler.get_job(job_id):
+            _scheduler.remove_job(job_id)
+        return
+
+    interval = category.get("update_interval_hours") or 1
+    try:
+        interval_hours = max(1, int(interval))
+    except (TypeError, ValueError):
+        interval_hours = 1
+
+    ensure_link_schedule(name)
+    now = datetime.now()
+    jitter = _schedule_policy["jitter"]
+    next_run_time = now + timedelta(hours=interval_hours)
+    next_due = link_schedule.next_due(name)
+    if next_due is not None:
+        next_run_time = min(next_due, next_run_time)
+    next_run_time = max(next_run_time, now + timedelta(seconds=stagger))
+    next_run_time += timedelta(seconds=random.uniform(0, jitter))
+
+    _scheduler.add_job(
+        run_update_job,
+        "interval",
+        hours=interval_hours,
+        jitter=jitter or None,
+        next_run_time=next_run_time,
+        id=f"update_{name}",
+        replace_existing=True,
+        kwargs={"category": name},
+    )
+    logger.info(
+        "Scheduled '%s' to run next at %s (interval=%dh, stagger=%ds, jitter<=%ds, max concurrent=%d)",
+        name,
+        next_run_time.isoformat(),
+        interval_hours,
+        stagger,
+        jitter,
+        _schedule_policy["max_concurrent"],
+    )
+
+
+def rollup_telemetry():
+    settings = db.get_settings()
+    rolled = db.rollup_scrape_attempts(
+        raw_hours=get_int_setting(
+            settings, "telemetry_raw_hours", db_store.DEFAULT_TELEMETRY_RAW_HOURS),
+        retention_days=get_int_setting(
+            settings, "telemetry_retention_days", db_store.DEFAULT_TELEMETRY_RETENTION_DAYS),
+    )
+    if rolled:
+        logger.info("Rolled %d scrape attempts into hourly telemetry", rolled)
+
+
+def observe_job_event(event):
+    if event.code == EVENT_JOB_MISSED:
+        scheduler_jobs_missed_total.inc(job=event.job_id)
+        return
+    for run_time in event.scheduled_run_times:
+        lag = (datetime.now(run_time.tzinfo) - run_time).total_seconds()
+        scheduler_job_lag_seconds.observe(max(0.0, lag), job=event.job_id)
 
 
 def schedule_updates(force=False):
@@ -257,6 +565,7 @@ def schedule_updates(force=False):
                 "max_instances": 1,
                 "misfire_grace_time": 3600  # 1 hour grace period
             })
+            _scheduler.add_listener(observe_job_event, EVENT_JOB_SUBMITTED | EVENT_JOB_MISSED)
         
         if force and _scheduler_started:
             # Instead of removing all, we'll just update what's needed
@@ -264,63 +573,45 @@ def schedule_updates(force=False):
         elif _scheduler_started and not force:
             return _scheduler
 
-        now = datetime.now()
         existing_job_ids = {job.id for job in _scheduler.get_jobs()}
         current_category_ids = set()
 
-        for category in db.get_categories():
+        # Spread start offsets so a reboot doesn't fire every category at once.
+        categories = db.get_categories()
+        window = _schedule_policy["stagger"]
+        for index, category in enumerate(categories):
             name = category["name"]
-            job_id = f"update_{name}"
-            current_category_ids.add(job_id)
-            
-            interval = category.get("update_interval_hours") or 1
-            try:
-                interval_hours = max(1, int(interval))
-            except (TypeError, ValueError):
-                interval_hours = 1
-
-            last_checked_str = category.get("last_checked")
-            last_checked = None
-            if last_checked_str:
-                try:
-                    last_checked = datetime.fromisoformat(last_checked_str)
-                except ValueError:
-                    last_checked = None
-
-            next_run_time = now
-            if last_checked:
-                candidate = last_checked + timedelta(hours=interval_hours)
-                if candidate > now:
-                    next_run_time = candidate
-
-            _scheduler.add_job(
-                run_update_job,
-                "interval",
-                hours=interval_hours,
-                next_run_time=next_run_time,
-                id=job_id,
-                replace_existing=True,
-                kwargs={"category": name},
-            )
-            logger.info(
-                "Scheduled '%s' to run next at %s (interval=%dh)",
-                name,
-                next_run_time.isoformat(),
-                interval_hours,
-            )
+            current_category_ids.add(f"update_{name}")
+            link_schedule.load(name, db.get_link_schedule(name))
+            schedule_category(name, category, stagger=window * index / len(categories))
 
         # Remove jobs for categories that no longer exist
         for old_id in existing_job_ids:
             if old_id.startswith("update_") and old_id not in current_category_ids:
                 _scheduler.remove_job(old_id)
+                link_schedule.drop_category(old_id[len("update_"):])
                 logger.info("Removed scheduled job for deleted category: %s", old_id)
 
+        _scheduler.add_job(
+            rollup_telemetry,
+            "interval",
+            hours=1,
+            id="telemetry_rollup",
+            replace_existing=True,
+        )
+
         if not _scheduler_started:
             _scheduler.start()
             _scheduler_started = True
+            socketio.start_background_task(_relay_scrape_jobs_forever)
         return _scheduler
 
 
+@atexit.register
+def _close_database():
+    db.close()
+
+
 @atexit.register
 def _shutdown_scheduler():
     global _scheduler_started
@@ -331,6 +622,41 @@ def _shutdown_scheduler():
 
 
 def build_view_data(update_type):
+    # Keyed by date because timestamp labels ("Today", "Yesterday") roll over.
+    today = datetime.now().date().isoformat()
+    return view_cache.get(
+        update_type, ("view", today), lambda: _build_view_data(update_type))
+
+
+def build_chapter_fragments(update_type, view_data):
+    def build():
+        differences_html = (
+            render_template(
+                "partials/chapter_table.html",
+                rows=view_data["differences"],
+                show_found_column=True,
+                show_save_button=True,
+                current_category=update_type,
+            )
+            if view_data["differences"]
+            else '<div class="status-box status-success"><i class="fas fa-check-circle"></i><span>All chapters are up to date!</span></div>'
+        )
+        same_html = (
+            render_template(
+                "partials/chapter_table.html",
+                rows=view_data["same_data"],
+                current_category=update_type,
+            )
+            if view_data["same_data"]
+            else '<div class="status-box status-info"><i class="fas fa-info-circle"></i><span>No entries being tracked yet.</span></div>'
+        )
+        return differences_html, same_html
+
+    today = datetime.now().date().isoformat()
+    return view_cache.get(update_type, ("html", today), build)
+
+
+def _build_view_data(update_type):
     previous_data = annotate_support_flags(db.get_scraped_data(update_type))
     previous_data = annotate_timestamp_display(previous_data)
 
@@ -420,26 +746,7 @@ def chapter_data():
         nav_categories, update_type, len(differences)
     )
 
-    differences_html = (
-        render_template(
-            "partials/chapter_table.html",
-            rows=view_data["differences"],
-            show_found_column=True,
-            show_save_button=True,
-            current_category=update_type,
-        )
-        if view_data["differences"]
-        else '<div class="status-box status-success"><i class="fas fa-check-circle"></i><span>All chapters are up to date!</span></div>'
-    )
-    same_html = (
-        render_template(
-            "partials/chapter_table.html",
-            rows=view_data["same_data"],
-            current_category=update_type,
-        )
-        if view_data["same_data"]
-        else '<div class="status-box status-info"><i class="fas fa-info-circle"></i><span>No entries being tracked yet.</span></div>'
-    )
+    differences_html, same_html = build_chapter_fragments(update_type, view_data)
 
     return jsonify(
         {
@@ -578,6 +885,7 @@ def add_link(category=None):
         db.merge_scraped({link["url"]: data_entry})
     if failure:
         db.record_failures(failure)
+    refresh_link_schedule([link["url"]])
     return jsonify({"status": "success"})
 
 
@@ -613,6 +921,7 @@ def edit_link(category=None):
                 free_only,
                 category=target_category,
             )
+            refresh_link_schedule([str(orig_url), str(new_url)])
             updated = True
             break
 
@@ -625,6 +934,7 @@ def remove_link(category=None):
     if not url:
         return jsonify({"status": "error", "message": "Missing URL"}), 400
     db.remove_link(url)
+    refresh_link_schedule([url])
     return jsonify({"status": "success"})
 
 
@@ -681,6 +991,77 @@ app.add_url_rule("/history/delete", endpoint="main_history_delete",
 # dynamically add routes for any category slug
 
 
+@app.route("/api/backoff", methods=["GET"])
+@require_auth
+def backoff_links():
+    return jsonify(db.get_backed_off_links())
+
+
+@app.route("/api/backoff/reset", methods=["POST"])
+@require_auth
+def reset_backoff():
+    data = request.get_json() or {}
+    urls = data.get("urls")
+    if urls is None and data.get("url"):
+        urls = [data["url"]]
+    if not isinstance(urls, list) or not urls:
+        return jsonify({"status": "error", "error": "url or urls is required"}), 400
+    urls = [str(url) for url in urls]
+    reset = db.reset_failures(urls)
+    refresh_link_schedule(urls)
+    return jsonify({"status": "success", "reset": reset})
+
+
+@app.route("/api/metrics/scrapes", methods=["GET"])
+@require_auth
+def scrape_metrics():
+    try:
+        hours = max(1.0, float(request.args.get("hours", 24)))
+    except ValueError:
+        return jsonify({"status": "error", "error": "hours must be a number"}), 400
+    report = db.get_scrape_metrics(time.time() - hours * 3600)
+    return jsonify({"hours": hours, **report})
+
+
+@app.route("/api/worker/<action>", methods=["POST"])
+@require_auth
+def worker_api(action):
+    data = request.get_json() or {}
+    worker = str(data.get("worker") or "")
+    if not worker:
+        return jsonify({"status": "error", "error": "worker is required"}), 400
+    try:
+        lease_seconds = min(max(
+            float(data.get("lease_seconds", db_store.SCRAPE_LEASE_SECONDS)),
+            WORKER_LEASE_LIMITS[0]), WORKER_LEASE_LIMITS[1])
+        if action == "register":
+            result = worker_queue.register(worker, data.get("host") or request.remote_addr, data.get("pid"))
+        elif action == "unregister":
+            result = worker_queue.unregister(worker)
+        elif action == "heartbeat":
+            result = worker_queue.heartbeat(worker, lease_seconds)
+        elif action == "claim":
+            limit = min(max(int(data.get("limit", 1)), 1), WORKER_MAX_BATCH)
+            result = worker_queue.claim(worker, limit, lease_seconds)
+        elif action == "complete":
+            result = worker_queue.complete(
+                worker, int(data["job_id"]), [str(url) for url in data["urls"]],
+                dict(data.get("new_data") or {}), dict(data.get("failures") or {}))
+        elif action == "attempts":
+            result = worker_queue.record_scrape_attempts(list(data.get("attempts") or []))
+        else:
+            return jsonify({"status": "error", "error": f"Unknown action: {action}"}), 404
+    except (KeyError, TypeError, ValueError, sqlite3.ProgrammingError) as exc:
+        return jsonify({"status": "error", "error": str(exc) or type(exc).__name__}), 400
+    return jsonify({"status": "success", "result": result})
+
+
+@app.route("/api/workers", methods=["GET"])
+@require_auth
+def workers_api():
+    return jsonify({"workers": db.get_scrape_workers(), "jobs": db.get_active_scrape_jobs()})
+
+
 @app.route("/api/categories", methods=["GET", "POST"])
 @require_auth
 def categories_api():
@@ -706,6 +1087,8 @@ def categories_api():
         return jsonify({"status": "error", "error": "Category already exists"}), 400
     except ValueError as exc:
         return jsonify({"status": "error", "error": str(exc)}), 400
+    if created:
+        schedule_category(created["name"])
     return jsonify({"status": "success", "category": created})
 
 
@@ -719,6 +1102,7 @@ def categories_detail(category_name):
             return jsonify({"status": "error", "error": str(exc)}), 400
         if not deleted:
             return jsonify({"status": "missing"}), 404
+        schedule_category(category_name)
         return jsonify({"status": "success"})
 
     data = request.get_json() or {}
@@ -731,6 +1115,11 @@ def categories_detail(category_name):
     )
     if not updated:
         return jsonify({"status": "missing"}), 404
+    # Intervals feed into every link's due time, so rebuild the heap.
+    link_schedule.drop_category(category_name)
+    if updated["name"] != category_name:
+        schedule_category(category_name)
+    schedule_category(updated["name"])
     return jsonify({"status": "success", "category": updated})
 
 
@@ -781,7 +1170,11 @@ def settings_api():
             "auth_required": auth_required,
             "has_password": has_password,
             "share_local": settings.get("share_local") == "1",
-            "port": settings.get("port", "555")
+            "port": settings.get("port", "555"),
+            "adaptive_polling": settings.get("adaptive_polling") == "1",
+            "adaptive_min_hours": settings.get("adaptive_min_hours", "1"),
+            "adaptive_max_hours": settings.get("adaptive_max_hours", "168"),
+            "scrape_mode": settings.get("scrape_mode", "inline"),
         })
 
     data = request.get_json() or {}
@@ -796,6 +1189,24 @@ def settings_api():
         # I'll use a simple way to store it for now as per "local host" context
         db.update_setting("password_hash", str(data["password"]))
 
+    if "scrape_mode" in data:
+        if data["scrape_mode"] not in SCRAPE_MODES:
+            return jsonify({"status": "error", "message": "Invalid scrape_mode"}), 400
+        db.update_setting("scrape_mode", data["scrape_mode"])
+
+    polling_keys = ("adaptive_polling", "adaptive_min_hours", "adaptive_max_hours")
+    if any(key in data for key in polling_keys):
+        if "adaptive_polling" in data:
+            db.update_setting("adaptive_polling", "1" if data["adaptive_polling"] else "0")
+        for key in polling_keys[1:]:
+            if key in data:
+                try:
+                    db.update_setting(key, str(max(1, int(data[key]))))
+                except (TypeError, ValueError):
+                    return jsonify({"status": "error", "message": f"Invalid {key}"}), 400
+        db.refresh_schedule()
+        schedule_updates(force=True)
+
     return jsonify({"status": "success"})
 
 
@@ -902,6 +1313,7 @@ def _start_scheduler_hook():
 # since before_first_request is deprecated/removed in Flask 2.3+
 @app.before_request
 def before_request_hooks():
+    g.request_started = time.perf_counter()
     _start_scheduler_hook()
     
     # Sync session from fallback cookie if needed
@@ -921,6 +1333,23 @@ def set_cache_headers(response):
     return response
 
 
+@app.after_request
+def record_request_metrics(response):
+    started = g.get("request_started")
+    endpoint = request.endpoint or "unmatched"
+    http_requests_total.inc(
+        endpoint=endpoint, method=request.method, status=response.status_code)
+    if started is not None:
+        http_request_seconds.observe(time.perf_counter() - started, endpoint=endpoint)
+    return response
+
+
+@app.route("/metrics")
+@require_auth
+def prometheus_metrics():
+    return Response(metrics_registry.render(), mimetype=metrics.CONTENT_TYPE)
+
+
 # --------------------- Startup Logic ---------------------
 
 def set_run_on_startup(enabled=True):
@@ -0,0 +1,70 @@
+import statistics
+from collections import Counter
+from datetime import timedelta
+
+DEFAULT_MIN_HOURS = 1
+DEFAULT_MAX_HOURS = 168
+MIN_HISTORY = 3
+HISTORY_WINDOW = 9
+# Share of releases that must land on the same weekday to trust it.
+WEEKDAY_CONFIDENCE = 0.6
+
+
+def estimate_cadence(history):
+    """Median gap between releases in ``history`` (ascending datetimes)."""
+    recent = history[-HISTORY_WINDOW:]
+    gaps = [
+        later - earlier
+        for earlier, later in zip(recent, recent[1:])
+        if later > earlier
+    ]
+    if len(gaps) < MIN_HISTORY - 1:
+        return None
+    return timedelta(seconds=statistics.median(gap.total_seconds() for gap in gaps))
+
+
+def typical_weekday(history, cadence):
+    """Weekday most releases land on, for series released about weekly or slower."""
+    if cadence is None or cadence < timedelta(days=5):
+        return None
+    recent = history[-HISTORY_WINDOW:]
+    weekday, count = Counter(moment.weekday() for moment in recent).most_common(1)[0]
+    if count / len(recent) < WEEKDAY_CONFIDENCE:
+        return None
+    return weekday
+
+
+def expected_release(history, cadence):
+    expected = history[-1] + cadence
+    weekday = typical_weekday(history, cadence)
+    if weekday is not None:
+        # Snap to the nearest occurrence of the usual weekday.
+        shift = (weekday - expected.weekday() + 3) % 7 - 3
+        expected += timedelta(days=shift)
+    return expected
+
+
+def adaptive_next_check(history, last_attempt, now, min_hours=DEFAULT_MIN_HOURS, max_hours=DEFAULT_MAX_HOURS):
+    """Next check time learned from when new chapters appeared.
+
+    Checks are spread out until shortly before the expected release, run
+    every ``min_hours`` around it, and back off exponentially towards
+    ``max_hours`` the longer a series stays overdue. Returns ``None`` when
+    there is not enough history to estimate a cadence.
+    """
+    if last_attempt is None:
+        return now
+    cadence = estimate_cadence(history)
+    if cadence is None:
+        return None
+    shortest = timedelta(hours=min_hours)
+    longest = timedelta(hours=max(min_hours, max_hours))
+    expected = expected_release(history, cadence)
+    lead = min(max(cadence / 10, shortest), timedelta(hours=24))
+
+    if last_attempt < expected - lead:
+        delay = (expected - lead) - last_attempt
+    else:
+        overdue = max(last_attempt - expected, timedelta(0))
+        delay = shortest * 2 ** min(overdue / cadence * 4, 32)
+    return last_attempt + min(max(delay, shortest), longest)
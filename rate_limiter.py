@@ -0,0 +1,143 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+DEFAULT_RATE = 1.0  # requests per second
+DEFAULT_BURST = 3
+THROTTLE_STATUSES = {429, 503}
+# AIMD: halve the rate on throttling, recover a little on every success.
+BACKOFF_FACTOR = 0.5
+RECOVERY_STEP = 0.05
+MIN_RATE_FACTOR = 1 / 32
+DEFAULT_BACKOFF_SECONDS = 5.0
+MAX_RETRY_AFTER = 600.0
+
+
+def parse_retry_after(value, now=None):
+    """Seconds to wait from a ``Retry-After`` header (delta or HTTP date)."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if moment is None:
+            return None
+        seconds = moment.timestamp() - (now if now is not None else time.time())
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class _Bucket:
+    def __init__(self, rate, burst, now):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+        self.factor = 1.0
+        self.blocked_until = 0.0
+
+    def reserve(self, now):
+        """Take a token, returning how long the caller must wait for it."""
+        rate = self.rate * self.factor
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+
+class RateLimiter:
+    """Token buckets per site, shared by every thread making requests.
+
+    Each key gets ``rate`` requests per second with bursts of ``burst``;
+    ``overrides`` maps keys to their own ``{"rate": .., "burst": ..}``.
+    Throttling responses slow the key down (and honour ``Retry-After``)
+    until successful responses bring it back to full speed.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, overrides=None, clock=time.monotonic, sleep=time.sleep):
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._clock = clock
+        self._sleep = sleep
+        self.rate = DEFAULT_RATE
+        self.burst = DEFAULT_BURST
+        self.overrides = {}
+        self.configure(rate, burst, overrides)
+
+    def configure(self, rate=None, burst=None, overrides=None):
+        with self._lock:
+            if rate:
+                self.rate = max(0.01, float(rate))
+            if burst:
+                self.burst = max(1, int(burst))
+            if overrides is not None:
+                self.overrides = dict(overrides)
+            for key, bucket in self._buckets.items():
+                bucket.rate, bucket.burst = self._limits(key)
+                bucket.tokens = min(bucket.tokens, bucket.burst)
+
+    def _limits(self, key):
+        override = self.overrides.get(key) or {}
+        try:
+            rate = max(0.01, float(override.get("rate", self.rate)))
+            burst = max(1, int(override.get("burst", self.burst)))
+        except (TypeError, ValueError):
+            rate, burst = self.rate, self.burst
+        return rate, burst
+
+    def _bucket(self, key, now):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(*self._limits(key), now)
+        return bucket
+
+    def acquire(self, key, max_wait=None):
+        """Block until a request to ``key`` is allowed; returns seconds waited.
+
+        If the wait would exceed ``max_wait`` the token is handed back and
+        ``None`` is returned without sleeping.
+        """
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(key, now)
+            wait = bucket.reserve(now)
+            if max_wait is not None and wait > max_wait:
+                bucket.tokens += 1
+                return None
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def observe(self, key, status_code, retry_after=None):
+        """Feed a response status back into the key's rate."""
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(key, now)
+            if status_code in THROTTLE_STATUSES:
+                bucket.factor = max(MIN_RATE_FACTOR, bucket.factor * BACKOFF_FACTOR)
+                delay = parse_retry_after(retry_after)
+                if delay is None:
+                    delay = DEFAULT_BACKOFF_SECONDS / bucket.factor
+                bucket.blocked_until = max(bucket.blocked_until, now + min(delay, MAX_RETRY_AFTER))
+                # Refill only resumes once the block is over.
+                bucket.tokens = min(bucket.tokens, 0.0)
+                bucket.updated = max(bucket.updated, bucket.blocked_until)
+            elif status_code is not None and status_code < 400:
+                bucket.factor = min(1.0, bucket.factor + RECOVERY_STEP)
+
+    def snapshot(self):
+        with self._lock:
+            now = self._clock()
+            return {
+                key: {
+                    "rate": bucket.rate * bucket.factor,
+                    "burst": bucket.burst,
+                    "blocked_for": max(0.0, bucket.blocked_until - now),
+                }
+                for key, bucket in self._buckets.items()
+            }
@@ -0,0 +1,81 @@
+import random
+import threading
+
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 20.0
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 1.0
+DEFAULT_BACKOFF_MAX = 10.0
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    """Timeouts and retry behaviour for requests to one site."""
+
+    FIELDS = ("connect_timeout", "read_timeout", "retries", "backoff", "backoff_max", "retry_statuses")
+
+    def __init__(
+        self,
+        connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+        read_timeout=DEFAULT_READ_TIMEOUT,
+        retries=DEFAULT_RETRIES,
+        backoff=DEFAULT_BACKOFF,
+        backoff_max=DEFAULT_BACKOFF_MAX,
+        retry_statuses=DEFAULT_RETRY_STATUSES,
+    ):
+        self.connect_timeout = max(0.1, float(connect_timeout))
+        self.read_timeout = max(0.1, float(read_timeout))
+        self.retries = max(0, int(retries))
+        self.backoff = max(0.0, float(backoff))
+        self.backoff_max = max(self.backoff, float(backoff_max))
+        self.retry_statuses = frozenset(int(status) for status in retry_statuses)
+
+    def merged(self, overrides):
+        """Copy of this policy with ``overrides`` (a dict) applied."""
+        values = {field: getattr(self, field) for field in self.FIELDS}
+        values.update({k: v for k, v in (overrides or {}).items() if k in self.FIELDS})
+        return RetryPolicy(**values)
+
+    @property
+    def timeout(self):
+        return self.connect_timeout, self.read_timeout
+
+    def delay(self, attempt, rng=random.random):
+        """Exponential backoff with full jitter before retry ``attempt`` (0-based)."""
+        ceiling = min(self.backoff_max, self.backoff * 2 ** attempt)
+        return ceiling * rng()
+
+
+class RetryPolicies:
+    """Default policy plus per-site overrides keyed like the rate limiter."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.default = RetryPolicy()
+        self._raw_overrides = {}
+        self._overrides = {}
+
+    def configure(self, default=None, overrides=None):
+        """``default`` and each value of ``overrides`` are dicts of policy fields.
+
+        Overrides only list the fields they change; invalid entries are
+        skipped so one bad override can't break fetching.
+        """
+        with self._lock:
+            if default is not None:
+                try:
+                    self.default = RetryPolicy().merged(default)
+                except (TypeError, ValueError):
+                    pass
+            if overrides is not None:
+                self._raw_overrides = dict(overrides)
+            self._overrides = {}
+            for key, values in self._raw_overrides.items():
+                try:
+                    self._overrides[key] = self.default.merged(values)
+                except (TypeError, ValueError, AttributeError):
+                    continue
+
+    def for_key(self, key):
+        with self._lock:
+            return self._overrides.get(key, self.default)
@@ -0,0 +1,309 @@
+"""Scrape worker process.
+
+With the ``scrape_mode`` setting on ``worker`` the web process only queues
+category updates in the ``scrape_jobs`` table, one row per link in
+``scrape_job_links``. Workers lease batches of links, scrape them and hand
+the results back; a lease that is not renewed by heartbeats expires and its
+links go back to the queue, so a crashed worker never loses an update.
+
+Workers on the same machine use the database directly. Workers on other
+machines (and so other source IPs) go through the web app's
+``/api/worker/...`` endpoints, since SQLite cannot be shared across hosts.
+
+    python scrape_worker.py                                  # one local worker
+    python scrape_worker.py --processes 2                    # several, sharing the queue
+    python scrape_worker.py --server http://tracker:555 --password ...  # on another machine
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+import scraper_utils
+import scraping
+from db_store import SCRAPE_LEASE_SECONDS, ChapterDatabase
+from scraping import RUNTIME_SETTINGS, get_int_setting, scrape_all_links
+
+DATA_DIR = Path(os.environ.get("CHAPTER_TRACKER_DATA_DIR", Path(__file__).resolve().parent / "data"))
+DB_PATH = DATA_DIR / "chapters.db"
+LOG_FILE = DATA_DIR / "scrape_worker.log"
+DEFAULT_POLL_SECONDS = 2.0
+DEFAULT_BATCH_SIZE = 20
+REMOTE_TIMEOUT = 30
+
+logger = logging.getLogger(__name__)
+
+
+def scrape_links(links, current_data, category, settings):
+    """Scrape ``links`` and return ``(new_data, failures)`` for ``merge_scraped``/``record_failures``."""
+    return scrape_all_links(
+        links,
+        current_data,
+        # Callers only pass links that are due (or every link when forced).
+        force_update=True,
+        category=category,
+        max_workers=get_int_setting(
+            settings, "scrape_max_workers", scraping.DEFAULT_MAX_WORKERS),
+        max_per_domain=get_int_setting(
+            settings, "scrape_max_per_domain", scraping.DEFAULT_MAX_PER_DOMAIN),
+    )
+
+
+def scrape_category(store, category, urls=None):
+    """Scrape ``urls`` in ``category`` (every link when ``None``) and store the results."""
+    try:
+        new_data, failures = scrape_links(
+            store.get_links(category, urls=urls),
+            store.get_scraped_data(category, urls=urls),
+            category,
+            store.get_settings(),
+        )
+        store.merge_scraped(new_data)
+        store.record_failures(failures)
+    finally:
+        store.set_category_last_checked(category, datetime.now().isoformat())
+
+
+class LocalQueue:
+    """The scrape queue in a ChapterDatabase on this machine."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def register(self, worker, host=None, pid=None):
+        self.store.register_scrape_worker(worker, host, pid)
+
+    def unregister(self, worker):
+        self.store.unregister_scrape_worker(worker)
+
+    def heartbeat(self, worker, lease_seconds=SCRAPE_LEASE_SECONDS):
+        return self.store.heartbeat_scrape_worker(worker, lease_seconds)
+
+    def claim(self, worker, limit=DEFAULT_BATCH_SIZE, lease_seconds=SCRAPE_LEASE_SECONDS):
+        """Lease a batch; returns it with the links, their entries and the scraper settings."""
+        batch = self.store.claim_scrape_links(worker, limit, lease_seconds)
+        if batch is None:
+            return None
+        settings = self.store.get_settings()
+        return {
+            **batch,
+            "links": self.store.get_links(batch["category"], urls=batch["urls"]),
+            "entries": self.store.get_scraped_data(batch["category"], urls=batch["urls"]),
+            "settings": {key: settings[key] for key in RUNTIME_SETTINGS if key in settings},
+        }
+
+    def complete(self, worker, job_id, urls, new_data, failures):
+        """Store a batch's results; see ``ChapterDatabase.complete_scrape_links``."""
+        return self.store.complete_scrape_links(worker, job_id, urls, new_data, failures)
+
+    def record_scrape_attempts(self, attempts):
+        self.store.record_scrape_attempts(attempts)
+
+
+class RemoteQueue:
+    """The scrape queue of a web app on another machine, reached over HTTP."""
+
+    def __init__(self, server, password=None, session=None):
+        self.server = server.rstrip("/")
+        self.session = session or requests.Session()
+        if password:
+            self.session.headers["X-Password"] = password
+
+    def _call(self, action, **payload):
+        response = self.session.post(
+            f"{self.server}/api/worker/{action}", json=payload, timeout=REMOTE_TIMEOUT)
+        response.raise_for_status()
+        return response.json().get("result")
+
+    def register(self, worker, host=None, pid=None):
+        self._call("register", worker=worker, host=host, pid=pid)
+
+    def unregister(self, worker):
+        self._call("unregister", worker=worker)
+
+    def heartbeat(self, worker, lease_seconds=SCRAPE_LEASE_SECONDS):
+        return self._call("heartbeat", worker=worker, lease_seconds=lease_seconds)
+
+    def claim(self, worker, limit=DEFAULT_BATCH_SIZE, lease_seconds=SCRAPE_LEASE_SECONDS):
+        return self._call("claim", worker=worker, limit=limit, lease_seconds=lease_seconds)
+
+    def complete(self, worker, job_id, urls, new_data, failures):
+        return self._call(
+            "complete", worker=worker, job_id=job_id, urls=urls,
+            new_data=new_data, failures=failures)
+
+    def record_scrape_attempts(self, attempts):
+        self._call("attempts", attempts=attempts)
+
+
+def run_batch(queue, worker, batch):
+    """Scrape one leased batch and hand its results back."""
+    category = batch["category"]
+    try:
+        new_data, failures = scrape_links(batch["links"], batch["entries"], category, batch["settings"])
+    except Exception as exc:
+        logger.exception("Scraping %d links of %s failed", len(batch["urls"]), category)
+        new_data, failures = {}, {
+            url: {"error": str(exc) or type(exc).__name__} for url in batch["urls"]}
+    result = queue.complete(worker, batch["job_id"], batch["urls"], new_data, failures)
+    logger.info(
+        "Scraped %d links of %s (job %d, %d results dropped for lost leases)%s",
+        len(batch["urls"]), category, batch["job_id"], len(result["lease_lost"]),
+        ", job finished" if result["finished"] else "")
+
+
+def _heartbeat(queue, worker, stop, lease_seconds):
+    while not stop.wait(lease_seconds / 3):
+        try:
+            queue.heartbeat(worker, lease_seconds)
+        except Exception:
+            logger.warning("Scrape worker heartbeat failed", exc_info=True)
+
+
+def work(
+    queue, worker, stop, poll_seconds=DEFAULT_POLL_SECONDS, once=False,
+    batch_size=DEFAULT_BATCH_SIZE, lease_seconds=SCRAPE_LEASE_SECONDS,
+):
+    """Lease and scrape batches until ``stop`` is set (or the queue is empty with ``once``)."""
+    queue.register(worker, socket.gethostname(), os.getpid())
+    beat_stop = threading.Event()
+    threading.Thread(
+        target=_heartbeat, args=(queue, worker, beat_stop, lease_seconds),
+        name="scrape-worker-heartbeat", daemon=True,
+    ).start()
+    settings = None
+    try:
+        while not stop.is_set():
+            try:
+                batch = queue.claim(worker, batch_size, lease_seconds)
+            except Exception:
+                logger.warning("Claiming scrape work failed", exc_info=True)
+                stop.wait(poll_seconds)
+                continue
+            if batch is None:
+                if once:
+                    return
+                stop.wait(poll_seconds)
+                continue
+            if batch["settings"] != settings:
+                # Reconfiguring resets connection pools, so only do it on change.
+                settings = batch["settings"]
+                scraping.configure_runtime(settings)
+            try:
+                run_batch(queue, worker, batch)
+            except Exception:
+                # The lease expires and another worker picks the links up.
+                logger.exception("Returning results of job %d failed", batch["job_id"])
+    finally:
+        beat_stop.set()
+        try:
+            queue.unregister(worker)
+        except Exception:
+            logger.warning("Unregistering scrape worker %s failed", worker, exc_info=True)
+
+
+def _configure_logging():
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f"%(asctime)s [%(levelname)s] %(name)s[{os.getpid()}]: %(message)s",
+        handlers=[
+            logging.FileHandler(LOG_FILE, encoding="utf-8"),
+            logging.StreamHandler(sys.stdout),
+        ],
+    )
+
+
+def run_worker(
+    db_path, poll_seconds, once=False, server=None, password=None, worker=None,
+    batch_size=DEFAULT_BATCH_SIZE, lease_seconds=SCRAPE_LEASE_SECONDS,
+):
+    _configure_logging()
+    worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    store = None
+    if server:
+        queue = RemoteQueue(server, password)
+    else:
+        store = ChapterDatabase(db_path)
+        queue = LocalQueue(store)
+        scraper_utils.set_feed_cache(store)
+    scraping.telemetry_store = queue
+    logger.info("Scrape worker %s started (%s)", worker, server or db_path)
+    try:
+        work(queue, worker, stop, poll_seconds, once, batch_size, lease_seconds)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scraping.shutdown_scraper()
+        if store is not None:
+            store.close()
+        logger.info("Scrape worker %s stopped", worker)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run scrape jobs queued by the web app.")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="chapter database (default: %(default)s)")
+    parser.add_argument(
+        "--server", help="web app URL to take work from instead of the database, e.g. http://tracker:555")
+    parser.add_argument("--password", help="web app password, when it is password protected")
+    parser.add_argument("--worker-id", help="name shown in /api/workers (default: HOST-PID)")
+    parser.add_argument("--processes", type=int, default=1, help="worker processes to run")
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="links leased at a time")
+    parser.add_argument(
+        "--lease-seconds", type=float, default=SCRAPE_LEASE_SECONDS,
+        help="how long a lease lasts without a heartbeat")
+    parser.add_argument(
+        "--poll-seconds", type=float, default=DEFAULT_POLL_SECONDS,
+        help="how often an idle worker checks the queue")
+    parser.add_argument("--once", action="store_true", help="exit once the queue is empty")
+    parser.add_argument(
+        "--enable", action="store_true",
+        help="switch the app to worker mode (scrape_mode=worker) before starting")
+    args = parser.parse_args(argv)
+
+    if args.enable:
+        if args.server:
+            parser.error("--enable only works on the database, not with --server")
+        store = ChapterDatabase(args.db)
+        store.update_setting("scrape_mode", "worker")
+        store.close()
+
+    def worker_args(index):
+        worker = args.worker_id
+        if worker and args.processes > 1:
+            worker = f"{worker}-{index}"
+        return (
+            args.db, args.poll_seconds, args.once, args.server, args.password, worker,
+            args.batch_size, args.lease_seconds,
+        )
+
+    if args.processes <= 1:
+        run_worker(*worker_args(0))
+        return
+    processes = [
+        multiprocessing.Process(target=run_worker, args=worker_args(index), name=f"scrape-worker-{index}")
+        for index in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,36 @@
 import datetime
+import threading
+import time
+from contextlib import contextmanager
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
+import cloudscraper
+import requests
+
+from rate_limiter import RateLimiter
+from retry_policy import RetryPolicies
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_CLOUDSCRAPER_BROWSER = {
+    "browser": "chrome",
+    "platform": "windows",
+    "mobile": False,
+}
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+_pool_config = {
+    "pool_connections": DEFAULT_POOL_CONNECTIONS,
+    "pool_maxsize": DEFAULT_POOL_MAXSIZE,
+}
+_feed_cache = None
+rate_limiter = RateLimiter()
+retry_policies = RetryPolicies()
+_rate_limit_resolver = None
+_budget = threading.local()
+_tracked = threading.local()
+
 
 def needs_update(url, previous_data, max_days, force_update):
     if force_update or url not in previous_data:
@@ -28,3 +58,252 @@ def convert_to_rss_url(url: str) -> str:
             parsed.fragment,
         )
     )
+
+# --------------------- Shared HTTP Sessions ---------------------
+
+
+def url_host(url: str) -> str:
+    source = (url or "").strip()
+    if "://" not in source:
+        source = f"//{source}"
+    return (urlparse(source).hostname or "").lower()
+
+
+def configure_sessions(pool_connections=None, pool_maxsize=None):
+    """Set keep-alive pool sizes; existing sessions are resized in place."""
+    with _sessions_lock:
+        if pool_connections:
+            _pool_config["pool_connections"] = max(1, int(pool_connections))
+        if pool_maxsize:
+            _pool_config["pool_maxsize"] = max(1, int(pool_maxsize))
+        for session in _sessions.values():
+            _size_pools(session)
+
+
+def _size_pools(session):
+    # Re-initialising keeps adapter specifics such as cloudscraper's
+    # cipher suite while applying the configured pool sizes.
+    for adapter in session.adapters.values():
+        adapter.init_poolmanager(
+            _pool_config["pool_connections"], _pool_config["pool_maxsize"]
+        )
+
+
+def get_session(url: str, cloudflare=False, browser=None):
+    """Return the shared session for the URL's host.
+
+    Plain sessions keep a keep-alive pool per host; ``cloudflare=True``
+    returns a cloudscraper session whose clearance cookies are reused for
+    every request to that host.
+    """
+    key = (url_host(url), bool(cloudflare))
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            if cloudflare:
+                session = cloudscraper.create_scraper(
+                    browser=browser or DEFAULT_CLOUDSCRAPER_BROWSER
+                )
+            else:
+                session = requests.Session()
+            _size_pools(session)
+            _sessions[key] = session
+        return session
+
+
+def reset_session(url: str, cloudflare=False):
+    """Drop the shared session for a host, e.g. after a stale challenge."""
+    key = (url_host(url), bool(cloudflare))
+    with _sessions_lock:
+        session = _sessions.pop(key, None)
+    if session is not None:
+        session.close()
+
+
+def close_sessions():
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+def set_rate_limit_resolver(resolver):
+    """Install ``resolver(url) -> key`` grouping hosts that share a limit."""
+    global _rate_limit_resolver
+    _rate_limit_resolver = resolver
+
+
+def rate_limit_key(url: str) -> str:
+    key = _rate_limit_resolver(url) if _rate_limit_resolver else None
+    return key or url_host(url)
+
+
+class BudgetExceeded(requests.Timeout):
+    """The time budget for the current link ran out."""
+
+
+@contextmanager
+def request_budget(seconds):
+    """Limit the wall-clock time requests in this thread may use.
+
+    Retries, backoff sleeps, rate-limit waits and timeouts are all cut to
+    what is left; once the budget is spent requests raise ``BudgetExceeded``.
+    """
+    previous = getattr(_budget, "deadline", None)
+    _budget.deadline = time.monotonic() + seconds if seconds else None
+    try:
+        yield
+    finally:
+        _budget.deadline = previous
+
+
+def budget_remaining():
+    deadline = getattr(_budget, "deadline", None)
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@contextmanager
+def track_requests():
+    """Count requests and bytes downloaded in this thread.
+
+    Yields a dict with ``requests``, ``bytes`` and ``error`` (the last
+    exception class or ``HTTP <status>`` seen, if any).
+    """
+    previous = getattr(_tracked, "stats", None)
+    stats = _tracked.stats = {"requests": 0, "bytes": 0, "error": None}
+    try:
+        yield stats
+    finally:
+        _tracked.stats = previous
+
+
+def _track(response=None, error=None):
+    stats = getattr(_tracked, "stats", None)
+    if stats is None:
+        return
+    stats["requests"] += 1
+    if error is not None:
+        stats["error"] = type(error).__name__
+    elif response is not None:
+        stats["bytes"] += len(getattr(response, "content", b"") or b"")
+        if response.status_code >= 400:
+            stats["error"] = f"HTTP {response.status_code}"
+
+
+def _check_budget(url):
+    remaining = budget_remaining()
+    if remaining is not None and remaining <= 0:
+        raise BudgetExceeded(f"Time budget exhausted before requesting {url}")
+    return remaining
+
+
+def _cap_timeout(timeout, remaining):
+    if remaining is None:
+        return timeout
+    if isinstance(timeout, (tuple, list)):
+        return tuple(min(part, remaining) for part in timeout)
+    return min(timeout, remaining)
+
+
+def http_request(
+    method, url, cloudflare=False, browser=None, on_retry=None, retry_if=None, retries=None, **kwargs
+):
+    """Send a request through the shared session with the site's retry policy.
+
+    Connection errors, timeouts, the policy's retryable statuses and
+    responses ``retry_if(response)`` is true for are retried with jittered
+    exponential backoff. ``on_retry`` is called before each retry, e.g. to
+    reset a session whose challenge went stale, and ``retries`` overrides the
+    policy's retry count. The last response (or error) is returned (or
+    raised) once retries run out.
+    """
+    key = rate_limit_key(url)
+    policy = retry_policies.for_key(key)
+    retries = policy.retries if retries is None else retries
+    timeout = kwargs.pop("timeout", policy.timeout)
+    attempt = 0
+    while True:
+        remaining = _check_budget(url)
+        if rate_limiter.acquire(key, max_wait=remaining) is None:
+            raise BudgetExceeded(f"Rate limit wait for {key} exceeds the time budget")
+        session = get_session(url, cloudflare=cloudflare, browser=browser)
+        try:
+            response = session.request(
+                method, url, timeout=_cap_timeout(timeout, budget_remaining()), **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            _track(error=exc)
+            if attempt >= retries:
+                raise
+        else:
+            _track(response)
+            rate_limiter.observe(
+                key, response.status_code, response.headers.get("Retry-After"))
+            retryable = response.status_code in policy.retry_statuses or (
+                retry_if is not None and retry_if(response))
+            if not retryable or attempt >= retries:
+                return response
+            response.close()
+        delay = policy.delay(attempt)
+        remaining = budget_remaining()
+        if remaining is not None:
+            delay = min(delay, max(remaining, 0.0))
+        time.sleep(delay)
+        attempt += 1
+        if on_retry is not None:
+            on_retry()
+
+
+def http_get(url, **kwargs):
+    return http_request("GET", url, **kwargs)
+
+
+def http_post(url, **kwargs):
+    return http_request("POST", url, **kwargs)
+
+# --------------------- Conditional Feed Fetching ---------------------
+
+
+def set_feed_cache(store):
+    """Install the validator store (``get_feed_cache``/``store_feed_cache``)."""
+    global _feed_cache
+    _feed_cache = store
+
+
+def _result_succeeded(result):
+    if isinstance(result, dict):
+        return bool(result.get("success", True))
+    if isinstance(result, (list, tuple)):
+        return len(result) < 3 or bool(result[2])
+    return result is not None
+
+
+def fetch_feed(url, parse, cache_key=None, **kwargs):
+    """GET a feed with ETag/Last-Modified validators.
+
+    ``parse`` receives the response body and returns the scrape result. On a
+    304 the previously parsed result is returned without calling ``parse``.
+    Only successful results that came with validators are cached.
+    """
+    store = _feed_cache
+    cache_key = cache_key or url
+    cached = store.get_feed_cache(cache_key) if store else None
+    headers = dict(kwargs.pop("headers", None) or {})
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = http_get(url, headers=headers, **kwargs)
+    if response.status_code == 304 and cached:
+        result = cached["result"]
+        return tuple(result) if isinstance(result, list) else result
+    response.raise_for_status()
+
+    result = parse(response.content)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if store and (etag or last_modified) and _result_succeeded(result):
+        store.store_feed_cache(cache_key, etag, last_modified, result)
+    return result
@@ -2,9 +2,10 @@ import datetime
 import re
 from urllib.parse import urljoin
 
-import cloudscraper
 from bs4 import BeautifulSoup
 
+from scraper_utils import http_get
+
 DOMAINS = ["audiobookbay.lu"]
 SUPPORTS_FREE_TOGGLE = False
 SCRAPER_NAME = "AudioBook Bay"
@@ -19,6 +20,7 @@ DEFAULT_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
 }
+CLOUDSCRAPER_BROWSER = {"browser": "chrome", "platform": "windows", "desktop": True}
 
 
 def normalize_url(url):
@@ -50,13 +52,13 @@ def scrape(url, free_only=False):
     if not source_url:
         return "Invalid URL", timestamp, False, "Empty URL"
 
-    scraper = cloudscraper.create_scraper(
-        browser={"browser": "chrome", "platform": "windows", "desktop": True}
-    )
-    scraper.headers.update(DEFAULT_HEADERS)
-
     try:
-        response = scraper.get(source_url, timeout=20)
+        response = http_get(
+            source_url,
+            cloudflare=True,
+            browser=CLOUDSCRAPER_BROWSER,
+            headers=DEFAULT_HEADERS,
+        )
         response.raise_for_status()
     except Exception as exc:  # noqa: BLE001
         return "Connection error", timestamp, False, str(exc)
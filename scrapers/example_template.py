@@ -44,6 +44,14 @@ Recommended formats:
 The scraper_utils module will normalize either shape for you.
 
 Tips for scraping:
+  * Fetch pages through `scraper_utils.http_get`/`http_post` rather than
+    bare `requests`; they reuse a keep-alive session per host. Pass
+    `cloudflare=True` for Cloudflare-protected sites so the clearance
+    cookies are shared between links on the same host.
+  * Don't add your own timeouts or retry loops: requests get the timeouts,
+    retries and backoff of the site's retry policy (the `retry_policy` and
+    `retry_policy_overrides` settings) and stop once the link's time budget
+    is spent.
   * Start by using a browser’s inspector to locate the elements containing
     the latest chapter and release date. Prefer stable CSS selectors or IDs.
   * Guard against missing data: wrap lookups in try/except and surface
@@ -52,14 +60,19 @@ Tips for scraping:
   * Prefer RSS/JSON feeds when available; they are easier to parse, load
     faster, and usually include timestamped updates. Use `feedparser` or
     `xml.etree.ElementTree` to traverse RSS feeds.
+  * For feeds, wrap the parsing in a function and call
+    `scraper_utils.fetch_feed(feed_url, parse)`. It sends
+    If-None-Match/If-Modified-Since and, on a 304, returns the previously
+    parsed result without calling `parse` again.
   * Normalize timestamps to the `YYYY/MM/DD` pattern expected by the app
     (see `scraper_utils.parse_timestamp`).
 
 Optional Selenium fallback:
-  * If the page requires JavaScript rendering, you can instantiate
-    `BrowserManager.get_driver()` (from `scraping.py`) and let it fetch the
-    fully rendered DOM. Remember to call `BrowserManager.quit_driver()` once
-    you are done, or rely on the existing shutdown logic.
+  * If the page requires JavaScript rendering, borrow a driver with
+    `with BrowserManager.checkout() as driver:` (from `scraping.py`) and let
+    it fetch the fully rendered DOM. Drivers come from a small shared pool
+    and go back to it when the block exits; don't quit them yourself. The
+    pool recycles worn-out drivers and stops idle ones on its own.
   * Drawbacks: Selenium is heavier, slower, and harder to run in
     headless environments; it also complicates deployments because you need
     a compatible browser/driver combo. Always try HTTP requests first and
@@ -94,7 +107,7 @@ def scrape(url: str, free_only: bool = False) -> Union[Dict, Tuple]:
     """
     # 1. Try to fetch via HTTP/requests.
     # 2. If you detect a paywall or missing data, you may fallback to
-    #    BrowserManager.get_driver() for rendering the page (see docstring).
+    #    BrowserManager.checkout() for rendering the page (see docstring).
     # 3. Always return the latest chapter & timestamp info.
 
     # Mocked response for documentation purposes:
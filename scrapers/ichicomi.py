@@ -6,6 +6,8 @@ from urllib.parse import urljoin
 import requests
 from bs4 import BeautifulSoup
 
+from scraper_utils import fetch_feed, http_get
+
 DOMAINS = ["ichicomi.com"]
 SUPPORTS_FREE_TOGGLE = True
 SCRAPER_NAME = "Ichicomi"
@@ -13,75 +15,99 @@ SCRAPER_NAME = "Ichicomi"
 FREE_ONLY_DEFAULT = True
 
 
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/117.0 Safari/537.36"
+    ),
+    "Referer": "https://ichicomi.com/",
+}
+
+# Series page URL -> discovered RSS feed URL; feed locations do not move.
+_rss_urls = {}
+
+
+def find_rss_url(url):
+    if url in _rss_urls:
+        return _rss_urls[url]
+    page = http_get(url, headers=HEADERS)
+    soup = BeautifulSoup(page.text, "html.parser")
+    rss_link = soup.find("link", rel="alternate",
+                         type="application/rss+xml")
+    if not rss_link or not rss_link.get("href"):
+        return None
+    rss_url = urljoin("https://ichicomi.com", rss_link["href"])
+    _rss_urls[url] = rss_url
+    return rss_url
+
+
+def parse_feed(content, free_only, url=None):
+    latest_chapter = "No chapters found"
+    timestamp = datetime.datetime.now().strftime("%Y/%m/%d")
+
+    rss_soup = BeautifulSoup(content, "xml")
+    items = rss_soup.find_all("item")
+
+    selected_item = None
+    if free_only:
+        for item in items:
+            if item.find("giga:freeTermStartDate"):
+                selected_item = item
+                break
+    else:
+        selected_item = items[0] if items else None
+
+    if not selected_item:
+        msg = "No chapter matching free_only criteria"
+        logging.info("%s for %s", msg, url)
+        return latest_chapter, timestamp, False, msg
+
+    item_title = selected_item.find("title")
+    if item_title and item_title.text:
+        latest_chapter = item_title.text.strip()
+
+    date_text = None
+    free_term_tag = selected_item.find("giga:freeTermStartDate")
+    if free_term_tag and free_term_tag.text:
+        date_text = free_term_tag.text.strip()
+    else:
+        pub_date_tag = selected_item.find("pubDate")
+        date_text = pub_date_tag.text.strip() if pub_date_tag and pub_date_tag.text else None
+
+    if date_text:
+        try:
+            parsed_date = parsedate_to_datetime(date_text)
+        except (TypeError, ValueError) as date_err:
+            logging.warning(
+                "Could not parse date from RSS for %s: %s", url, date_err
+            )
+        else:
+            timestamp = parsed_date.strftime("%Y/%m/%d")
+    return latest_chapter, timestamp, True, None
+
+
 def scrape(url, free_only=False):
     latest_chapter = "No chapters found"
     timestamp = datetime.datetime.now().strftime("%Y/%m/%d")
-    success = False
     error = None
 
     free_only = free_only if free_only is not None else FREE_ONLY_DEFAULT
 
-    HEADERS = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/117.0 Safari/537.36"
-        ),
-        "Referer": "https://ichicomi.com/",
-    }
-
     try:
-        page = requests.get(url, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(page.text, "html.parser")
-        rss_link = soup.find("link", rel="alternate",
-                             type="application/rss+xml")
-        if not rss_link or not rss_link.get("href"):
+        rss_url = find_rss_url(url)
+        if not rss_url:
             msg = "RSS feed link missing"
             logging.warning(
                 "%s for %s, cannot check for new chapters", msg, url)
             return latest_chapter, timestamp, False, msg
 
-        rss_url = urljoin("https://ichicomi.com", rss_link["href"])
-        rss_page = requests.get(rss_url, headers=HEADERS, timeout=10)
-        rss_soup = BeautifulSoup(rss_page.content, "xml")
-        items = rss_soup.find_all("item")
-
-        selected_item = None
-        if free_only:
-            for item in items:
-                if item.find("giga:freeTermStartDate"):
-                    selected_item = item
-                    break
-        else:
-            selected_item = items[0] if items else None
-
-        if not selected_item:
-            msg = "No chapter matching free_only criteria"
-            logging.info("%s for %s", msg, url)
-            return latest_chapter, timestamp, False, msg
-
-        item_title = selected_item.find("title")
-        if item_title and item_title.text:
-            latest_chapter = item_title.text.strip()
-
-        date_text = None
-        free_term_tag = selected_item.find("giga:freeTermStartDate")
-        if free_term_tag and free_term_tag.text:
-            date_text = free_term_tag.text.strip()
-        else:
-            pub_date_tag = selected_item.find("pubDate")
-            date_text = pub_date_tag.text.strip() if pub_date_tag and pub_date_tag.text else None
-
-        if date_text:
-            try:
-                parsed_date = parsedate_to_datetime(date_text)
-            except (TypeError, ValueError) as date_err:
-                logging.warning(
-                    "Could not parse date from RSS for %s: %s", url, date_err
-                )
-            else:
-                timestamp = parsed_date.strftime("%Y/%m/%d")
-        success = True
+        return fetch_feed(
+            rss_url,
+            lambda content: parse_feed(content, free_only, url),
+            cache_key=f"{rss_url}#free_only={int(bool(free_only))}",
+            headers=HEADERS,
+        )
     except requests.RequestException as rss_error:
         error = f"Failed to fetch RSS feed: {rss_error}"
         logging.warning(error)
@@ -89,4 +115,4 @@ def scrape(url, free_only=False):
         error = f"Error scraping {url}: {e}"
         logging.error(error)
 
-    return latest_chapter, timestamp, success, error
+    return latest_chapter, timestamp, False, error
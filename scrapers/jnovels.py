@@ -3,7 +3,7 @@ import datetime
 import requests
 from bs4 import BeautifulSoup
 
-from scraper_utils import parse_timestamp
+from scraper_utils import http_get, parse_timestamp
 
 DOMAINS = ["jnovels.com"]
 SUPPORTS_FREE_TOGGLE = False
@@ -13,7 +13,7 @@ SCRAPER_NOTES = ["Supports search query URLs"]
 
 def scrape(url, free_only=False):
     try:
-        response = requests.get(url, timeout=15)
+        response = http_get(url)
     except requests.RequestException:
         return (
             "Connection error",
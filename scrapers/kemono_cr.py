@@ -3,6 +3,8 @@ import datetime
 import requests
 from dateutil import parser
 
+from scraper_utils import http_get
+
 DOMAINS = ["kemono.cr"]
 SUPPORTS_FREE_TOGGLE = False
 SCRAPER_NAME = "Kemono"
@@ -12,9 +14,8 @@ def scrape(url, free_only=False):
     timestamp = datetime.datetime.now().strftime("%Y/%m/%d")
     api_url = url.replace("kemono.cr", "kemono.cr/api/v1") + "/posts"
     try:
-        response = requests.get(
-            api_url, headers={"User-Agent": "Mozilla/5.0", "Accept": "text/css"},
-            timeout=15
+        response = http_get(
+            api_url, headers={"User-Agent": "Mozilla/5.0", "Accept": "text/css"}
         )
         data = response.json()
     except (requests.RequestException, ValueError):
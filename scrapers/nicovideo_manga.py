@@ -7,6 +7,8 @@ from urllib.parse import urlparse
 import requests
 from bs4 import BeautifulSoup
 
+from scraper_utils import fetch_feed
+
 DOMAINS = ["manga.nicovideo.jp"]
 SUPPORTS_FREE_TOGGLE = False
 SCRAPER_NAME = "Nico Nico Manga"
@@ -60,32 +62,11 @@ def _strip_series_prefix(item_title: str, series_title: str):
     return suffix or normalized_title
 
 
-def scrape(url, free_only=False):
+def _parse_feed(content, rss_url=None):
     latest_chapter = "No chapters found"
     timestamp = datetime.datetime.now().strftime("%Y/%m/%d")
 
-    rss_url = _build_rss_url(url)
-    if not rss_url:
-        return (
-            latest_chapter,
-            timestamp,
-            False,
-            "Unable to parse comic ID from URL",
-            None,
-        )
-
-    try:
-        response = requests.get(
-            rss_url,
-            headers={"User-Agent": "Mozilla/5.0"},
-            timeout=15,
-        )
-        response.raise_for_status()
-    except requests.RequestException as exc:
-        logging.warning("Failed to fetch Nico Nico Manga RSS %s: %s", rss_url, exc)
-        return latest_chapter, timestamp, False, f"Failed to fetch RSS feed: {exc}", None
-
-    soup = BeautifulSoup(response.content, "xml")
+    soup = BeautifulSoup(content, "xml")
     latest_item = soup.find("item")
     if not latest_item:
         return latest_chapter, timestamp, False, "No RSS item found", None
@@ -119,3 +100,28 @@ def scrape(url, free_only=False):
             error = f"Unable to parse pubDate: {exc}"
 
     return latest_chapter, timestamp, True, error, chapter_url
+
+
+def scrape(url, free_only=False):
+    latest_chapter = "No chapters found"
+    timestamp = datetime.datetime.now().strftime("%Y/%m/%d")
+
+    rss_url = _build_rss_url(url)
+    if not rss_url:
+        return (
+            latest_chapter,
+            timestamp,
+            False,
+            "Unable to parse comic ID from URL",
+            None,
+        )
+
+    try:
+        return fetch_feed(
+            rss_url,
+            lambda content: _parse_feed(content, rss_url),
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+    except requests.RequestException as exc:
+        logging.warning("Failed to fetch Nico Nico Manga RSS %s: %s", rss_url, exc)
+        return latest_chapter, timestamp, False, f"Failed to fetch RSS feed: {exc}", None
@@ -1,9 +1,8 @@
 import datetime
 
-import cloudscraper
 from bs4 import BeautifulSoup
 
-from scraper_utils import parse_timestamp
+from scraper_utils import http_get, parse_timestamp
 
 DOMAINS = ["novelupdates.com"]
 SUPPORTS_FREE_TOGGLE = False
@@ -11,9 +10,8 @@ SCRAPER_NAME = "Novel Updates"
 
 def scrape(url, free_only=False):
     # use cloudscraper to bypass Cloudflare
-    scraper = cloudscraper.create_scraper()
     try:
-        response = scraper.get(url, timeout=15)
+        response = http_get(url, cloudflare=True)
     except Exception:
         return (
             "Connection error",
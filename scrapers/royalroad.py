@@ -3,28 +3,16 @@ import datetime
 import requests
 from bs4 import BeautifulSoup, Tag
 
+from scraper_utils import fetch_feed
+
 DOMAINS = ["royalroad.com"]
 SUPPORTS_FREE_TOGGLE = False
 SCRAPER_NAME = "Royal Road"
 
 
-def scrape(url, free_only=False):
-    success = False
-    error = None
+def parse_feed(content):
     timestamp = datetime.datetime.now().strftime("%Y/%m/%d")
-    url_parts = url.split("/")
-    if len(url_parts) > 4:
-        api_url = f"https://www.royalroad.com/fiction/syndication/{url_parts[4]}"
-    else:
-        error = "Invalid RoyalRoad URL"
-        return "Invalid RoyalRoad URL", timestamp, False, error
-
-    try:
-        response = requests.get(api_url, timeout=15).content
-    except requests.RequestException as e:
-        return "Connection error", timestamp, False, str(e)
-
-    soup = BeautifulSoup(response, "xml")
+    soup = BeautifulSoup(content, "xml")
     channel = soup.find("channel")
     if not isinstance(channel, Tag):
         return "No channel found", timestamp, False, "No channel found"
@@ -62,14 +50,28 @@ def scrape(url, free_only=False):
         chapter_url = (
             link_tag.get_text(strip=True) if isinstance(link_tag, Tag) else None
         )
-        
-        success = True
+
         return {
             "last_found": chapter_title,
             "timestamp": timestamp,
-            "success": success,
+            "success": True,
             "error": None,
             "last_found_url": chapter_url,
         }
 
     return "No chapters found", timestamp, False, "No chapters found"
+
+
+def scrape(url, free_only=False):
+    timestamp = datetime.datetime.now().strftime("%Y/%m/%d")
+    url_parts = url.split("/")
+    if len(url_parts) > 4:
+        api_url = f"https://www.royalroad.com/fiction/syndication/{url_parts[4]}"
+    else:
+        error = "Invalid RoyalRoad URL"
+        return "Invalid RoyalRoad URL", timestamp, False, error
+
+    try:
+        return fetch_feed(api_url, parse_feed)
+    except requests.RequestException as e:
+        return "Connection error", timestamp, False, str(e)
@@ -1,12 +1,12 @@
 import datetime
 import re
-import time
 from urllib.parse import urljoin, urlparse
 
-import cloudscraper
 import requests
 from bs4 import BeautifulSoup
 
+from scraper_utils import http_request, reset_session
+
 DOMAINS = ["scribblehub.com"]
 SUPPORTS_FREE_TOGGLE = False
 SCRAPER_NAME = "Scribble Hub"
@@ -25,14 +25,13 @@ DEFAULT_HEADERS = {
     "Referer": "https://www.scribblehub.com/",
     "X-Requested-With": "XMLHttpRequest",
 }
+CLOUDSCRAPER_BROWSER = {"browser": "chrome", "platform": "windows", "mobile": False}
 
 
-def build_scraper():
-    session = cloudscraper.create_scraper(
-        browser={"browser": "chrome", "platform": "windows", "mobile": False}
-    )
-    session.headers.update(DEFAULT_HEADERS)
-    return session
+def cloudflare_request(method, url, **kwargs):
+    # Shared per-host session, so Cloudflare clearance survives between links.
+    return http_request(
+        method, url, cloudflare=True, browser=CLOUDSCRAPER_BROWSER, **kwargs)
 
 
 def extract_series_id(url):
@@ -52,21 +51,15 @@ def build_series_url(source_url, series_id):
     return f"{scheme}://{host}/series/{series_id}/"
 
 
-def request_with_retry(scraper, method, url, attempts=2, **kwargs):
-    last_error = None
-    for attempt in range(attempts):
-        try:
-            response = scraper.request(method, url, timeout=20, **kwargs)
-            if response.status_code in {403, 503} and attempt < attempts - 1:
-                time.sleep(1.0)
-                continue
-            response.raise_for_status()
-            return response, None
-        except requests.RequestException as exc:
-            last_error = exc
-            if attempt < attempts - 1:
-                time.sleep(1.0)
-    return None, last_error
+def fetch_page(method, url, **kwargs):
+    # Retries on Cloudflare 403s come from the scribblehub.com retry policy.
+    kwargs.setdefault("headers", DEFAULT_HEADERS)
+    try:
+        response = cloudflare_request(method, url, **kwargs)
+        response.raise_for_status()
+    except requests.RequestException as exc:
+        return None, exc
+    return response, None
 
 
 def extract_chapter_id(chapter_url):
@@ -158,40 +151,52 @@ def pick_latest_from_links(chapter_links, base_url):
     return chapters[0]
 
 
-def fetch_toc_via_api(series_url, series_id, attempts=3):
+def _empty_toc(response):
+    return response.ok and response.text.strip() in ("", "0")
+
+
+def fetch_toc_via_api(series_url, series_id):
     data = {
         "action": "wi_getreleases_pagination",
         "mypostid": series_id,
         "pagenum": 1,
     }
-    last_error = None
-    for attempt in range(attempts):
-        scraper = build_scraper()
-        scraper.headers["Referer"] = series_url
+    headers = {**DEFAULT_HEADERS, "Referer": series_url}
+
+    def prime_session():
+        # The series page sets the cookies the TOC endpoint expects; a failure
+        # here is left to the POST, so it is not retried.
         try:
-            try:
-                scraper.get(series_url, timeout=20)
-            except requests.RequestException:
-                pass
-            response = scraper.post(TOC_API_URL, data=data, timeout=20)
-            if response.status_code in {403, 503} and attempt < attempts - 1:
-                time.sleep(1.5)
-                continue
-            response.raise_for_status()
-            text = response.text.strip()
-            if not text or text == "0":
-                raise ValueError("Empty TOC response")
-            return text, None
-        except Exception as exc:  # noqa: BLE001
-            last_error = exc
-            if attempt < attempts - 1:
-                time.sleep(1.5)
-    return None, last_error
-
-
-def fetch_full_page(series_url, attempts=3):
-    scraper = build_scraper()
-    response, error = request_with_retry(scraper, "GET", series_url, attempts=attempts)
+            cloudflare_request("GET", series_url, headers=headers, retries=0)
+        except requests.RequestException:
+            pass
+
+    def fresh_session():
+        # Retry from a fresh Cloudflare challenge.
+        reset_session(TOC_API_URL, cloudflare=True)
+        prime_session()
+
+    prime_session()
+    try:
+        response = cloudflare_request(
+            "POST",
+            TOC_API_URL,
+            data=data,
+            headers=headers,
+            on_retry=fresh_session,
+            retry_if=_empty_toc,
+        )
+        response.raise_for_status()
+    except Exception as exc:  # noqa: BLE001
+        return None, exc
+    text = response.text.strip()
+    if not text or text == "0":
+        return None, ValueError("Empty TOC response")
+    return text, None
+
+
+def fetch_full_page(series_url):
+    response, error = fetch_page("GET", series_url)
     if response is None:
         return None, error
     return response.text, None
@@ -5,6 +5,8 @@ from urllib.parse import unquote, urlparse
 import requests
 from bs4 import BeautifulSoup
 
+from scraper_utils import fetch_feed
+
 DOMAINS = ["alert.shop-bell.com"]
 SUPPORTS_FREE_TOGGLE = False
 SCRAPER_NAME = "Shop Bell Alert"
@@ -49,19 +51,9 @@ def unwrap_rss_link(link):
     return link
 
 
-def scrape(url, free_only=False):
+def parse_feed(content):
     timestamp = datetime.datetime.now().strftime("%Y/%m/%d")
-    rss_url = to_rss_url(url)
-    if not rss_url:
-        return "Invalid Shop Bell URL", timestamp, False, "Unable to parse series ID"
-
-    try:
-        response = requests.get(rss_url, timeout=15)
-        response.raise_for_status()
-    except requests.RequestException as exc:
-        return "Connection error", timestamp, False, str(exc)
-
-    soup = BeautifulSoup(response.content, "xml")
+    soup = BeautifulSoup(content, "xml")
     latest_item = soup.find("item")
     if not latest_item:
         return "No chapters found", timestamp, False, "No RSS item found"
@@ -91,3 +83,15 @@ def scrape(url, free_only=False):
             pass
 
     return chapter_text, timestamp, True, None, chapter_url
+
+
+def scrape(url, free_only=False):
+    timestamp = datetime.datetime.now().strftime("%Y/%m/%d")
+    rss_url = to_rss_url(url)
+    if not rss_url:
+        return "Invalid Shop Bell URL", timestamp, False, "Unable to parse series ID"
+
+    try:
+        return fetch_feed(rss_url, parse_feed)
+    except requests.RequestException as exc:
+        return "Connection error", timestamp, False, str(exc)
@@ -8,6 +8,8 @@ from urllib.parse import urlparse
 import requests
 from bs4 import BeautifulSoup
 
+from scraper_utils import fetch_feed
+
 DOMAINS = ["web-ace.jp"]
 SUPPORTS_FREE_TOGGLE = False
 SCRAPER_NAME = "Web Ace"
@@ -21,12 +23,39 @@ def _extract_series_id(url: str) -> Optional[str]:
     return match.group(1) if match else None
 
 
-def scrape(url, free_only=False):
+def _parse_feed(content, url=None):
     latest_chapter = "No chapters found"
     timestamp = datetime.datetime.now().strftime("%Y/%m/%d")
-    success = False
     error = None
 
+    soup = BeautifulSoup(content, "xml")
+    latest_item = soup.find("item")
+    if not latest_item:
+        return latest_chapter, timestamp, False, "No RSS items"
+
+    title_tag = latest_item.find("title")
+    if title_tag and title_tag.text:
+        raw_title = title_tag.text.strip()
+        bracket_match = re.match(r"^\[([^\]]+)\]", raw_title)
+        latest_chapter = bracket_match.group(
+            1) if bracket_match else raw_title
+
+    pub_date_tag = latest_item.find("pubDate")
+    if pub_date_tag and pub_date_tag.text:
+        try:
+            parsed_date = parsedate_to_datetime(pub_date_tag.text.strip())
+        except (TypeError, ValueError) as err:
+            logging.warning("Unable to parse pubDate for %s: %s", url, err)
+            error = f"Unable to parse pubDate: {err}"
+        else:
+            timestamp = parsed_date.strftime("%Y/%m/%d")
+    return latest_chapter, timestamp, True, error
+
+
+def scrape(url, free_only=False):
+    latest_chapter = "No chapters found"
+    timestamp = datetime.datetime.now().strftime("%Y/%m/%d")
+
     series_id = _extract_series_id(url)
     if not series_id:
         logging.warning("Unable to parse series ID from %s", url)
@@ -35,33 +64,12 @@ def scrape(url, free_only=False):
     rss_url = RSS_TEMPLATE.format(series_id=series_id)
 
     try:
-        response = requests.get(
-            rss_url, headers={"User-Agent": "Mozilla/5.0"}, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, "xml")
-        latest_item = soup.find("item")
-        if not latest_item:
-            return latest_chapter, timestamp, False, "No RSS items"
-
-        title_tag = latest_item.find("title")
-        if title_tag and title_tag.text:
-            raw_title = title_tag.text.strip()
-            bracket_match = re.match(r"^\[([^\]]+)\]", raw_title)
-            latest_chapter = bracket_match.group(
-                1) if bracket_match else raw_title
-
-        pub_date_tag = latest_item.find("pubDate")
-        if pub_date_tag and pub_date_tag.text:
-            try:
-                parsed_date = parsedate_to_datetime(pub_date_tag.text.strip())
-            except (TypeError, ValueError) as err:
-                logging.warning("Unable to parse pubDate for %s: %s", url, err)
-                error = f"Unable to parse pubDate: {err}"
-            else:
-                timestamp = parsed_date.strftime("%Y/%m/%d")
-        success = True
-        return latest_chapter, timestamp, success, error
+        return fetch_feed(
+            rss_url,
+            lambda content: _parse_feed(content, url),
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
     except requests.RequestException as exc:
         logging.warning("Failed to fetch RSS feed %s: %s", rss_url, exc)
 
-    return latest_chapter, timestamp, success, error
+    return latest_chapter, timestamp, False, None
@@ -4,6 +4,8 @@ from urllib.parse import quote, unquote, urljoin, urlparse, urlunparse
 import requests
 from bs4 import BeautifulSoup
 
+from scraper_utils import http_get
+
 DOMAINS = ["z-lib.fm,z-lib.gd,articles.sk,1lib.sk,z-library.sk,z-lib.gs"]
 SUPPORTS_FREE_TOGGLE = False
 SCRAPER_NAME = "Z-Library"
@@ -43,7 +45,7 @@ def scrape(url, free_only=False):
         )
 
     try:
-        response = requests.get(search_url, timeout=20)
+        response = http_get(search_url)
         response.raise_for_status()
     except requests.RequestException as exc:
         return "Connection error", timestamp, False, str(exc)
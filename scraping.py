@@ -1,32 +1,83 @@
 import importlib
+import json
+import os
 import pkgutil
 import logging
 import datetime
 import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import contextmanager
+from functools import lru_cache
 
 import scrapers
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-
-from scraper_utils import needs_update
-
+import telemetry
+
+from scraper_utils import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    close_sessions,
+    configure_sessions,
+    needs_update,
+    rate_limiter,
+    request_budget,
+    retry_policies,
+    set_rate_limit_resolver,
+    track_requests,
+    url_host,
+)
+
+from circuit_breaker import DEFAULT_COOLDOWN, DEFAULT_FAILURE_THRESHOLD, CircuitBreaker
+from rate_limiter import DEFAULT_BURST, DEFAULT_RATE
 from db_store import DEFAULT_UPDATE_FREQUENCY
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_PER_DOMAIN = 2
+DEFAULT_LINK_TIME_BUDGET = 120  # seconds of HTTP time per link
+
 updating_categories = set()
 _updating_lock = threading.Lock()
+# Scrapes in flight per domain across every running update
+_domain_slots = defaultdict(int)
+_domain_slots_changed = threading.Condition()
+DOMAIN_SLOT_POLL_SECONDS = 0.5
+_queued_links = 0
 socketio = None  # Set externally
+remote_updates = None  # Set externally; returns categories scrape workers are updating
+telemetry_store = None  # Set externally; receives record_scrape_attempts()
+circuit_breaker = CircuitBreaker()
+link_time_budget = DEFAULT_LINK_TIME_BUDGET
 
 
-def is_update_in_progress(category=None):
+def queued_links():
+    """Links waiting for a scrape worker across all running updates."""
+    with _updating_lock:
+        return _queued_links
+
+
+def _adjust_queue(delta):
+    global _queued_links
     with _updating_lock:
-        if category:
-            return category in updating_categories
-        return len(updating_categories) > 0
+        _queued_links += delta
+
+
+def updating_category_names():
+    """Categories being scraped in this process."""
+    with _updating_lock:
+        return set(updating_categories)
+
+
+def is_update_in_progress(category=None):
+    local = updating_category_names()
+    if category and category in local or not category and local:
+        return True
+    if remote_updates is None:
+        return False
+    remote = remote_updates()
+    return category in remote if category else bool(remote)
 
 
 def category_room_name(category=None):
@@ -36,12 +87,83 @@ def category_room_name(category=None):
 # --------------------- Selenium Manager ---------------------
 
 
+DEFAULT_BROWSER_POOL_SIZE = 2
+BROWSER_MAX_USES = 50
+BROWSER_MAX_MEMORY_MB = 512
+BROWSER_IDLE_TIMEOUT = 300
+
+
+def _installed_chrome_version():
+    try:
+        from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+
+
+def resolve_chromedriver_path(cache_path=None):
+    """Return a chromedriver path, reusing the on-disk cache until Chrome's version changes."""
+    version = _installed_chrome_version()
+    cached = {}
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as handle:
+                cached = json.load(handle)
+        except (OSError, ValueError):
+            cached = {}
+    path = cached.get("path")
+    if path and cached.get("chrome_version") == version and os.path.exists(path):
+        return path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    if cache_path:
+        try:
+            with open(cache_path, "w", encoding="utf-8") as handle:
+                json.dump({"chrome_version": version, "path": path}, handle)
+        except OSError as exc:
+            logger.warning("Could not cache chromedriver path: %s", exc)
+    return path
+
+
 class BrowserManager:
-    _instance = None
-    _lock = threading.Lock()
-    _usage_lock = threading.Lock()
+    """Bounded pool of headless Chrome drivers shared by Selenium scrapers."""
+    _cond = threading.Condition()
+    _idle = []
+    _total = 0
+    _generation = 0
+    _reaper = None
+    _live = set()
+    pool_size = DEFAULT_BROWSER_POOL_SIZE
+    max_uses = BROWSER_MAX_USES
+    max_memory_mb = BROWSER_MAX_MEMORY_MB
+    idle_timeout = BROWSER_IDLE_TIMEOUT
+    driver_cache_path = None
+    _driver_path = None
+    _driver_path_lock = threading.Lock()
+
+    def __init__(self, generation=0):
+        self.driver = self._create_driver()
+        self.generation = generation
+        self.uses = 0
+        self.started = self.last_used = time.monotonic()
+        with self._cond:
+            self._live.add(self)
+
+    @classmethod
+    def _chromedriver_path(cls):
+        with cls._driver_path_lock:
+            if cls._driver_path is None:
+                cls._driver_path = resolve_chromedriver_path(cls.driver_cache_path)
+            return cls._driver_path
+
+    @classmethod
+    def _create_driver(cls):
+        # Selenium is only imported once a plugin actually asks for a browser.
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service as ChromeService
 
-    def __init__(self):
         options = Options()
         # Headless Chrome mode
         # Use the new headless mode (Chrome 109+)
@@ -75,36 +197,153 @@ class BrowserManager:
 
         # Suppress logs
         options.add_argument("--log-level=3")
-        self.driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
+        driver = webdriver.Chrome(
+            service=ChromeService(cls._chromedriver_path()),
             options=options
         )
-        self.driver.set_page_load_timeout(30)
-        self.driver.set_script_timeout(30)
+        driver.set_page_load_timeout(30)
+        driver.set_script_timeout(30)
+        return driver
+
+    def is_healthy(self):
+        try:
+            self.driver.current_url
+        except Exception:
+            return False
+        return True
+
+    def memory_mb(self):
+        """JS heap usage of the current page in MB, or None if unavailable."""
+        try:
+            used = self.driver.execute_script(
+                "return performance.memory ? performance.memory.usedJSHeapSize : null")
+        except Exception:
+            return None
+        return used / (1024 * 1024) if isinstance(used, (int, float)) else None
+
+    def quit(self):
+        with self._cond:
+            self._live.discard(self)
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+    @classmethod
+    def uptimes(cls):
+        """Seconds each running driver has been alive, oldest first."""
+        now = time.monotonic()
+        with cls._cond:
+            return sorted((now - entry.started for entry in cls._live), reverse=True)
 
     @classmethod
-    def get_driver(cls):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = BrowserManager()
-            return cls._instance.driver
+    def configure(cls, pool_size=None, max_uses=None, max_memory_mb=None, idle_timeout=None):
+        with cls._cond:
+            if pool_size:
+                cls.pool_size = max(1, int(pool_size))
+            if max_uses:
+                cls.max_uses = max(1, int(max_uses))
+            if max_memory_mb:
+                cls.max_memory_mb = max(1, int(max_memory_mb))
+            if idle_timeout:
+                cls.idle_timeout = max(1, int(idle_timeout))
+            cls._cond.notify_all()
+
+    @classmethod
+    def _acquire(cls):
+        while True:
+            with cls._cond:
+                while not cls._idle and cls._total >= cls.pool_size:
+                    cls._cond.wait()
+                if not cls._idle:
+                    cls._total += 1
+                    generation = cls._generation
+                    break
+                entry = cls._idle.pop()
+            if entry.is_healthy():
+                return entry
+            logger.info("Discarding unresponsive browser")
+            entry.quit()
+            with cls._cond:
+                cls._total -= 1
+                cls._cond.notify()
+        try:
+            entry = cls(generation)
+        except Exception:
+            with cls._cond:
+                cls._total -= 1
+                cls._cond.notify()
+            raise
+        cls._start_reaper()
+        return entry
+
+    @classmethod
+    def _release(cls, entry):
+        entry.uses += 1
+        entry.last_used = time.monotonic()
+        retire = entry.uses >= cls.max_uses
+        if not retire:
+            memory = entry.memory_mb()
+            retire = memory is not None and memory >= cls.max_memory_mb
+        retire = retire or not entry.is_healthy()
+        with cls._cond:
+            # Checked under the lock so a reset cannot slip in before the append.
+            if not retire and entry.generation == cls._generation:
+                cls._idle.append(entry)
+                cls._cond.notify()
+                return
+        entry.quit()
+        with cls._cond:
+            cls._total -= 1
+            cls._cond.notify()
 
     @classmethod
     @contextmanager
-    def locked_driver(cls):
-        """Provides a thread-safe way to use the shared driver."""
-        with cls._usage_lock:
-            yield cls.get_driver()
+    def checkout(cls):
+        """Borrow a driver from the pool for the duration of the block."""
+        entry = cls._acquire()
+        try:
+            yield entry.driver
+        finally:
+            cls._release(entry)
+
+    locked_driver = checkout
+
+    @classmethod
+    def _start_reaper(cls):
+        with cls._cond:
+            if cls._reaper is not None and cls._reaper.is_alive():
+                return
+            cls._reaper = threading.Thread(
+                target=cls._reap_idle, name="browser-reaper", daemon=True)
+            cls._reaper.start()
+
+    @classmethod
+    def _reap_idle(cls):
+        while True:
+            with cls._cond:
+                if cls._total == 0:
+                    cls._reaper = None
+                    return
+                cls._cond.wait(min(cls.idle_timeout, 60))
+                cutoff = time.monotonic() - cls.idle_timeout
+                expired = [e for e in cls._idle if e.last_used <= cutoff]
+                cls._idle = [e for e in cls._idle if e.last_used > cutoff]
+                cls._total -= len(expired)
+            for entry in expired:
+                logger.info("Stopping idle browser")
+                entry.quit()
 
     @classmethod
     def quit_driver(cls):
-        with cls._lock:
-            if cls._instance:
-                try:
-                    cls._instance.driver.quit()
-                except Exception:
-                    pass
-                cls._instance = None
+        """Stop idle browsers; checked-out ones are stopped on return."""
+        with cls._cond:
+            cls._generation += 1
+            idle, cls._idle = cls._idle, []
+            cls._total -= len(idle)
+            cls._cond.notify_all()
+        for entry in idle:
+            entry.quit()
 
 # --------------------- Scraper Plugins ---------------------
 
@@ -161,9 +400,48 @@ def load_scraper_plugins():
 
     if not registry:
         logger.warning("No scraper plugins were loaded.")
+    _install_domain_index(registry)
     return registry
 
 
+def build_domain_index(registry):
+    """Map every host suffix a plugin declares to its registry key.
+
+    Registry keys may list several comma-separated hosts; each one is
+    indexed separately.
+    """
+    index = {}
+    for key in registry:
+        for domain in str(key).split(","):
+            domain = domain.strip().lower().strip(".")
+            if domain:
+                index.setdefault(domain, key)
+    return index
+
+
+_domain_index = {"registry": None, "index": {}}
+_domain_index_lock = threading.Lock()
+
+
+def _install_domain_index(registry):
+    with _domain_index_lock:
+        _domain_index["index"] = build_domain_index(registry)
+        _domain_index["registry"] = registry
+        _resolve_domain.cache_clear()
+
+
+@lru_cache(maxsize=4096)
+def _resolve_domain(url):
+    index = _domain_index["index"]
+    labels = url_host(url).split(".")
+    # Longest suffix first, so "alert.shop-bell.com" beats "shop-bell.com".
+    for start in range(len(labels)):
+        key = index.get(".".join(labels[start:]))
+        if key is not None:
+            return key
+    return None
+
+
 SCRAPERS = load_scraper_plugins()
 
 
@@ -183,10 +461,19 @@ def get_supported_sites():
 
 
 def _find_scraper_for_url(url: str):
-    for domain, plugin in SCRAPERS.items():
-        if domain in url:
-            return plugin
-    return None
+    domain = _domain_for_url(url)
+    return SCRAPERS.get(domain) if domain is not None else None
+
+
+def _domain_for_url(url: str):
+    if _domain_index["registry"] is not SCRAPERS:
+        # The registry was swapped out (e.g. reloaded); rebuild the index.
+        _install_domain_index(SCRAPERS)
+    return _resolve_domain(url)
+
+
+# Requests share a rate limit per plugin domain rather than per host.
+set_rate_limit_resolver(_domain_for_url)
 
 
 def supports_free_toggle(url: str):
@@ -201,7 +488,32 @@ def entry_due_for_scrape(link, entry, force_update=False):
     return needs_update(link["url"], {link["url"]: entry}, freq, False)
 
 
-def process_link(link, entry, force_update=False):
+SITE_FAILURE_STATUSES = {403, 429}
+
+
+def is_site_failure(error):
+    """Whether a tracked request error (see ``track_requests``) means the site is unwell.
+
+    Exceptions (timeouts, connection errors, budget overruns), 5xx, 403 and
+    429 count; other HTTP statuses such as a 404 for one series do not.
+    """
+    if not error:
+        return False
+    if not error.startswith("HTTP "):
+        return True
+    try:
+        status = int(error[len("HTTP "):])
+    except ValueError:
+        return True
+    return status >= 500 or status in SITE_FAILURE_STATUSES
+
+
+def process_link(link, entry, force_update=False, attempts=None):
+    """Scrape one link, returning ``(data, failure)``.
+
+    Each scrape attempt is appended to ``attempts`` when given (so callers
+    can store a batch), otherwise written to ``telemetry_store`` directly.
+    """
     if not entry_due_for_scrape(link, entry, force_update):
         free_flag = link.get("free_only", entry.get("free_only", True))
         return (
@@ -215,12 +527,44 @@ def process_link(link, entry, force_update=False):
             None,
         )
 
-    try:
-        result = scrape_website(link)
-    except Exception as exc:
-        logger.error("Error scraping %s: %s", link["url"], exc)
-        return None, {link["url"]: {"error": str(exc)}}
+    url = link["url"]
+    domain = _domain_for_url(url)
+    started_at = time.time()
+    started = time.perf_counter()
+    if domain is not None and not circuit_breaker.allow(domain):
+        _record_attempt(attempts, url, started_at, 0.0, None, telemetry.CIRCUIT_OPEN)
+        return None, {url: {
+            "error": f"Domain unavailable: {domain} (circuit open)",
+            "domain_unavailable": True,
+        }}
+
+    with track_requests() as stats:
+        try:
+            with request_budget(link_time_budget):
+                result = scrape_website(link)
+        except Exception as exc:
+            logger.error("Error scraping %s: %s", url, exc)
+            if domain is not None:
+                circuit_breaker.record_failure(domain)
+            stats["error"] = type(exc).__name__
+            _record_attempt(
+                attempts, url, started_at, time.perf_counter() - started, stats, telemetry.ERROR)
+            return None, {url: {"error": str(exc)}}
     chapter, timestamp, success, error, chapter_url = normalize_scrape_result(result)
+    _record_attempt(
+        attempts,
+        url,
+        started_at,
+        time.perf_counter() - started,
+        stats,
+        telemetry.SUCCESS if success else telemetry.FAILURE,
+    )
+    if domain is not None:
+        # Content failures (no chapters, removed series) say nothing about the site.
+        if not success and is_site_failure(stats["error"]):
+            circuit_breaker.record_failure(domain)
+        else:
+            circuit_breaker.record_success(domain)
     if success:
         return (
             {
@@ -232,14 +576,49 @@ def process_link(link, entry, force_update=False):
             },
             None,
         )
-    return None, {link["url"]: {"error": error or f"No data returned from {link['url']}", }}
+    return None, {url: {"error": error or f"No data returned from {url}", }}
+
+
+def _record_attempt(attempts, url, started_at, seconds, stats, outcome):
+    plugin = _find_scraper_for_url(url)
+    stats = stats or {}
+    error_class = None
+    if outcome == telemetry.CIRCUIT_OPEN:
+        error_class = "CircuitOpen"
+    elif outcome != telemetry.SUCCESS:
+        error_class = stats.get("error") or "ScrapeFailed"
+    attempt = {
+        "url": url,
+        "plugin": (plugin or {}).get("display_name") or _domain_for_url(url) or "Unsupported",
+        "domain": url_host(url),
+        "started_at": started_at,
+        "duration_ms": round(seconds * 1000, 1),
+        "requests": stats.get("requests", 0),
+        "bytes": stats.get("bytes", 0),
+        "outcome": outcome,
+        "error_class": error_class,
+    }
+    if attempts is not None:
+        attempts.append(attempt)
+    else:
+        flush_attempts([attempt])
+
+
+def flush_attempts(attempts):
+    store = telemetry_store
+    if store is None or not attempts:
+        return
+    try:
+        store.record_scrape_attempts(attempts)
+    except Exception:
+        logger.exception("Failed to store scrape telemetry")
 
 
 def scrape_website(link):
     url = link["url"]
-    for domain, plugin in SCRAPERS.items():
-        if domain in url:
-            return plugin["scraper"](url, free_only=link.get("free_only", False))
+    plugin = _find_scraper_for_url(url)
+    if plugin:
+        return plugin["scraper"](url, free_only=link.get("free_only", False))
     return (
         "Unsupported website",
         datetime.datetime.now().strftime("%Y/%m/%d"),
@@ -277,21 +656,95 @@ def normalize_scrape_result(result):
     return chapter, timestamp, success, error, chapter_url
 
 
-def scrape_all_links(links, previous_data, force_update=False, category=None):
+def _claim_domain_slot(domain, limit):
+    with _domain_slots_changed:
+        if _domain_slots[domain] >= limit:
+            return False
+        _domain_slots[domain] += 1
+        return True
+
+
+def _release_domain_slot(domain):
+    with _domain_slots_changed:
+        _domain_slots[domain] -= 1
+        if not _domain_slots[domain]:
+            del _domain_slots[domain]
+        _domain_slots_changed.notify_all()
+
+
+def _scrape_concurrently(pending, on_result, max_workers, max_per_domain, attempts=None):
+    """Drain per-domain queues without exceeding the global or domain caps.
+
+    The domain cap is shared with every other update running in this
+    process, so concurrent categories never double the load on a site.
+    """
+    in_flight = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape") as executor:
+            while pending or in_flight:
+                for domain in list(pending):
+                    queue = pending[domain]
+                    while (
+                        queue
+                        and len(in_flight) < max_workers
+                        and _claim_domain_slot(domain, max_per_domain)
+                    ):
+                        link, entry = queue.popleft()
+                        _adjust_queue(-1)
+                        # Due-ness was already checked by the caller.
+                        future = executor.submit(process_link, link, entry, True, attempts)
+                        in_flight[future] = (domain, link)
+                    if not queue:
+                        del pending[domain]
+                if not in_flight:
+                    # Other updates hold every slot of the domains left.
+                    with _domain_slots_changed:
+                        _domain_slots_changed.wait(DOMAIN_SLOT_POLL_SECONDS)
+                    continue
+                # Time out while domains wait on slots other updates may free.
+                done, _ = wait(
+                    in_flight,
+                    timeout=DOMAIN_SLOT_POLL_SECONDS if pending else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    domain, link = in_flight.pop(future)
+                    _release_domain_slot(domain)
+                    try:
+                        data, failure = future.result()
+                    except Exception as exc:
+                        logger.error("Error scraping %s: %s", link["url"], exc)
+                        data, failure = None, {link["url"]: {"error": str(exc)}}
+                    on_result(link, data, failure)
+    finally:
+        # The executor has finished these by now; hand their slots back.
+        for domain, _ in in_flight.values():
+            _release_domain_slot(domain)
+
+
+def scrape_all_links(
+    links,
+    previous_data,
+    force_update=False,
+    category=None,
+    max_workers=None,
+    max_per_domain=None,
+):
     category_name = (category or "main")
     with _updating_lock:
         updating_categories.add(category_name)
-    
+
     new_data = {}
     failures = {}
+    attempts = []
     total_links = len(links)
     processed = 0
     room = category_room_name(category)
-    category_name = (category or "main")
+    max_workers = max(1, int(max_workers or DEFAULT_MAX_WORKERS))
+    max_per_domain = max(1, int(max_per_domain or DEFAULT_MAX_PER_DOMAIN))
 
-    for link in links:
-        entry = previous_data.get(link["url"], {})
-        data, failure = process_link(link, entry, force_update)
+    def on_result(link, data, failure):
+        nonlocal processed
         processed += 1
         if socketio:
             socketio.emit(
@@ -309,13 +762,104 @@ def scrape_all_links(links, previous_data, force_update=False, category=None):
         if failure:
             failures.update(failure)
 
-    with _updating_lock:
-        updating_categories.discard(category_name)
+    pending = defaultdict(deque)
+    queued = 0
+    try:
+        for link in links:
+            entry = previous_data.get(link["url"], {})
+            if entry_due_for_scrape(link, entry, force_update):
+                pending[_domain_for_url(link["url"])].append((link, entry))
+                continue
+            data, failure = process_link(link, entry, force_update, attempts)
+            on_result(link, data, failure)
+        queued = sum(len(queue) for queue in pending.values())
+        _adjust_queue(queued)
+        if pending:
+            _scrape_concurrently(
+                pending,
+                on_result,
+                max_workers,
+                max_per_domain,
+                attempts,
+            )
+    finally:
+        if queued:
+            # Links left behind by an aborted run no longer count as queued.
+            _adjust_queue(-sum(len(queue) for queue in pending.values()))
+        with _updating_lock:
+            updating_categories.discard(category_name)
+        flush_attempts(attempts)
     logger.info("Scraping all links completed.")
     return new_data, failures
 
+# --------------------- Runtime Settings ---------------------
+
+
+def get_int_setting(settings, key, default, minimum=1):
+    try:
+        return max(minimum, int(settings.get(key, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def get_json_setting(settings, key):
+    try:
+        value = json.loads(settings.get(key) or "{}")
+    except ValueError:
+        logger.warning("Ignoring invalid %s setting", key)
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+# Settings a scrape worker needs; the only ones sent to remote workers.
+RUNTIME_SETTINGS = (
+    "rate_limit_rps", "rate_limit_burst", "rate_limit_overrides",
+    "retry_policy", "retry_policy_overrides", "link_time_budget_seconds",
+    "circuit_failure_threshold", "circuit_cooldown_seconds",
+    "http_pool_connections", "http_pool_maxsize",
+    "browser_pool_size", "browser_max_uses", "browser_max_memory_mb", "browser_idle_timeout",
+    "scrape_max_workers", "scrape_max_per_domain",
+)
+
+
+def configure_runtime(settings):
+    """Apply the stored scraper settings (rate limits, retries, pools, ...)."""
+    global link_time_budget
+    try:
+        rate = max(0.01, float(settings.get("rate_limit_rps", DEFAULT_RATE)))
+    except (TypeError, ValueError):
+        rate = DEFAULT_RATE
+    rate_limiter.configure(
+        rate=rate,
+        burst=get_int_setting(settings, "rate_limit_burst", DEFAULT_BURST),
+        overrides=get_json_setting(settings, "rate_limit_overrides"),
+    )
+    retry_policies.configure(
+        default=get_json_setting(settings, "retry_policy"),
+        overrides=get_json_setting(settings, "retry_policy_overrides"),
+    )
+    link_time_budget = get_int_setting(
+        settings, "link_time_budget_seconds", DEFAULT_LINK_TIME_BUDGET, minimum=0)
+    circuit_breaker.configure(
+        failure_threshold=get_int_setting(
+            settings, "circuit_failure_threshold", DEFAULT_FAILURE_THRESHOLD),
+        cooldown=get_int_setting(settings, "circuit_cooldown_seconds", DEFAULT_COOLDOWN),
+    )
+    configure_sessions(
+        pool_connections=get_int_setting(
+            settings, "http_pool_connections", DEFAULT_POOL_CONNECTIONS),
+        pool_maxsize=get_int_setting(settings, "http_pool_maxsize", DEFAULT_POOL_MAXSIZE),
+    )
+    BrowserManager.configure(
+        pool_size=get_int_setting(settings, "browser_pool_size", DEFAULT_BROWSER_POOL_SIZE),
+        max_uses=get_int_setting(settings, "browser_max_uses", BROWSER_MAX_USES),
+        max_memory_mb=get_int_setting(settings, "browser_max_memory_mb", BROWSER_MAX_MEMORY_MB),
+        idle_timeout=get_int_setting(settings, "browser_idle_timeout", BROWSER_IDLE_TIMEOUT),
+    )
+
 # --------------------- Pipeline ---------------------
 
 
 def shutdown_scraper():
     BrowserManager.quit_driver()
+    close_sessions()
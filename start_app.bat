@@ -2,21 +2,36 @@
 setlocal
 cd /d "%~dp0"
 
+REM "start_app.bat worker" also starts a scrape worker process and switches
+REM the app to worker mode; "start_app.bat worker-only" starts just the worker.
+set "MODE=%~1"
+
 REM Check if virtual environment exists
 if exist .venv\Scripts\pythonw.exe (
     echo Starting Chapter Tracker using virtual environment...
-    start "" ".venv\Scripts\pythonw.exe" new_chapters.py
+    set "PYTHONW=.venv\Scripts\pythonw.exe"
 ) else (
     echo Virtual environment not found, trying system pythonw...
     where pythonw >nul 2>nul
-    if %ERRORLEVEL% equ 0 (
-        start "" pythonw new_chapters.py
-    ) else (
+    if errorlevel 1 (
         echo Error: pythonw.exe not found. Please ensure Python is installed and in your PATH.
         pause
         exit /b 1
     )
+    set "PYTHONW=pythonw"
+)
+
+if /i "%MODE%"=="worker" (
+    echo Starting scrape worker...
+    start "" "%PYTHONW%" scrape_worker.py --enable
+) else if /i "%MODE%"=="worker-only" (
+    echo Starting scrape worker...
+    start "" "%PYTHONW%" scrape_worker.py --enable
+    goto :started
 )
+start "" "%PYTHONW%" new_chapters.py
+
+:started
 
 echo.
 echo Chapter Tracker is now running in the background.
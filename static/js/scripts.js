@@ -396,6 +396,12 @@ socket.on("update_progress", function (data) {
   const fill = document.getElementById("progressFill");
   const percent = (data.current / data.total) * 100;
   fill.style.width = percent + "%";
+  // Scrape workers store each batch as it finishes.
+  if (data.refresh) {
+    refreshChapterTables().catch((error) =>
+      console.error("Error refreshing chapters during update:", error)
+    );
+  }
 });
 
 socket.on("update_complete", function (data) {
@@ -2187,6 +2193,10 @@ document.addEventListener("DOMContentLoaded", function () {
   const saveAdvancedBtn = document.getElementById("saveAdvancedSettingsBtn");
   const settingShareLocal = document.getElementById("settingShareLocal");
   const settingPort = document.getElementById("settingPort");
+  const settingAdaptivePolling = document.getElementById("settingAdaptivePolling");
+  const settingAdaptiveMinHours = document.getElementById("settingAdaptiveMinHours");
+  const settingAdaptiveMaxHours = document.getElementById("settingAdaptiveMaxHours");
+  const settingScrapeWorker = document.getElementById("settingScrapeWorker");
   const settingPasswordProtected = document.getElementById("settingPasswordProtected");
   const settingPassword = document.getElementById("settingPassword");
   const passwordFields = document.getElementById("passwordFields");
@@ -2272,6 +2282,10 @@ document.addEventListener("DOMContentLoaded", function () {
 
     settingShareLocal.checked = settings.share_local;
     settingPort.value = settings.port;
+    settingAdaptivePolling.checked = settings.adaptive_polling;
+    settingAdaptiveMinHours.value = settings.adaptive_min_hours;
+    settingAdaptiveMaxHours.value = settings.adaptive_max_hours;
+    settingScrapeWorker.checked = settings.scrape_mode === "worker";
     settingPasswordProtected.checked = settings.password_protected;
     passwordFields.classList.toggle("hidden", !settings.password_protected);
     settingPassword.value = "";
@@ -2292,6 +2306,10 @@ document.addEventListener("DOMContentLoaded", function () {
     const payload = {
       share_local: settingShareLocal.checked,
       port: settingPort.value,
+      adaptive_polling: settingAdaptivePolling.checked,
+      adaptive_min_hours: settingAdaptiveMinHours.value,
+      adaptive_max_hours: settingAdaptiveMaxHours.value,
+      scrape_mode: settingScrapeWorker.checked ? "worker" : "inline",
       password_protected: settingPasswordProtected.checked,
       password: settingPassword.value,
     };
@@ -13,7 +13,7 @@ REM we can try to find the process that has the script name in its command line.
 REM However, taskkill doesn't support command line filtering easily.
 REM We'll use PowerShell for a more precise kill if needed.
 
-powershell -Command "Get-Process pythonw -ErrorAction SilentlyContinue | Where-Object { $_.CommandLine -like '*new_chapters.py*' } | Stop-Process -Force"
+powershell -Command "Get-Process pythonw -ErrorAction SilentlyContinue | Where-Object { $_.CommandLine -like '*new_chapters.py*' -or $_.CommandLine -like '*scrape_worker.py*' } | Stop-Process -Force"
 
 echo.
 echo If the app was running, it has been stopped.
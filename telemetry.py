@@ -0,0 +1,69 @@
+import bisect
+import math
+
+# Upper bounds (ms) of the latency histogram buckets; the last is open-ended.
+LATENCY_BUCKETS_MS = (
+    100, 250, 500, 1000, 2000, 3000, 5000, 7500, 10000,
+    15000, 20000, 30000, 60000, 120000, math.inf,
+)
+PERCENTILES = (50, 95, 99)
+
+SUCCESS = "success"
+FAILURE = "failure"
+ERROR = "error"
+CIRCUIT_OPEN = "circuit_open"
+
+
+def bucket_index(duration_ms):
+    return bisect.bisect_left(LATENCY_BUCKETS_MS, max(0.0, duration_ms))
+
+
+def histogram(durations_ms):
+    counts = [0] * len(LATENCY_BUCKETS_MS)
+    for duration in durations_ms:
+        counts[bucket_index(duration)] += 1
+    return counts
+
+
+def merge_histograms(target, counts):
+    for index, count in enumerate(counts[:len(target)]):
+        target[index] += count
+    return target
+
+
+def percentile(counts, pct):
+    """Estimate the ``pct`` percentile (ms) from histogram bucket counts.
+
+    Values are interpolated linearly inside the bucket the rank falls in;
+    ranks in the open-ended last bucket report its lower bound.
+    """
+    total = sum(counts)
+    if not total:
+        return None
+    rank = pct / 100 * total
+    seen = 0
+    for index, count in enumerate(counts):
+        if count and seen + count >= rank:
+            lower = LATENCY_BUCKETS_MS[index - 1] if index else 0
+            upper = LATENCY_BUCKETS_MS[index]
+            if math.isinf(upper):
+                return float(lower)
+            return lower + (upper - lower) * (rank - seen) / count
+        seen += count
+    return float(LATENCY_BUCKETS_MS[-2])
+
+
+def summarize(group):
+    """Turn an aggregated group (counts plus histogram) into report fields."""
+    attempts = group["attempts"]
+    summary = {
+        "attempts": attempts,
+        "failures": group["failures"],
+        "failure_rate": group["failures"] / attempts if attempts else 0.0,
+        "requests": group["requests"],
+        "bytes": group["bytes"],
+    }
+    for pct in PERCENTILES:
+        value = percentile(group["histogram"], pct)
+        summary[f"p{pct}_ms"] = round(value, 1) if value is not None else None
+    return summary
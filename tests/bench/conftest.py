@@ -0,0 +1,72 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+import requests
+
+import scraper_utils
+from rate_limiter import RateLimiter
+from retry_policy import RetryPolicies
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+UPDATE_ENV = "BENCH_UPDATE_BASELINE"
+
+_results = {}
+
+
+class OfflineSession:
+    """Stands in for the shared HTTP session, serving canned bodies by URL."""
+
+    def __init__(self, responses):
+        self.responses = responses
+
+    def request(self, method, url, **kwargs):
+        response = requests.Response()
+        response.url = url
+        response.encoding = "utf-8"
+        body = self.responses.get(url)
+        response.status_code = 200 if body is not None else 404
+        response._content = body if body is not None else b""
+        return response
+
+
+@pytest.fixture
+def offline_transport(monkeypatch):
+    """Route the shared fetch API to canned responses; returns an installer."""
+    monkeypatch.setattr(scraper_utils, "_feed_cache", None)
+    monkeypatch.setattr(scraper_utils, "retry_policies", RetryPolicies())
+    monkeypatch.setattr(
+        scraper_utils, "rate_limiter", RateLimiter(rate=1e6, burst=1000, sleep=lambda s: None))
+
+    def install(responses):
+        session = OfflineSession(responses)
+        monkeypatch.setattr(scraper_utils, "get_session", lambda *args, **kwargs: session)
+
+    return install
+
+
+@pytest.fixture
+def bench_results():
+    return _results
+
+
+@pytest.fixture(scope="session")
+def baseline():
+    if BASELINE_PATH.exists():
+        return json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    return {}
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+    terminalreporter.section("plugin benchmarks")
+    terminalreporter.write_line(
+        f"{'plugin':<40} {'time ms':>9} {'peak KiB':>9} {'allocs':>8}")
+    for name, result in sorted(_results.items()):
+        terminalreporter.write_line(
+            f"{name[:40]:<40} {result['time_ms']:>9.2f} {result['peak_kb']:>9.1f} {result['allocations']:>8}")
+    if os.environ.get(UPDATE_ENV):
+        BASELINE_PATH.write_text(json.dumps(_results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        terminalreporter.write_line(f"Baseline written to {BASELINE_PATH}")
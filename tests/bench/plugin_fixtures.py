@@ -0,0 +1,270 @@
+"""Canned responses for benchmarking every scraper plugin offline.
+
+Each case lists the URL handed to the plugin, the responses its requests
+get (keyed by URL, query string included) and the chapter it should find.
+Payloads are built in each site's markup, sized like busy real pages.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+NEWEST = datetime(2025, 11, 17, 10, 0, tzinfo=timezone.utc)
+
+
+def _dates(count, step_days=1):
+    return [NEWEST - timedelta(days=index * step_days) for index in range(count)]
+
+
+def _rss(title, items, namespaces=""):
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"{namespaces}><channel>'
+        f"<title>{title}</title><link>https://example.invalid/</link>"
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def nyaa_feed(count=1000):
+    items = [
+        f"<item><title>[Group] Series - {count - i:04d} [1080p].mkv</title>"
+        f"<link>https://nyaa.si/download/{2000000 - i}.torrent</link>"
+        f'<guid isPermaLink="true">https://nyaa.si/view/{2000000 - i}</guid>'
+        f"<pubDate>{when.strftime('%a, %d %b %Y %H:%M:%S +0000')}</pubDate>"
+        f"<nyaa:seeders>{i % 97}</nyaa:seeders><nyaa:leechers>{i % 13}</nyaa:leechers>"
+        f"<nyaa:infoHash>{i:040x}</nyaa:infoHash><nyaa:size>1.4 GiB</nyaa:size>"
+        f"<description><![CDATA[<a href=\"https://nyaa.si/view/{2000000 - i}\">#{2000000 - i}</a>]]></description>"
+        "</item>"
+        for i, when in enumerate(_dates(count, step_days=0.25))
+    ]
+    return _rss("Nyaa - Series", items, ' xmlns:nyaa="https://nyaa.si/xmlns/nyaa"')
+
+
+def scribblehub_toc(count=3000):
+    rows = [
+        f'<li class="toc_w" order="{count - i}">'
+        f'<a href="https://www.scribblehub.com/read/123456-series/chapter/{900000 + count - i}/" '
+        f'class="toc_a">Chapter {count - i}: A Long Chapter Title Goes Here</a>'
+        f'<span class="fic_date_pub" title="{when.strftime("%b %d, %Y")}">{when.strftime("%b %d, %Y")}</span>'
+        "</li>"
+        for i, when in enumerate(_dates(count))
+    ]
+    filler = "".join(
+        f'<div class="wi_fic_desc"><p>Synopsis paragraph {i} with some text.</p></div>'
+        for i in range(200)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Series | Scribble Hub</title></head><body>"
+        f'<div class="fic_title">Series</div>{filler}'
+        f'<div class="wi_fic_table toc"><ol class="toc_ol">{"".join(rows)}</ol></div>'
+        "</body></html>"
+    ).encode("utf-8")
+
+
+def royalroad_feed(count=400):
+    items = [
+        f"<item><title>The Series - Chapter {count - i}</title>"
+        f"<link>https://www.royalroad.com/fiction/12345/the-series/chapter/{700000 + count - i}</link>"
+        f"<pubDate>{when.strftime('%a, %d %b %Y %H:%M:%S GMT')}</pubDate>"
+        f"<description>Chapter {count - i} of The Series</description></item>"
+        for i, when in enumerate(_dates(count))
+    ]
+    return _rss("The Series", items)
+
+
+def weekly_items(count, item_title, link):
+    return [
+        f"<item><title>{item_title.format(n=count - i)}</title>"
+        f"<link>{link.format(n=count - i)}</link>"
+        f"<guid>{link.format(n=count - i)}</guid>"
+        f"<pubDate>{format_datetime(when)}</pubDate></item>"
+        for i, when in enumerate(_dates(count, step_days=7))
+    ]
+
+
+def ichicomi_page():
+    return (
+        "<html><head>"
+        '<link rel="alternate" type="application/rss+xml" href="/rss/series/3269754496561191231">'
+        "</head><body>" + "<div class='episode'>Episode</div>" * 300 + "</body></html>"
+    ).encode("utf-8")
+
+
+def ichicomi_feed(count=150):
+    items = weekly_items(count, "Episode {n}", "https://ichicomi.com/episode/{n}")
+    # Only the newest half are free to read.
+    free = f"<giga:freeTermStartDate>{format_datetime(NEWEST)}</giga:freeTermStartDate></item>"
+    items = [
+        item.replace("</item>", free) if index < count // 2 else item
+        for index, item in enumerate(items)
+    ]
+    return _rss("Ichicomi Series", items, ' xmlns:giga="https://gigaviewer.com"')
+
+
+def html_posts(count=60):
+    posts = [
+        '<div class="post-container">'
+        f'<h1 class="post-title"><a href="https://jnovels.com/volume-{count - i}-epub/">'
+        f"Light Novel Volume {count - i} [EPUB]</a></h1>"
+        f'<time class="updated" datetime="{when.strftime("%Y-%m-%dT%H:%M:%S+00:00")}">{when:%B %d, %Y}</time>'
+        + "<p>Download links and description text.</p>" * 5
+        + "</div>"
+        for i, when in enumerate(_dates(count))
+    ]
+    return f"<html><body>{''.join(posts)}</body></html>".encode("utf-8")
+
+
+def kemono_posts(count=50):
+    return json.dumps([
+        {
+            "id": str(5000 + count - i),
+            "user": "12345",
+            "service": "fanbox",
+            "title": f"Post {count - i}",
+            "content": "<p>" + "text " * 200 + "</p>",
+            "published": when.strftime("%Y-%m-%dT%H:%M:%S"),
+            "attachments": [{"name": f"{n}.png", "path": f"/data/{i}/{n}.png"} for n in range(10)],
+        }
+        for i, when in enumerate(_dates(count))
+    ]).encode("utf-8")
+
+
+def novelupdates_page(count=300):
+    rows = [
+        f"<tr><td>{when:%m/%d/%y}</td><td><a>Group</a></td>"
+        f'<td><a class="chp-release"><span>c{count - i}</span></a></td></tr>'
+        for i, when in enumerate(_dates(count))
+    ]
+    return (
+        '<html><body><table id="myTable"><thead><tr><th>Date</th></tr></thead>'
+        f"<tbody>{''.join(rows)}</tbody></table></body></html>"
+    ).encode("utf-8")
+
+
+def rawkuma_page():
+    return (
+        "<html><body>"
+        '<div id="chapter-list" hx-get="https://rawkuma.net/wp-admin/admin-ajax.php?action=chapter_list&manga_id=4242&page=1"></div>'
+        + "<div class='bixbox'>Related series</div>" * 200
+        + "</body></html>"
+    ).encode("utf-8")
+
+
+def rawkuma_chapters(count=500):
+    rows = [
+        f'<div data-chapter-number="{count - i}"><a href="https://rawkuma.net/series/chapter-{count - i}/">'
+        f'<span>Chapter {count - i}</span><time datetime="{when:%Y-%m-%dT%H:%M:%S}">{when:%B %d, %Y}</time></a></div>'
+        for i, when in enumerate(_dates(count))
+    ]
+    return "".join(rows).encode("utf-8")
+
+
+def audiobookbay_page(count=15):
+    posts = [
+        '<div class="post"><div class="postTitle">'
+        f'<h2><a href="/abss/audiobook-{count - i}/">Audiobook Title {count - i}</a></h2></div>'
+        f"<div class='postContent'><p>Format: M4B</p></div>"
+        f"<div class='postInfo'>Posted: {when.day} {when:%b %Y}</div></div>"
+        for i, when in enumerate(_dates(count))
+    ]
+    return f"<html><body><div id='content'>{''.join(posts)}</div></body></html>".encode("utf-8")
+
+
+def zlib_page(count=50):
+    cards = [
+        f'<z-bookcard href="/book/{100000 + count - i}/abc.html" id="{i}">'
+        f'<div slot="title">Book Title {count - i}</div><div slot="author">Author</div></z-bookcard>'
+        for i in range(count)
+    ]
+    return (
+        f"<html><body><div id='searchResultBox'>{''.join(cards)}</div></body></html>"
+    ).encode("utf-8")
+
+
+def weekly_feed(title, count, item_title, link):
+    return _rss(title, weekly_items(count, item_title, link))
+
+
+CASES = {
+    "alert.shop-bell.com": {
+        "url": "https://alert.shop-bell.com/ranobe/detail/1234/",
+        "responses": {
+            "https://alert.shop-bell.com/rss/ranobe/1234.rss": weekly_feed(
+                "Series", 120, "Series Volume {n}",
+                "https://alert.shop-bell.com/rsslink.html?https%3A%2F%2Fstore.example%2F{n}"),
+        },
+        "chapter": "Volume 120",
+    },
+    "audiobookbay.lu": {
+        "url": "https://audiobookbay.lu/?s=series",
+        "responses": {"https://audiobookbay.lu/?s=series": audiobookbay_page()},
+        "chapter": "Audiobook Title 15",
+    },
+    "ichicomi.com": {
+        "url": "https://ichicomi.com/episode/3269754496561191231",
+        "responses": {
+            "https://ichicomi.com/episode/3269754496561191231": ichicomi_page(),
+            "https://ichicomi.com/rss/series/3269754496561191231": ichicomi_feed(),
+        },
+        "chapter": "Episode 150",
+    },
+    "jnovels.com": {
+        "url": "https://jnovels.com/?s=series",
+        "responses": {"https://jnovels.com/?s=series": html_posts()},
+        "chapter": "Light Novel Volume 60 [EPUB]",
+    },
+    "kemono.cr": {
+        "url": "https://kemono.cr/fanbox/user/12345",
+        "responses": {"https://kemono.cr/api/v1/fanbox/user/12345/posts": kemono_posts()},
+        "chapter": "Post 50",
+    },
+    "manga.nicovideo.jp": {
+        "url": "https://manga.nicovideo.jp/comic/68937",
+        "responses": {
+            "https://manga.nicovideo.jp/rss/manga/68937": weekly_feed(
+                "Series - Nico Nico Manga", 200, "Series Episode {n}",
+                "https://manga.nicovideo.jp/watch/mg{n}"),
+        },
+        "chapter": "Episode 200",
+    },
+    "novelupdates.com": {
+        "url": "https://www.novelupdates.com/series/the-series/",
+        "responses": {"https://www.novelupdates.com/series/the-series/": novelupdates_page()},
+        "chapter": "c300",
+    },
+    "nyaa.si": {
+        "url": "https://nyaa.si/?f=0&c=0_0&q=series",
+        "responses": {"https://nyaa.si/?f=0&c=0_0&q=series&page=rss": nyaa_feed()},
+        "chapter": "[Group] Series - 1000 [1080p].mkv",
+    },
+    "rawkuma.net": {
+        "url": "https://rawkuma.net/manga/series/",
+        "responses": {
+            "https://rawkuma.net/manga/series/": rawkuma_page(),
+            "https://rawkuma.net/wp-admin/admin-ajax.php": rawkuma_chapters(),
+        },
+        "chapter": "Chapter 500",
+    },
+    "royalroad.com": {
+        "url": "https://www.royalroad.com/fiction/12345/the-series",
+        "responses": {"https://www.royalroad.com/fiction/syndication/12345": royalroad_feed()},
+        "chapter": "Chapter 400",
+    },
+    "scribblehub.com": {
+        "url": "https://www.scribblehub.com/series/123456/series/",
+        "responses": {"https://www.scribblehub.com/series/123456/": scribblehub_toc()},
+        "chapter": "Chapter 3000: A Long Chapter Title Goes Here",
+    },
+    "web-ace.jp": {
+        "url": "https://web-ace.jp/youngaceup/contents/1000123/",
+        "responses": {
+            "https://web-ace.jp/youngaceup/feed/rss/1000123/": weekly_feed(
+                "Web Ace", 100, "[Episode {n}] Series", "https://web-ace.jp/youngaceup/contents/1000123/episode/{n}/"),
+        },
+        "chapter": "Episode 100",
+    },
+    "z-lib.fm,z-lib.gd,articles.sk,1lib.sk,z-library.sk,z-lib.gs": {
+        "url": "https://z-lib.fm/s/series",
+        "responses": {"https://z-lib.fm/s/series?order=date": zlib_page()},
+        "chapter": "Book Title 50",
+    },
+}
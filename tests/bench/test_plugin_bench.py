@@ -0,0 +1,85 @@
+import gc
+import os
+import statistics
+import time
+import tracemalloc
+
+import pytest
+
+import scraping
+from plugin_fixtures import CASES
+from scrapers import ichicomi
+
+pytestmark = pytest.mark.bench
+
+ROUNDS = 7
+# Timings vary between machines, so only clear slowdowns fail the run.
+TIME_TOLERANCE = 1.5
+TIME_SLACK_MS = 5.0
+MEMORY_TOLERANCE = 1.25
+MEMORY_SLACK_KB = 64.0
+
+
+def _run(plugin, url):
+    # Drop per-process caches so every round does the full work.
+    ichicomi._rss_urls.clear()
+    return scraping.normalize_scrape_result(plugin["scraper"](url, free_only=True))
+
+
+def measure(plugin, url):
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        result = _run(plugin, url)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    # Collect leftovers and hold the collector off so the peak does not
+    # depend on when a collection happens to run, which shifts with
+    # whatever else the process has allocated.
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        _run(plugin, url)
+        _, peak = tracemalloc.get_traced_memory()
+        peak -= start
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    allocations = sum(
+        max(0, stat.count_diff) for stat in after.compare_to(before, "lineno"))
+    return result, {
+        "time_ms": round(statistics.median(timings), 3),
+        "peak_kb": round(peak / 1024, 1),
+        "allocations": allocations,
+    }
+
+
+def test_every_plugin_has_a_fixture():
+    assert sorted(CASES) == sorted(scraping.SCRAPERS)
+
+
+@pytest.mark.parametrize("domain", sorted(CASES))
+def test_plugin_parse_cost(domain, offline_transport, bench_results, baseline):
+    case = CASES[domain]
+    plugin = scraping.SCRAPERS[domain]
+    offline_transport(case["responses"])
+
+    result, stats = measure(plugin, case["url"])
+    bench_results[plugin["display_name"]] = stats
+
+    chapter, _, success, error, _ = result
+    assert success, error
+    assert chapter == case["chapter"]
+
+    expected = baseline.get(plugin["display_name"])
+    if expected is None or os.environ.get("BENCH_UPDATE_BASELINE"):
+        return
+    assert stats["time_ms"] <= expected["time_ms"] * TIME_TOLERANCE + TIME_SLACK_MS, (
+        f"{domain} parse time regressed: {stats['time_ms']}ms vs baseline {expected['time_ms']}ms")
+    assert stats["peak_kb"] <= expected["peak_kb"] * MEMORY_TOLERANCE + MEMORY_SLACK_KB, (
+        f"{domain} peak memory regressed: {stats['peak_kb']}KiB vs baseline {expected['peak_kb']}KiB")
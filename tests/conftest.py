@@ -2,6 +2,8 @@ import sys
 import types
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
@@ -63,3 +65,17 @@ def _ensure_dummy_browser_stack():
 
 
 _ensure_dummy_browser_stack()
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "bench: offline plugin benchmarks, skipped unless selected with -m bench")
+
+
+def pytest_collection_modifyitems(config, items):
+    if "bench" in (config.getoption("markexpr") or ""):
+        return
+    skip_bench = pytest.mark.skip(reason="benchmark; run with -m bench")
+    for item in items:
+        if "bench" in item.keywords:
+            item.add_marker(skip_bench)
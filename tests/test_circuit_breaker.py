@@ -0,0 +1,44 @@
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_opens_after_consecutive_failures_and_probes_once():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=60, clock=clock)
+    breaker.record_failure("example.com")
+    breaker.record_success("example.com")
+    for _ in range(3):
+        assert breaker.allow("example.com")
+        breaker.record_failure("example.com")
+    assert breaker.state("example.com") == OPEN
+    assert not breaker.allow("example.com")
+    assert breaker.allow("other.com")
+
+    clock.now = 61
+    assert breaker.allow("example.com")
+    assert breaker.state("example.com") == HALF_OPEN
+    assert not breaker.allow("example.com")
+
+    breaker.record_success("example.com")
+    assert breaker.state("example.com") == CLOSED
+    assert breaker.allow("example.com")
+
+
+def test_failed_probe_restarts_cooldown():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=60, clock=clock)
+    breaker.record_failure("example.com")
+    clock.now = 60
+    assert breaker.allow("example.com")
+    breaker.record_failure("example.com")
+    assert breaker.state("example.com") == OPEN
+    clock.now = 100
+    assert not breaker.allow("example.com")
+    assert breaker.snapshot()["example.com"]["retry_in"] == 20
@@ -0,0 +1,474 @@
+import datetime
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from db_store import SCRAPE_LINK_MAX_LEASES, ChapterDatabase
+
+
+def test_feed_cache_round_trips_validators_and_result(tmp_path):
+    db = ChapterDatabase(tmp_path / "chapters.db")
+    assert db.get_feed_cache("https://example.com/rss") is None
+
+    db.store_feed_cache(
+        "https://example.com/rss",
+        '"abc"',
+        "Mon, 17 Nov 2025 10:00:00 GMT",
+        ("Chapter 1", "2025/11/17", True, None, "https://example.com/1"),
+    )
+
+    cached = db.get_feed_cache("https://example.com/rss")
+    assert cached["etag"] == '"abc"'
+    assert cached["last_modified"] == "Mon, 17 Nov 2025 10:00:00 GMT"
+    assert cached["result"] == ["Chapter 1", "2025/11/17", True, None, "https://example.com/1"]
+
+
+def _make_db(tmp_path):
+    db = ChapterDatabase(tmp_path / "chapters.db")
+    db.add_link("Series A", "https://example.com/a", "main", 1, False)
+    db.add_link("Series B", "https://example.com/b", "main", 1, False)
+    return db
+
+
+def test_latest_entry_tracks_newest_scrape(tmp_path):
+    db = _make_db(tmp_path)
+    db.update_scraped_entry("https://example.com/a", "Chapter 1", "2025/11/01")
+    db.update_scraped_entry("https://example.com/a", "Chapter 2", "2025/11/08",
+                            last_found_url="https://example.com/a/2")
+
+    data = db.get_scraped_data("main")
+
+    assert data["https://example.com/a"]["last_found"] == "Chapter 2"
+    assert data["https://example.com/a"]["last_found_url"] == "https://example.com/a/2"
+    assert data["https://example.com/a"]["timestamp"] == "2025/11/08"
+    assert data["https://example.com/b"]["last_found"] == "No data"
+    assert db.get_category_unsaved_counts() == {"main": 1}
+
+    db.mark_saved("https://example.com/a")
+
+    data = db.get_scraped_data("main")
+    assert data["https://example.com/a"]["last_saved"] == "Chapter 2"
+    assert data["https://example.com/a"]["last_saved_url"] == "https://example.com/a/2"
+    assert db.get_category_unsaved_counts() == {"main": 0}
+
+
+def test_latest_history_entry_cannot_be_deleted(tmp_path):
+    db = _make_db(tmp_path)
+    db.update_scraped_entry("https://example.com/a", "Chapter 1", "2025/11/01")
+    db.update_scraped_entry("https://example.com/a", "Chapter 2", "2025/11/08")
+    history = db.get_link_history("https://example.com/a")["history"]
+    latest_id, older_id = history[0]["entry_id"], history[1]["entry_id"]
+
+    with pytest.raises(ValueError):
+        db.delete_history_entry("https://example.com/a", latest_id)
+    assert db.delete_history_entry("https://example.com/a", older_id) is True
+    assert db.get_scraped_data("main")["https://example.com/a"]["last_found"] == "Chapter 2"
+
+
+def test_latest_entries_are_backfilled_for_existing_databases(tmp_path):
+    db = _make_db(tmp_path)
+    db.update_scraped_entry("https://example.com/a", "Chapter 1", "2025/11/01")
+    db.update_scraped_entry("https://example.com/a", "Chapter 2", "2025/11/08")
+    db.update_scraped_entry("https://example.com/b", "Episode 5", "2025/11/02")
+    conn = sqlite3.connect(tmp_path / "chapters.db")
+    with conn:
+        conn.execute("DROP TABLE latest_entries")
+    conn.close()
+
+    reopened = ChapterDatabase(tmp_path / "chapters.db")
+    data = reopened.get_scraped_data("main")
+
+    assert data["https://example.com/a"]["last_found"] == "Chapter 2"
+    assert data["https://example.com/b"]["last_found"] == "Episode 5"
+
+
+def test_merge_scraped_writes_batch_in_one_transaction(tmp_path, monkeypatch):
+    db = _make_db(tmp_path)
+    db.update_scraped_entry("https://example.com/b", "Episode 5", "2025/11/02")
+    connect_calls = []
+    original_write = db._write
+
+    def counting_write(*args, **kwargs):
+        connect_calls.append(1)
+        return original_write(*args, **kwargs)
+
+    monkeypatch.setattr(db, "_write", counting_write)
+    db.merge_scraped({
+        "https://example.com/a": {
+            "name": "Renamed A",
+            "last_found": "Chapter 3",
+            "last_found_url": "https://example.com/a/3",
+            "timestamp": "2025/11/09",
+            "free_only": True,
+        },
+        "https://example.com/b": {
+            "last_found": "Episode 5",
+            "timestamp": "2025/11/02",
+        },
+        "https://example.com/missing": {
+            "last_found": "Chapter 1",
+            "timestamp": "2025/11/09",
+        },
+        "https://example.com/skipped": {"last_found": ""},
+    })
+    monkeypatch.undo()
+
+    assert len(connect_calls) == 1
+    data = db.get_scraped_data("main")
+    assert data["https://example.com/a"]["name"] == "Renamed A"
+    assert data["https://example.com/a"]["free_only"] is True
+    assert data["https://example.com/a"]["last_found"] == "Chapter 3"
+    assert data["https://example.com/a"]["last_error"] is None
+    assert data["https://example.com/a"]["last_attempt"]
+    assert data["https://example.com/b"]["name"] == "Series B"
+    assert len(db.get_link_history("https://example.com/b")["history"]) == 1
+
+
+def test_record_failures_stamps_every_link(tmp_path):
+    db = _make_db(tmp_path)
+    db.record_failures({
+        "https://example.com/a": {"error": "timeout"},
+        "https://example.com/b": {"error": "404"},
+    })
+
+    data = db.get_scraped_data("main")
+    assert data["https://example.com/a"]["last_error"] == "timeout"
+    assert data["https://example.com/b"]["last_error"] == "404"
+    assert data["https://example.com/a"]["last_attempt"] == data["https://example.com/b"]["last_attempt"]
+
+
+def test_read_connection_is_reused_per_thread(tmp_path):
+    db = ChapterDatabase(tmp_path / "chapters.db")
+    with db._read("test") as first, db._read("test") as second:
+        assert first is second
+
+    seen = []
+
+    def worker():
+        with db._read("test") as conn:
+            seen.append(conn)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert seen[0] is not first
+
+    # Registering a new reader closes the one owned by the finished thread.
+    with db._read("test"):
+        pass
+    db._local.reader = None
+    with db._read("test"):
+        pass
+    assert all(owner.is_alive() for owner, _ in db._readers.values())
+    with pytest.raises(sqlite3.ProgrammingError):
+        seen[0].execute("SELECT 1")
+
+
+def test_expired_and_closed_connections_are_reopened(tmp_path):
+    db = ChapterDatabase(tmp_path / "chapters.db", connection_max_age=0)
+    with db._read("test") as first:
+        pass
+    with db._read("test") as second:
+        assert second is not first
+
+    db.connection_max_age = 300
+    db.add_link("Series A", "https://example.com/a", "main", 1, False)
+    db.close()
+    assert [link["url"] for link in db.get_links("main")] == ["https://example.com/a"]
+    db.close()
+
+
+def test_change_listeners_receive_affected_categories(tmp_path):
+    db = ChapterDatabase(tmp_path / "chapters.db")
+    db.create_category("manga")
+    db.add_link("Series A", "https://example.com/a", "main", 1, False)
+    db.add_link("Series M", "https://example.com/m", "manga", 1, False)
+    events = []
+    db.add_change_listener(events.append)
+
+    db.update_scraped_entry("https://example.com/m", "Chapter 1", "2025/11/01")
+    db.update_scraped_entry("https://example.com/m", "Chapter 1", "2025/11/01")
+    db.mark_saved("https://example.com/m")
+    db.merge_scraped({"https://example.com/a": {"last_found": "Chapter 2", "timestamp": "2025/11/02"}})
+    db.update_link("https://example.com/a", "https://example.com/a", "Series A", 1, False, category="manga")
+    db.set_category_last_checked("main", "2025-11-02T00:00:00")
+    db.update_category_entry("manga", display_name="Comics")
+
+    assert events == [{"manga"}, {"manga"}, {"main"}, {"main", "manga"}, {"main"}, None]
+
+
+def test_link_queries_can_be_limited_to_urls(tmp_path):
+    db = _make_db(tmp_path)
+    db.update_scraped_entry("https://example.com/b", "Chapter 3", "2025/11/03")
+
+    links = db.get_links("main", urls=["https://example.com/b"])
+    data = db.get_scraped_data("main", urls=["https://example.com/b"])
+    schedule = db.get_link_schedule(urls=["https://example.com/b"])
+
+    assert [link["url"] for link in links] == ["https://example.com/b"]
+    assert list(data) == ["https://example.com/b"]
+    assert schedule[0].pop("next_check_at") is not None
+    assert schedule == [{
+        "url": "https://example.com/b",
+        "category": "main",
+        "update_frequency": 1,
+        "last_attempt": None,
+        "failure_count": 0,
+        "last_found": "Chapter 3",
+        "timestamp": "2025/11/03",
+        "update_interval_hours": 1,
+    }]
+    assert len(db.get_link_schedule("main")) == 2
+    assert db.get_links("main", urls=[]) == []
+
+
+def test_due_links_follow_next_check_at(tmp_path):
+    db = _make_db(tmp_path)
+    now = time.time()
+    assert [link["url"] for link in db.get_due_links("main", now)] == [
+        "https://example.com/a", "https://example.com/b"]
+
+    db.merge_scraped({"https://example.com/a": {
+        "last_found": "Chapter 1", "timestamp": "2099/01/01"}})
+    db.record_failures({"https://example.com/b": {"error": "boom"}})
+
+    assert db.get_due_links("main", now + 60) == []
+    assert [link["url"] for link in db.get_due_links("main", now + 2 * 3600)] == [
+        "https://example.com/b"]
+    assert len(db.get_due_links("main", 4102444800 + 3 * 86400, limit=1)) == 1
+
+    db.update_category_entry("main", update_interval_hours=5)
+    assert db.get_due_links("main", now + 2 * 3600) == []
+
+    with db._read("test") as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT url FROM links WHERE category = ? AND next_check_at <= ?",
+            ("main", now),
+        ).fetchall()
+    assert any("idx_links_due" in row["detail"] for row in plan)
+
+
+def test_next_check_at_backfilled_for_existing_links(tmp_path):
+    path = tmp_path / "chapters.db"
+    db = _make_db(tmp_path)
+    db.close()
+    conn = sqlite3.connect(path)
+    conn.execute("DROP INDEX idx_links_due")
+    conn.execute("UPDATE links SET next_check_at = NULL")
+    conn.commit()
+    conn.close()
+
+    reopened = ChapterDatabase(path)
+    assert len(reopened.get_due_links("main", time.time())) == 2
+
+
+def test_adaptive_polling_uses_release_history(tmp_path):
+    db = _make_db(tmp_path)
+    url = "https://example.com/a"
+    start = datetime.datetime.now() - datetime.timedelta(days=30)
+    for week in range(5):
+        db.update_scraped_entry(
+            url, f"Chapter {week}", "2025/11/01",
+            retrieved_at=(start + datetime.timedelta(days=7 * week)).isoformat())
+    db.record_success(url)
+    fixed = db.get_link_schedule(urls=[url])[0]["next_check_at"]
+
+    db.update_setting("adaptive_polling", "1")
+    db.update_setting("adaptive_max_hours", "24")
+    db.refresh_schedule()
+    adaptive = db.get_link_schedule(urls=[url])[0]["next_check_at"]
+
+    assert adaptive != fixed
+    assert adaptive <= time.time() + 24 * 3600 + 1
+
+
+def test_failing_links_back_off_exponentially_and_reset(tmp_path):
+    db = _make_db(tmp_path)
+    url = "https://example.com/a"
+
+    def next_check():
+        return db.get_link_schedule(urls=[url])[0]["next_check_at"]
+
+    delays = []
+    for _ in range(4):
+        db.record_failures({url: {"error": "404"}})
+        delays.append(round((next_check() - time.time()) / 3600))
+    assert delays == [1, 2, 4, 8]
+
+    db.record_failures({url: {"error": "down", "domain_unavailable": True}})
+    backed_off = db.get_backed_off_links()
+    assert [(row["url"], row["failure_count"]) for row in backed_off] == [(url, 4)]
+
+    assert db.reset_failures([url]) == 1
+    assert db.get_backed_off_links() == []
+    assert round((next_check() - time.time()) / 3600) == 1
+
+    for _ in range(3):
+        db.record_failures({url: {"error": "404"}})
+    db.merge_scraped({url: {"last_found": "Chapter 1", "timestamp": "2025/11/01"}})
+    assert db.get_backed_off_links() == []
+
+
+def _attempt(plugin, started_at, duration_ms, outcome="success"):
+    return {
+        "url": f"https://{plugin}.example/1",
+        "plugin": plugin,
+        "domain": f"{plugin}.example",
+        "started_at": started_at,
+        "duration_ms": duration_ms,
+        "requests": 2,
+        "bytes": 100,
+        "outcome": outcome,
+        "error_class": None if outcome == "success" else "Timeout",
+    }
+
+
+def test_scrape_metrics_combine_raw_attempts_and_hourly_rollups(tmp_path):
+    db = ChapterDatabase(tmp_path / "chapters.db")
+    now = 1_000 * 3600.0
+    old = now - 30 * 3600
+    db.record_scrape_attempts([
+        _attempt("nyaa", old, 200),
+        _attempt("nyaa", old + 60, 4000, "error"),
+        _attempt("nyaa", now - 60, 300),
+        _attempt("royal", now - 60, 900, "failure"),
+    ])
+
+    assert db.rollup_scrape_attempts(raw_hours=24, now=now) == 2
+    # Rolling up again is a no-op.
+    assert db.rollup_scrape_attempts(raw_hours=24, now=now) == 0
+
+    metrics = db.get_scrape_metrics(now - 48 * 3600)
+    nyaa = metrics["plugins"]["nyaa"]
+    assert (nyaa["attempts"], nyaa["failures"], nyaa["requests"], nyaa["bytes"]) == (3, 1, 6, 300)
+    assert round(nyaa["failure_rate"], 3) == 0.333
+    assert nyaa["p50_ms"] <= 500 and nyaa["p99_ms"] > 3000
+    assert metrics["domains"]["royal.example"]["failure_rate"] == 1.0
+
+    recent = db.get_scrape_metrics(now - 3600)
+    assert recent["plugins"]["nyaa"]["attempts"] == 1
+
+    db.rollup_scrape_attempts(raw_hours=24, retention_days=1, now=now + 2 * 86400)
+    assert db.get_scrape_metrics(0) == {"plugins": {}, "domains": {}}
+
+
+def test_query_observer_reports_method_and_kind(tmp_path):
+    db = ChapterDatabase(tmp_path / "chapters.db")
+    seen = []
+    db.set_query_observer(lambda operation, kind, seconds: seen.append((operation, kind, seconds)))
+
+    db.get_settings()
+    db.add_link("Series A", "https://example.com/a", "main", 1, False)
+
+    assert ("get_settings", "read") in [(op, kind) for op, kind, _ in seen]
+    assert ("add_link", "write") in [(op, kind) for op, kind, _ in seen]
+    assert all(seconds >= 0 for _, _, seconds in seen)
+
+    del seen[:]
+    db.get_history_entry("https://example.com/a", 1)
+    assert [(op, kind) for op, kind, _ in seen] == [("get_history_entry", "read")] * 2
+
+
+def test_scrape_jobs_merge_requests_and_lease_links_once(tmp_path):
+    db = ChapterDatabase(tmp_path / "chapters.db")
+    for name in "abc":
+        db.add_link(name, f"https://example.com/{name}", "main", 1, False)
+    db.add_link("m", "https://example.com/m", "manga", 1, False)
+    first = db.enqueue_scrape_job("main", ["https://example.com/a"], now=100)
+    assert db.enqueue_scrape_job("main", ["https://example.com/b"], now=100) == first
+    other = db.enqueue_scrape_job("manga", now=100)
+    assert [(job["urls"], job["total"]) for job in db.get_active_scrape_jobs()] == [
+        (["https://example.com/a", "https://example.com/b"], 2), (None, 1)]
+
+    batch = db.claim_scrape_links("w1", limit=1, now=100)
+    assert batch == {"job_id": first, "category": "main", "urls": ["https://example.com/a"]}
+    assert db.get_updating_categories() == {"main"}
+    # A running job absorbs due links but not a request for every link.
+    assert db.enqueue_scrape_job("main", ["https://example.com/c"], now=100) == first
+    forced = db.enqueue_scrape_job("main", now=100)
+    assert forced not in (first, other)
+
+    assert db.claim_scrape_links("w2", limit=5, now=100)["urls"] == [
+        "https://example.com/b", "https://example.com/c"]
+    assert db.claim_scrape_links("w2", limit=5, now=100)["job_id"] == other
+    # Every link of the forced job is leased under the first one.
+    assert db.claim_scrape_links("w3", limit=5, now=100) is None
+
+    # Completions only count for the worker holding the lease.
+    assert db.complete_scrape_links("w2", first, ["https://example.com/a"], now=101) == {
+        "finished": False, "lease_lost": ["https://example.com/a"]}
+    assert db.complete_scrape_links("w1", first, ["https://example.com/a"], now=101) == {
+        "finished": False, "lease_lost": []}
+    assert db.complete_scrape_links(
+        "w2", first, ["https://example.com/b", "https://example.com/c"], now=101)["finished"]
+    assert db.get_category("main")["last_checked"] == datetime.datetime.fromtimestamp(101).isoformat()
+    assert db.claim_scrape_links("w3", limit=5, now=102) == {
+        "job_id": forced, "category": "main",
+        "urls": ["https://example.com/a", "https://example.com/b", "https://example.com/c"]}
+    assert [job["id"] for job in db.get_active_scrape_jobs()] == [other, forced]
+    assert db.get_updating_categories() == {"main", "manga"}
+
+
+def test_expired_scrape_leases_are_reclaimed_then_given_up(tmp_path):
+    db = ChapterDatabase(tmp_path / "chapters.db")
+    db.add_link("a", "https://example.com/a", "main", 1, False)
+    db.add_link("b", "https://example.com/b", "main", 1, False)
+    job_id = db.enqueue_scrape_job("main", now=0)
+    db.register_scrape_worker("w1", "host", 1, now=0)
+    assert db.claim_scrape_links("w1", lease_seconds=10, now=0)["urls"] == [
+        "https://example.com/a", "https://example.com/b"]
+    assert db.heartbeat_scrape_worker("w1", lease_seconds=10, now=8) == 2
+    assert db.claim_scrape_links("w2", lease_seconds=10, now=15) is None
+
+    # w1 went silent: its links go to w2, then w2 hands b back on shutdown.
+    assert db.claim_scrape_links("w2", lease_seconds=10, now=30)["urls"] == [
+        "https://example.com/a", "https://example.com/b"]
+    assert db.get_scrape_workers() == [{
+        "id": "w1", "host": "host", "pid": 1, "started_at": 0, "heartbeat_at": 8,
+        "links_done": 0, "leased": 0}]
+    db.register_scrape_worker("w2", now=30)
+    assert not db.complete_scrape_links("w2", job_id, ["https://example.com/a"], now=31)["finished"]
+    db.unregister_scrape_worker("w2", now=31)
+    assert [worker["id"] for worker in db.get_scrape_workers()] == ["w1"]
+
+    for attempt in range(SCRAPE_LINK_MAX_LEASES - 1):
+        now = 100 * (attempt + 1)
+        assert db.claim_scrape_links("w3", lease_seconds=10, now=now)["urls"] == ["https://example.com/b"]
+    assert db.claim_scrape_links("w3", lease_seconds=10, now=1000) is None
+    assert db.get_active_scrape_jobs() == []
+    data = db.get_scraped_data("main")
+    assert data["https://example.com/b"]["last_error"].startswith("Scrape abandoned")
+    assert data["https://example.com/a"]["last_error"] is None
+
+
+def test_late_results_of_a_lost_lease_are_dropped(tmp_path):
+    db = ChapterDatabase(tmp_path / "chapters.db")
+    db.add_link("a", "https://example.com/a", "main", 1, False)
+    db.add_link("other", "https://example.com/other", "manga", 1, False)
+    job_id = db.enqueue_scrape_job("main", now=0)
+    db.claim_scrape_links("w1", lease_seconds=10, now=0)
+    assert db.claim_scrape_links("w2", lease_seconds=10, now=20)["urls"] == ["https://example.com/a"]
+    assert db.complete_scrape_links(
+        "w2", job_id, ["https://example.com/a"],
+        {"https://example.com/a": {"last_found": "Chapter 2", "timestamp": "2025/11/17"}},
+        now=21,
+    ) == {"finished": True, "lease_lost": []}
+
+    # w1 comes back late and also reports a link it never leased.
+    result = db.complete_scrape_links(
+        "w1", job_id, ["https://example.com/a"],
+        {
+            "https://example.com/a": {"last_found": "Chapter 1", "timestamp": "2025/11/16"},
+            "https://example.com/other": {"last_found": "Chapter 9", "timestamp": "2025/11/16"},
+        },
+        {"https://example.com/a": {"error": "HTTP 503"}},
+        now=22,
+    )
+
+    assert result == {
+        "finished": False, "lease_lost": ["https://example.com/a", "https://example.com/other"]}
+    entry = db.get_scraped_data("main")["https://example.com/a"]
+    assert (entry["last_found"], entry["last_error"]) == ("Chapter 2", None)
+    assert db.get_scraped_data("manga")["https://example.com/other"]["last_found"] != "Chapter 9"
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+
+from link_scheduler import LinkScheduler, link_due_at
+
+NOW = datetime(2025, 11, 20, 12, 0)
+
+
+def _row(url, category="main", **overrides):
+    row = {
+        "url": url,
+        "category": category,
+        "update_frequency": 1,
+        "last_attempt": None,
+        "last_found": None,
+        "timestamp": None,
+        "update_interval_hours": 2,
+    }
+    row.update(overrides)
+    return row
+
+
+def test_link_due_at_combines_interval_and_release_frequency():
+    assert link_due_at(_row("a"), NOW) == NOW
+    attempted = _row("a", last_attempt=(NOW - timedelta(hours=1)).isoformat())
+    assert link_due_at(attempted, NOW) == NOW + timedelta(hours=1)
+
+    recent = _row("a", last_found="Chapter 5", timestamp="2025/11/19",
+                  update_frequency=7, last_attempt=NOW.isoformat())
+    assert link_due_at(recent, NOW) == datetime(2025, 11, 27)
+
+    placeholder = _row("a", last_found="No data", timestamp="2025/11/19")
+    assert link_due_at(placeholder, NOW) == NOW
+
+
+def test_next_due_tracks_earliest_link():
+    schedule = LinkScheduler()
+    schedule.load("main", [
+        _row("late", last_attempt=NOW.isoformat()),
+        _row("soon", last_attempt=(NOW - timedelta(hours=1)).isoformat()),
+    ], now=NOW)
+    assert schedule.next_due("main") == NOW + timedelta(hours=1)
+
+    schedule.discard(["soon"])
+    assert schedule.next_due("main") == NOW + timedelta(hours=2)
+
+    stored = (NOW + timedelta(minutes=5)).timestamp()
+    schedule.update([_row("late", next_check_at=stored)], now=NOW)
+    assert schedule.next_due("main") == NOW + timedelta(minutes=5)
+
+
+def test_update_and_discard_replace_stale_heap_items():
+    schedule = LinkScheduler()
+    schedule.load("main", [_row("a"), _row("b")], now=NOW)
+
+    later = (NOW + timedelta(hours=5)).isoformat()
+    schedule.update([_row("a", last_attempt=later)], now=NOW)
+    assert schedule.discard(["b", "missing"]) == {"main"}
+
+    assert schedule.next_due("main") == NOW + timedelta(hours=7)
+
+    # Links of categories that were never loaded are left for load().
+    schedule.update([_row("c", category="other")], now=NOW)
+    assert schedule.is_loaded("other") is False
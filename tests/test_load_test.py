@@ -0,0 +1,42 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+import scraping
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _load(name, path):
+    # Loaded by path so neither tools/ nor tests/bench/ lands on sys.path.
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def load_test():
+    return _load("load_test", ROOT / "tools" / "load_test.py")
+
+
+@pytest.fixture(scope="module")
+def cases():
+    return _load("plugin_fixtures", ROOT / "tests" / "bench" / "plugin_fixtures.py").CASES
+
+
+def test_link_urls_stay_unique_and_keep_their_plugin(load_test, cases):
+    for domain, case in cases.items():
+        urls = {load_test.link_url(case["url"], index) for index in range(3)}
+        assert len(urls) == 3
+        assert {scraping._domain_for_url(url) for url in urls} == {domain}
+
+
+def test_stub_sites_serve_cases_and_inject_throttling(load_test, cases):
+    sites = load_test.StubSites(cases, scraping._domain_for_url, throttle_rps=1, clock=lambda: 5.0)
+    status, _, body = sites.respond("l1.nyaa.si", "/", "f=0&c=0_0&q=series&page=rss")
+    assert status == 200 and body.startswith(b"<?xml")
+    status, headers, _ = sites.respond("l2.nyaa.si", "/", "f=0&c=0_0&q=series&page=rss")
+    assert status == 429 and headers["Retry-After"] == "1"
+    assert sites.respond("l3.royalroad.com", "/missing", "")[0] == 404
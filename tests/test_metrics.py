@@ -0,0 +1,38 @@
+import pytest
+
+import metrics
+
+
+def test_registry_renders_prometheus_text_format():
+    registry = metrics.Registry()
+    requests = registry.counter("app_requests_total", "Requests.", ("endpoint",))
+    latency = registry.histogram("app_latency_seconds", "Latency.", buckets=(0.1, 1))
+    registry.gauge("app_queue", "Queue depth.", callback=lambda: 3)
+    registry.gauge("app_lag", "Lag.", ("job",), callback=lambda: {("update_main",): 1.5})
+
+    requests.inc(endpoint="index")
+    requests.inc(2, endpoint='say "hi"')
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    lines = registry.render().splitlines()
+    assert lines[:2] == ["# HELP app_requests_total Requests.", "# TYPE app_requests_total counter"]
+    assert 'app_requests_total{endpoint="index"} 1' in lines
+    assert 'app_requests_total{endpoint="say \\"hi\\""} 2' in lines
+    assert 'app_latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'app_latency_seconds_bucket{le="1"} 2' in lines
+    assert 'app_latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "app_latency_seconds_sum 5.55" in lines
+    assert "app_latency_seconds_count 3" in lines
+    assert "app_queue 3" in lines
+    assert 'app_lag{job="update_main"} 1.5' in lines
+
+
+def test_registry_rejects_duplicates_and_wrong_labels():
+    registry = metrics.Registry()
+    counter = registry.counter("app_total", "Total.", ("endpoint",))
+    with pytest.raises(ValueError):
+        registry.counter("app_total", "Again.")
+    with pytest.raises(ValueError):
+        counter.inc(status="200")
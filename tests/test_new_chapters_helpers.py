@@ -95,3 +95,163 @@ def test_resolve_category_prefers_known_names_and_path():
     # Direct category argument should win over path heuristics.
     first_category = category_names[0]
     assert resolve_category(first_category) == first_category
+
+
+def test_schedule_category_applies_stagger_and_jitter(monkeypatch):
+    import new_chapters
+    from link_scheduler import LinkScheduler
+
+    class RecordingScheduler:
+        def __init__(self):
+            self.jobs = {}
+
+        def add_job(self, func, trigger, **kwargs):
+            self.jobs[kwargs["id"]] = kwargs
+
+    scheduler = RecordingScheduler()
+    schedule = LinkScheduler()
+    schedule.load("stagger_test", [{"url": "https://example.com/x"}])
+    monkeypatch.setattr(new_chapters, "_scheduler", scheduler)
+    monkeypatch.setattr(new_chapters, "link_schedule", schedule)
+    monkeypatch.setitem(new_chapters._schedule_policy, "jitter", 30)
+
+    before = datetime.now()
+    new_chapters.schedule_category(
+        "stagger_test", {"name": "stagger_test", "update_interval_hours": 2}, stagger=120)
+    job = scheduler.jobs["update_stagger_test"]
+
+    assert before + timedelta(seconds=120) <= job["next_run_time"]
+    assert job["next_run_time"] <= datetime.now() + timedelta(seconds=150)
+    assert job["jitter"] == 30
+    assert job["hours"] == 2
+
+
+def test_category_slots_resize_without_exceeding_the_limit(monkeypatch):
+    import threading
+
+    import new_chapters
+
+    monkeypatch.setattr(scraping, "configure_runtime", lambda settings: None)
+    monkeypatch.setitem(new_chapters._schedule_policy, "max_concurrent", 1)
+    new_chapters._acquire_category_slot()
+    started = threading.Event()
+
+    def run():
+        new_chapters._acquire_category_slot()
+        started.set()
+
+    waiter = threading.Thread(target=run, daemon=True)
+    try:
+        waiter.start()
+        assert not started.wait(0.1)
+        # Lowering the limit never admits more jobs than it allows...
+        new_chapters.configure_scraper_runtime({"max_concurrent_categories": "1"})
+        assert not started.wait(0.1)
+        # ...and raising it wakes jobs that are waiting.
+        new_chapters.configure_scraper_runtime({"max_concurrent_categories": "2"})
+        assert started.wait(1)
+        assert new_chapters._running_categories == 2
+    finally:
+        new_chapters._release_category_slot()
+        waiter.join(1)
+        if started.is_set():
+            new_chapters._release_category_slot()
+    assert new_chapters._running_categories == 0
+
+
+def test_metrics_endpoint_reports_requests_and_runtime_gauges(monkeypatch):
+    import new_chapters
+
+    monkeypatch.setattr(new_chapters, "_start_scheduler_hook", lambda: None)
+    client = app.test_client()
+    client.get("/api/backoff")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    body = response.get_data(as_text=True)
+    assert 'chapter_tracker_http_requests_total{endpoint="backoff_links",method="GET",status="200"}' in body
+    assert "chapter_tracker_scrape_queue_depth 0" in body
+    assert "chapter_tracker_browser_driver_uptime_seconds" in body
+    assert 'chapter_tracker_db_query_duration_seconds_count{operation="get_backed_off_links",kind="read"}' in body
+
+
+def test_job_events_record_lag_and_misses():
+    import types
+    from datetime import timezone
+
+    import new_chapters
+    from apscheduler.events import EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
+
+    scheduled = datetime.now(timezone.utc) - timedelta(seconds=30)
+    new_chapters.observe_job_event(types.SimpleNamespace(
+        code=EVENT_JOB_SUBMITTED, job_id="update_lagtest", scheduled_run_times=[scheduled]))
+    new_chapters.observe_job_event(types.SimpleNamespace(
+        code=EVENT_JOB_MISSED, job_id="update_lagtest", scheduled_run_time=scheduled))
+
+    body = new_chapters.metrics_registry.render()
+    assert 'chapter_tracker_scheduler_job_lag_seconds_bucket{job="update_lagtest",le="15"} 0' in body
+    assert 'chapter_tracker_scheduler_job_lag_seconds_bucket{job="update_lagtest",le="60"} 1' in body
+    assert 'chapter_tracker_scheduler_jobs_missed_total{job="update_lagtest"} 1' in body
+
+
+def test_runtime_gauges_count_jobs_queued_for_scrape_workers(tmp_path, monkeypatch):
+    import new_chapters
+    from db_store import ChapterDatabase
+
+    store = ChapterDatabase(tmp_path / "chapters.db")
+    store.add_link("Series A", "https://example.com/a", "main", 1, False)
+    store.add_link("Series B", "https://example.com/b", "main", 1, False)
+    store.enqueue_scrape_job("main")
+    store.claim_scrape_links("w1", limit=1)
+    monkeypatch.setattr(new_chapters, "db", store)
+    monkeypatch.setattr(new_chapters, "_start_scheduler_hook", lambda: None)
+
+    body = app.test_client().get("/metrics").get_data(as_text=True)
+
+    assert "chapter_tracker_updates_in_progress 1" in body
+    assert "chapter_tracker_scrape_queue_depth 1" in body
+
+
+def test_worker_mode_queues_updates_and_relays_progress(tmp_path, monkeypatch):
+    import new_chapters
+    from db_store import ChapterDatabase
+    from link_scheduler import LinkScheduler
+
+    class FakeSocket:
+        def __init__(self):
+            self.events = []
+
+        def emit(self, event, payload, **kwargs):
+            self.events.append((event, payload))
+
+    store = ChapterDatabase(tmp_path / "chapters.db")
+    store.add_link("Series A", "https://example.com/a", "main", 1, False)
+    store.update_setting("scrape_mode", "worker")
+    socket = FakeSocket()
+    invalidated = []
+    monkeypatch.setattr(new_chapters, "db", store)
+    monkeypatch.setattr(new_chapters, "socketio", socket)
+    monkeypatch.setattr(new_chapters, "link_schedule", LinkScheduler())
+    monkeypatch.setattr(new_chapters, "_relayed_jobs", {})
+    monkeypatch.setattr(new_chapters.view_cache, "invalidate", invalidated.append)
+    monkeypatch.setattr(
+        new_chapters, "scrape_category", lambda *args: pytest.fail("scraped in the web process"))
+
+    store.add_link("Series B", "https://example.com/b", "main", 1, False)
+    new_chapters.run_update_job("main", force_update=True)
+    batch = store.claim_scrape_links("w1", limit=1)
+    store.complete_scrape_links("w1", batch["job_id"], batch["urls"])
+    new_chapters.relay_scrape_jobs()
+    new_chapters.relay_scrape_jobs()
+    batch = store.claim_scrape_links("w1", limit=1)
+    store.complete_scrape_links("w1", batch["job_id"], batch["urls"])
+    new_chapters.relay_scrape_jobs()
+
+    assert socket.events == [
+        ("update_progress", {"current": 1, "total": 2, "category": "main", "refresh": True}),
+        ("update_complete", {"category": "main"}),
+    ]
+    # Once for the first batch and once when the job finished.
+    assert invalidated == [{"main"}, {"main"}]
+    assert new_chapters._relayed_jobs == {}
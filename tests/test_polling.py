@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+
+import polling
+
+# Mondays at 10:00, with one release a day late.
+WEEKLY = [
+    datetime(2025, 10, 6, 10),
+    datetime(2025, 10, 13, 10),
+    datetime(2025, 10, 21, 10),
+    datetime(2025, 10, 27, 10),
+    datetime(2025, 11, 3, 10),
+]
+
+
+def test_estimate_cadence_and_weekday():
+    cadence = polling.estimate_cadence(WEEKLY)
+    assert cadence == timedelta(days=7)
+    assert polling.typical_weekday(WEEKLY, cadence) == 0
+    assert polling.estimate_cadence(WEEKLY[:2]) is None
+
+
+def test_expected_release_snaps_to_usual_weekday():
+    history = WEEKLY[:-1] + [datetime(2025, 11, 4, 10)]  # a Tuesday
+    expected = polling.expected_release(history, timedelta(days=7))
+    assert expected.weekday() == 0
+    assert expected == datetime(2025, 11, 10, 10)
+
+
+def test_sleeps_until_release_window_then_checks_often():
+    after_release = datetime(2025, 11, 3, 12)
+    next_check = polling.adaptive_next_check(
+        WEEKLY, after_release, after_release, min_hours=1, max_hours=1000)
+    assert datetime(2025, 11, 9) < next_check < datetime(2025, 11, 10, 10)
+
+    near_release = datetime(2025, 11, 10, 10)
+    assert polling.adaptive_next_check(
+        WEEKLY, near_release, near_release) == near_release + timedelta(hours=1)
+
+
+def test_backs_off_for_dormant_series_within_bounds():
+    dormant = datetime(2026, 3, 1)
+    next_check = polling.adaptive_next_check(
+        WEEKLY, dormant, dormant, min_hours=2, max_hours=48)
+    assert next_check == dormant + timedelta(hours=48)
+
+    slightly_late = datetime(2025, 11, 11, 10)
+    delay = polling.adaptive_next_check(
+        WEEKLY, slightly_late, slightly_late, min_hours=2, max_hours=48) - slightly_late
+    assert timedelta(hours=2) < delay < timedelta(hours=48)
+
+
+def test_needs_history_and_an_attempt():
+    now = datetime(2025, 11, 5)
+    assert polling.adaptive_next_check(WEEKLY[:2], now, now) is None
+    assert polling.adaptive_next_check(WEEKLY, None, now) == now
@@ -0,0 +1,65 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+LINKS = 300
+
+
+@pytest.fixture(scope="module")
+def db_bench():
+    # Loaded by path so tools/ never lands on sys.path.
+    spec = importlib.util.spec_from_file_location("db_bench", ROOT / "tools" / "db_bench.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def synthetic_db(db_bench):
+    return db_bench.synthetic_db
+
+
+@pytest.fixture(scope="module")
+def synthetic(tmp_path_factory, synthetic_db):
+    db = synthetic_db.generate(tmp_path_factory.mktemp("synthetic") / "chapters.db", LINKS, 6, 3)
+    yield db
+    db.close()
+
+
+def test_generator_builds_requested_shape(synthetic, synthetic_db):
+    assert sum(len(synthetic.get_links(name)) for name in synthetic.get_category_names()) == LINKS
+    history = synthetic.get_link_history(synthetic_db.link_url(7))
+    assert len(history["history"]) == 6
+    counts = synthetic.get_category_unsaved_counts()
+    assert set(counts) == {"main", "category_1", "category_2"}
+    assert sum(counts.values()) == LINKS // 3
+    assert not synthetic.get_due_links("main", now=0)
+
+
+def test_full_scans_ignore_indexes_and_table_functions(db_bench):
+    assert db_bench.full_scans([
+        "SCAN l USING COVERING INDEX idx_links_unsaved",
+        "SCAN json_each VIRTUAL TABLE INDEX 1:",
+        "SCAN CONSTANT ROW",
+        "SEARCH links USING INDEX sqlite_autoindex_links_1 (url=?)",
+    ]) == []
+    assert db_bench.full_scans(["SCAN links", "SCAN l USING INDEX idx_links_due"]) == [
+        "SCAN links", "SCAN l USING INDEX idx_links_due"]
+
+
+def test_every_public_method_is_benchmarked(db_bench, synthetic):
+    results = db_bench.bench_database(synthetic, LINKS, rounds=2)
+    assert set(results) == set(db_bench.public_methods()) - db_bench.NOT_QUERIES
+    assert all(result["statements"] for result in results.values())
+
+
+def test_hot_queries_never_scan_whole_tables(db_bench, synthetic):
+    results = db_bench.bench_database(synthetic, LINKS, rounds=1, methods=db_bench.HOT_METHODS)
+    assert set(results) == set(db_bench.HOT_METHODS)
+    scans = {
+        name: [(query["sql"], query["full_scans"]) for query in result["queries"] if query["full_scans"]]
+        for name, result in results.items()
+    }
+    assert scans == {name: [] for name in db_bench.HOT_METHODS}
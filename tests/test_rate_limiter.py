@@ -0,0 +1,88 @@
+import threading
+
+from rate_limiter import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(round(seconds, 3))
+        self.now += seconds
+
+
+def _limiter(clock, **kwargs):
+    return RateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_bucket_allows_burst_then_paces_requests():
+    clock = FakeClock()
+    limiter = _limiter(clock, rate=2, burst=2)
+    for _ in range(4):
+        limiter.acquire("example.com")
+    assert clock.slept == [0.5, 0.5]
+    # Other keys have their own bucket.
+    assert limiter.acquire("other.com") == 0
+
+
+def test_overrides_apply_per_key():
+    clock = FakeClock()
+    limiter = _limiter(clock, rate=10, burst=1, overrides={"slow.com": {"rate": 0.5}})
+    limiter.acquire("slow.com")
+    limiter.acquire("slow.com")
+    assert clock.slept == [2.0]
+
+
+def test_retry_after_blocks_and_throttling_halves_rate():
+    clock = FakeClock()
+    limiter = _limiter(clock, rate=1, burst=1)
+    limiter.acquire("example.com")
+    limiter.observe("example.com", 429, retry_after="30")
+    assert limiter.snapshot()["example.com"]["rate"] == 0.5
+
+    limiter.acquire("example.com")
+    assert clock.slept == [32.0]
+
+    for _ in range(10):
+        limiter.observe("example.com", 200)
+    assert limiter.snapshot()["example.com"]["rate"] == 1.0
+
+
+def test_parse_retry_after_accepts_dates():
+    assert parse_retry_after("12") == 12
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412470) == 10
+    assert parse_retry_after("soon") is None
+
+
+def test_limiter_is_shared_across_threads():
+    clock = FakeClock()
+    lock = threading.Lock()
+    limiter = RateLimiter(rate=1, burst=1, clock=clock, sleep=lambda s: None)
+    waits = []
+
+    def worker():
+        wait = limiter.acquire("example.com")
+        with lock:
+            waits.append(wait)
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(waits) == [0, 1, 2, 3, 4]
+
+
+def test_acquire_refuses_waits_longer_than_max_wait():
+    clock = FakeClock()
+    limiter = _limiter(clock, rate=1, burst=1)
+    limiter.acquire("example.com")
+    assert limiter.acquire("example.com", max_wait=0.5) is None
+    assert clock.slept == []
+    # The refused token was handed back.
+    assert limiter.acquire("example.com", max_wait=2) == 1.0
@@ -0,0 +1,33 @@
+from retry_policy import RetryPolicies, RetryPolicy
+
+
+def test_delay_is_jittered_exponential_backoff_capped_at_max():
+    policy = RetryPolicy(backoff=1, backoff_max=5)
+    assert [policy.delay(attempt, rng=lambda: 1.0) for attempt in range(5)] == [1, 2, 4, 5, 5]
+    assert policy.delay(3, rng=lambda: 0.5) == 2.5
+    assert policy.delay(0, rng=lambda: 0.0) == 0
+
+
+def test_overrides_only_change_listed_fields():
+    policies = RetryPolicies()
+    policies.configure(
+        default={"read_timeout": 30, "retries": 4},
+        overrides={
+            "example.com": {"retries": 0, "retry_statuses": [403]},
+            "broken.com": {"retries": "many"},
+        },
+    )
+
+    override = policies.for_key("example.com")
+    assert (override.read_timeout, override.retries, override.retry_statuses) == (30, 0, {403})
+    assert policies.for_key("broken.com") is policies.default
+    assert policies.for_key("other.com").retries == 4
+    assert policies.default.timeout == (5.0, 30.0)
+
+
+def test_overrides_follow_later_default_changes():
+    policies = RetryPolicies()
+    policies.configure(overrides={"example.com": {"retries": 0}})
+    policies.configure(default={"read_timeout": 9})
+    assert policies.for_key("example.com").timeout == (5.0, 9.0)
+    assert policies.for_key("example.com").retries == 0
@@ -0,0 +1,121 @@
+import threading
+from urllib.parse import urlsplit
+
+import scrape_worker
+import scraping
+from db_store import ChapterDatabase
+
+
+def _make_db(tmp_path):
+    db = ChapterDatabase(tmp_path / "chapters.db")
+    db.add_link("Series A", "https://example.com/a", "main", 1, False)
+    db.add_link("Series B", "https://example.com/b", "main", 1, False)
+    return db
+
+
+def test_worker_scrapes_leased_batches_and_records_progress(tmp_path, monkeypatch):
+    db = _make_db(tmp_path)
+    scraped = []
+
+    def fake_scrape(links, current_data, force_update=False, category=None, **kwargs):
+        scraped.append([link["url"] for link in links])
+        if links[0]["url"].endswith("a"):
+            return {links[0]["url"]: {"last_found": "Chapter 2", "timestamp": "2025/11/17"}}, {}
+        return {}, {links[0]["url"]: {"error": "HTTP 503"}}
+
+    monkeypatch.setattr(scrape_worker, "scrape_all_links", fake_scrape)
+    monkeypatch.setattr(scraping, "configure_runtime", lambda settings: None)
+    job_id = db.enqueue_scrape_job("main")
+
+    scrape_worker.work(scrape_worker.LocalQueue(db), "w1", threading.Event(), once=True, batch_size=1)
+
+    assert scraped == [["https://example.com/a"], ["https://example.com/b"]]
+    assert db.get_active_scrape_jobs() == []
+    with db._read("test") as conn:
+        job = dict(conn.execute("SELECT * FROM scrape_jobs WHERE id = ?", (job_id,)).fetchone())
+    assert (job["status"], job["progress"], job["total"]) == ("done", 2, 2)
+    data = db.get_scraped_data("main")
+    assert data["https://example.com/a"]["last_found"] == "Chapter 2"
+    assert data["https://example.com/b"]["last_error"] == "HTTP 503"
+    assert db.get_category("main")["last_checked"]
+    assert db.get_scrape_workers() == []
+
+
+def test_failed_batch_is_recorded_and_the_worker_moves_on(tmp_path, monkeypatch):
+    db = _make_db(tmp_path)
+    calls = []
+
+    def fake_scrape(links, current_data, **kwargs):
+        calls.append(len(links))
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return {}, {}
+
+    monkeypatch.setattr(scrape_worker, "scrape_all_links", fake_scrape)
+    monkeypatch.setattr(scraping, "configure_runtime", lambda settings: None)
+    db.add_link("Series C", "https://example.com/c", "manga", 1, False)
+    db.enqueue_scrape_job("main", ["https://example.com/a"])
+    db.enqueue_scrape_job("manga")
+
+    scrape_worker.work(scrape_worker.LocalQueue(db), "w1", threading.Event(), once=True)
+
+    assert calls == [1, 1]
+    assert db.get_active_scrape_jobs() == []
+    assert db.get_scraped_data("main", urls=["https://example.com/a"])[
+        "https://example.com/a"]["last_error"] == "boom"
+
+
+class _ClientResponse:
+    def __init__(self, response):
+        self.response = response
+
+    def raise_for_status(self):
+        assert self.response.status_code < 400, self.response.get_json()
+
+    def json(self):
+        return self.response.get_json()
+
+
+class _ClientSession:
+    """Route RemoteQueue requests to a Flask test client."""
+
+    def __init__(self, client):
+        self.client = client
+        self.headers = {}
+
+    def post(self, url, json=None, timeout=None):
+        return _ClientResponse(self.client.post(urlsplit(url).path, json=json, headers=self.headers))
+
+
+def test_remote_worker_takes_work_over_http(tmp_path, monkeypatch):
+    import new_chapters
+
+    db = _make_db(tmp_path)
+    db.update_setting("rate_limit_rps", "3")
+    monkeypatch.setattr(new_chapters, "db", db)
+    monkeypatch.setattr(new_chapters, "worker_queue", scrape_worker.LocalQueue(db))
+    monkeypatch.setattr(scraping, "remote_updates", db.get_updating_categories)
+    applied = []
+    monkeypatch.setattr(scraping, "configure_runtime", applied.append)
+
+    def fake_scrape(links, current_data, **kwargs):
+        assert scraping.is_update_in_progress("main")
+        assert set(current_data) == {link["url"] for link in links}
+        return {link["url"]: {"last_found": "Chapter 9", "timestamp": "2025/11/17"} for link in links}, {}
+
+    monkeypatch.setattr(scrape_worker, "scrape_all_links", fake_scrape)
+    db.enqueue_scrape_job("main")
+    queue = scrape_worker.RemoteQueue(
+        "http://tracker:555/", "secret", session=_ClientSession(new_chapters.app.test_client()))
+    assert queue.session.headers["X-Password"] == "secret"
+
+    scrape_worker.work(queue, "remote-1", threading.Event(), once=True, batch_size=1)
+
+    assert not scraping.is_update_in_progress("main")
+    # Settings are applied once and only the scraper ones leave the server.
+    assert len(applied) == 1 and applied[0]["rate_limit_rps"] == "3"
+    assert set(applied[0]) <= set(scraping.RUNTIME_SETTINGS)
+    assert {entry["last_found"] for entry in db.get_scraped_data("main").values()} == {"Chapter 9"}
+    response = new_chapters.app.test_client().post("/api/worker/claim", json={})
+    assert response.status_code == 400
+    assert new_chapters.app.test_client().get("/api/workers").get_json() == {"workers": [], "jobs": []}
@@ -1,3 +1,4 @@
+import scraper_utils
 from scrapers import nicovideo_manga
 
 
@@ -5,6 +6,7 @@ class _MockResponse:
     def __init__(self, content: bytes, status_code: int = 200):
         self.content = content
         self.status_code = status_code
+        self.headers = {}
 
     def raise_for_status(self):
         if self.status_code >= 400:
@@ -47,7 +49,7 @@ def test_scrape_reads_latest_item(monkeypatch):
     def fake_get(*args, **kwargs):
         return _MockResponse(xml)
 
-    monkeypatch.setattr(nicovideo_manga.requests, "get", fake_get)
+    monkeypatch.setattr(scraper_utils, "http_get", fake_get)
 
     chapter, timestamp, success, error, chapter_url = nicovideo_manga.scrape(
         "https://manga.nicovideo.jp/comic/68937"
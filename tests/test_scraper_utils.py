@@ -1,5 +1,10 @@
+import types
 from datetime import datetime, timedelta
 
+import pytest
+import requests
+
+import scraper_utils
 from scraper_utils import convert_to_rss_url, needs_update, parse_timestamp
 
 
@@ -28,3 +33,247 @@ def test_convert_to_rss_url_appends_page_parameter():
     rss_url = convert_to_rss_url(url)
     assert "page=rss" in rss_url
     assert rss_url.startswith("https://example.com/path")
+
+
+def test_get_session_reuses_one_session_per_host():
+    scraper_utils.close_sessions()
+    first = scraper_utils.get_session("https://www.royalroad.com/fiction/1")
+    second = scraper_utils.get_session("https://WWW.royalroad.com/fiction/2")
+    other = scraper_utils.get_session("https://nyaa.si/?page=rss")
+    cloudflare = scraper_utils.get_session(
+        "https://www.royalroad.com/fiction/1", cloudflare=True)
+
+    assert first is second
+    assert first is not other
+    assert cloudflare is not first
+    assert cloudflare is scraper_utils.get_session(
+        "https://www.royalroad.com/fiction/3", cloudflare=True)
+    scraper_utils.close_sessions()
+
+
+def test_configure_sessions_resizes_existing_pools():
+    scraper_utils.close_sessions()
+    session = scraper_utils.get_session("https://example.com")
+    try:
+        scraper_utils.configure_sessions(pool_connections=3, pool_maxsize=7)
+        adapter = session.get_adapter("https://example.com")
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 7
+    finally:
+        scraper_utils.configure_sessions(
+            pool_connections=scraper_utils.DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=scraper_utils.DEFAULT_POOL_MAXSIZE,
+        )
+        scraper_utils.close_sessions()
+
+
+def test_reset_session_drops_cached_session():
+    scraper_utils.close_sessions()
+    session = scraper_utils.get_session("https://example.com/a")
+    scraper_utils.reset_session("https://example.com/b")
+    assert scraper_utils.get_session("https://example.com/a") is not session
+    scraper_utils.close_sessions()
+
+
+class _FeedResponse:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _MemoryFeedCache:
+    def __init__(self):
+        self.rows = {}
+
+    def get_feed_cache(self, url):
+        return self.rows.get(url)
+
+    def store_feed_cache(self, url, etag, last_modified, result):
+        self.rows[url] = {"etag": etag, "last_modified": last_modified, "result": list(result)}
+
+
+def test_fetch_feed_reuses_parsed_result_on_not_modified(monkeypatch):
+    store = _MemoryFeedCache()
+    monkeypatch.setattr(scraper_utils, "_feed_cache", store)
+    sent_headers = []
+    responses = [
+        _FeedResponse(content=b"<rss/>", headers={"ETag": '"v1"', "Last-Modified": "Mon"}),
+        _FeedResponse(status_code=304),
+    ]
+
+    def fake_get(url, headers=None, **kwargs):
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    parsed = []
+
+    def parse(content):
+        parsed.append(content)
+        return ("Chapter 3", "2025/11/17", True, None, "https://example.com/3")
+
+    monkeypatch.setattr(scraper_utils, "http_get", fake_get)
+
+    first = scraper_utils.fetch_feed("https://example.com/rss", parse)
+    second = scraper_utils.fetch_feed("https://example.com/rss", parse)
+
+    assert first == second == ("Chapter 3", "2025/11/17", True, None, "https://example.com/3")
+    assert parsed == [b"<rss/>"]
+    assert sent_headers[0] == {}
+    assert sent_headers[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+
+
+def test_fetch_feed_does_not_cache_failed_parses(monkeypatch):
+    store = _MemoryFeedCache()
+    monkeypatch.setattr(scraper_utils, "_feed_cache", store)
+    monkeypatch.setattr(
+        scraper_utils,
+        "http_get",
+        lambda url, **kwargs: _FeedResponse(content=b"", headers={"ETag": '"v1"'}),
+    )
+
+    result = scraper_utils.fetch_feed(
+        "https://example.com/rss", lambda content: ("No chapters", "2025/11/17", False, "empty"))
+
+    assert result[2] is False
+    assert store.rows == {}
+
+
+def test_http_request_is_rate_limited_per_resolved_domain(monkeypatch):
+    calls = []
+
+    class FakeLimiter:
+        def acquire(self, key, max_wait=None):
+            calls.append(("acquire", key))
+            return 0
+
+        def observe(self, key, status, retry_after=None):
+            calls.append(("observe", key, status, retry_after))
+
+    class FakeSession:
+        def request(self, method, url, **kwargs):
+            return types.SimpleNamespace(status_code=429, headers={"Retry-After": "5"})
+
+    policies = scraper_utils.RetryPolicies()
+    policies.configure(default={"retries": 0})
+    monkeypatch.setattr(scraper_utils, "retry_policies", policies)
+    monkeypatch.setattr(scraper_utils, "rate_limiter", FakeLimiter())
+    monkeypatch.setattr(scraper_utils, "get_session", lambda *a, **k: FakeSession())
+    monkeypatch.setattr(
+        scraper_utils, "_rate_limit_resolver",
+        lambda url: "example.com" if "example.com" in url else None)
+
+    scraper_utils.http_get("https://api.example.com/feed")
+    scraper_utils.http_get("https://unknown.org/x")
+
+    assert calls == [
+        ("acquire", "example.com"),
+        ("observe", "example.com", 429, "5"),
+        ("acquire", "unknown.org"),
+        ("observe", "unknown.org", 429, "5"),
+    ]
+
+
+class _ScriptedSession:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.timeouts = []
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return types.SimpleNamespace(status_code=outcome, headers={}, close=lambda: None)
+
+
+@pytest.fixture
+def scripted(monkeypatch):
+    sleeps = []
+    policies = scraper_utils.RetryPolicies()
+    monkeypatch.setattr(scraper_utils, "retry_policies", policies)
+    monkeypatch.setattr(
+        scraper_utils, "rate_limiter", scraper_utils.RateLimiter(rate=1000, burst=100, sleep=lambda s: None))
+    monkeypatch.setattr(scraper_utils, "_rate_limit_resolver", None)
+    monkeypatch.setattr(scraper_utils.time, "sleep", sleeps.append)
+
+    def install(outcomes, **policy):
+        policies.configure(default=policy)
+        session = _ScriptedSession(outcomes)
+        monkeypatch.setattr(scraper_utils, "get_session", lambda *a, **k: session)
+        return session, sleeps
+
+    return install
+
+
+def test_http_request_retries_retryable_statuses_with_backoff(scripted):
+    session, sleeps = scripted([503, 502, 200], retries=2, backoff=1, backoff_max=10)
+    retried = []
+
+    response = scraper_utils.http_get("https://example.com/a", on_retry=lambda: retried.append(1))
+
+    assert response.status_code == 200
+    assert len(sleeps) == 2 and 0 <= sleeps[0] <= 1 and 0 <= sleeps[1] <= 2
+    assert retried == [1, 1]
+    assert session.timeouts == [(5.0, 20.0)] * 3
+
+
+def test_http_request_gives_up_after_policy_retries(scripted):
+    session, _ = scripted([requests.ConnectionError("down")] * 2, retries=1)
+    with pytest.raises(requests.ConnectionError):
+        scraper_utils.http_get("https://example.com/a")
+    assert session.outcomes == []
+
+    session, _ = scripted([404, 200])
+    assert scraper_utils.http_get("https://example.com/a").status_code == 404
+
+
+def test_http_request_retry_if_and_retries_override(scripted):
+    session, sleeps = scripted([200, 200, 200], retries=2)
+    seen = []
+
+    def first_is_bad(response):
+        seen.append(response.status_code)
+        return len(seen) == 1
+
+    assert scraper_utils.http_get("https://example.com/a", retry_if=first_is_bad).status_code == 200
+    assert seen == [200, 200] and len(sleeps) == 1
+
+    session, _ = scripted([503, 200], retries=2)
+    assert scraper_utils.http_get("https://example.com/a", retries=0).status_code == 503
+    assert session.outcomes == [200]
+
+
+def test_http_request_uses_per_domain_overrides(scripted):
+    session, _ = scripted([403, 200])
+    scraper_utils.retry_policies.configure(
+        overrides={"example.com": {"retry_statuses": [403], "read_timeout": 7}})
+
+    assert scraper_utils.http_get("https://example.com/a").status_code == 200
+    assert session.timeouts == [(5.0, 7.0), (5.0, 7.0)]
+
+
+def test_request_budget_caps_timeouts_and_stops_requests(scripted, monkeypatch):
+    session, _ = scripted([200])
+    with scraper_utils.request_budget(3):
+        scraper_utils.http_get("https://example.com/a")
+    assert max(session.timeouts[0]) <= 3
+
+    with scraper_utils.request_budget(3):
+        monkeypatch.setattr(scraper_utils, "budget_remaining", lambda: 0)
+        with pytest.raises(scraper_utils.BudgetExceeded):
+            scraper_utils.http_get("https://example.com/a")
+    assert issubclass(scraper_utils.BudgetExceeded, requests.RequestException)
+
+
+def test_track_requests_counts_requests_bytes_and_last_error(scripted):
+    scripted([200, 503, 503], retries=0)
+    with scraper_utils.track_requests() as stats:
+        scraper_utils.http_get("https://example.com/a")
+        scraper_utils.http_get("https://example.com/b")
+    # Untracked requests are not counted.
+    scraper_utils.http_get("https://example.com/c")
+    assert stats == {"requests": 2, "bytes": 0, "error": "HTTP 503"}
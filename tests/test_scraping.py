@@ -1,8 +1,24 @@
 import datetime
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
+import scraper_utils
 import scraping
+from circuit_breaker import CircuitBreaker
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuit_breaker(monkeypatch):
+    monkeypatch.setattr(scraping, "circuit_breaker", CircuitBreaker())
+    monkeypatch.setattr(scraping, "telemetry_store", None)
 
 
 def test_normalize_scrape_result_handles_dict():
@@ -56,3 +72,350 @@ def test_supports_free_toggle_reflects_registry(monkeypatch):
     })
     assert scraping.supports_free_toggle("https://example.com") is True
     assert scraping.supports_free_toggle("https://other.com") is False
+
+
+def _fake_plugin(tracker, lock):
+    def scrape(url, free_only=False):
+        domain = url.split("/")[2]
+        with lock:
+            tracker["active"][domain] = tracker["active"].get(domain, 0) + 1
+            tracker["active_total"] += 1
+            tracker["peak"][domain] = max(
+                tracker["peak"].get(domain, 0), tracker["active"][domain])
+            tracker["peak_total"] = max(
+                tracker["peak_total"], tracker["active_total"])
+        time.sleep(0.02)
+        with lock:
+            tracker["active"][domain] -= 1
+            tracker["active_total"] -= 1
+        if url.endswith("/fail"):
+            return "No data", "2025/11/17", False, "boom"
+        return "Chapter 1", "2025/11/17", True, None, url + "/c1"
+    return {"scraper": scrape, "supports_free_toggle": False}
+
+
+def test_scrape_all_links_respects_worker_and_domain_caps(monkeypatch):
+    tracker = {"active": {}, "peak": {}, "active_total": 0, "peak_total": 0}
+    lock = threading.Lock()
+    plugin = _fake_plugin(tracker, lock)
+    monkeypatch.setattr(scraping, "SCRAPERS", {"a.example": plugin, "b.example": plugin})
+    emitted = []
+
+    class FakeSocket:
+        def emit(self, event, payload, **kwargs):
+            emitted.append((event, payload))
+
+    monkeypatch.setattr(scraping, "socketio", FakeSocket())
+
+    links = [{"url": f"https://a.example/{i}"} for i in range(6)]
+    links += [{"url": f"https://b.example/{i}"} for i in range(5)]
+    links.append({"url": "https://b.example/fail"})
+
+    new_data, failures = scraping.scrape_all_links(
+        links, {}, category="manga", max_workers=3, max_per_domain=2)
+
+    assert tracker["peak"]["a.example"] <= 2
+    assert tracker["peak"]["b.example"] <= 2
+    assert tracker["peak_total"] <= 3
+    assert len(new_data) == 11
+    assert new_data["https://a.example/0"]["last_found_url"] == "https://a.example/0/c1"
+    assert failures == {"https://b.example/fail": {"error": "boom"}}
+    assert [payload["current"] for _, payload in emitted] == list(range(1, 13))
+    assert all(payload["total"] == 12 and payload["category"] == "manga"
+               for _, payload in emitted)
+    assert not scraping.is_update_in_progress("manga")
+
+
+def test_domain_cap_holds_across_concurrent_updates(monkeypatch):
+    tracker = {"active": {}, "peak": {}, "active_total": 0, "peak_total": 0}
+    plugin = _fake_plugin(tracker, threading.Lock())
+    monkeypatch.setattr(scraping, "SCRAPERS", {"a.example": plugin})
+    results = {}
+
+    def update(category):
+        links = [{"url": f"https://a.example/{category}/{i}"} for i in range(6)]
+        results[category] = scraping.scrape_all_links(
+            links, {}, category=category, max_workers=4, max_per_domain=2)
+
+    threads = [threading.Thread(target=update, args=(name,)) for name in ("main", "manga")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tracker["peak"]["a.example"] <= 2
+    assert all(len(new_data) == 6 for new_data, _ in results.values())
+    assert scraping._domain_slots == {}
+
+
+def test_scrape_all_links_skips_entries_that_are_not_due(monkeypatch):
+    calls = []
+    monkeypatch.setattr(scraping, "SCRAPERS", {
+        "a.example": {"scraper": lambda url, free_only=False: calls.append(url)},
+    })
+    today = datetime.datetime.now().strftime("%Y/%m/%d")
+    previous = {
+        "https://a.example/1": {"last_found": "Chapter 9", "timestamp": today},
+    }
+
+    new_data, failures = scraping.scrape_all_links(
+        [{"url": "https://a.example/1", "update_frequency": 7}], previous)
+
+    assert calls == []
+    assert new_data["https://a.example/1"]["last_found"] == "Chapter 9"
+    assert failures == {}
+
+
+def test_domain_index_matches_host_suffixes_only(monkeypatch):
+    plugin = {"scraper": lambda url, free_only=False: None}
+    monkeypatch.setattr(scraping, "SCRAPERS", {
+        "royalroad.com": plugin,
+        "alert.shop-bell.com": plugin,
+        "shop-bell.com": plugin,
+        "z-lib.fm,z-lib.gd": plugin,
+    })
+    assert scraping._domain_for_url(
+        "https://www.royalroad.com/fiction/1") == "royalroad.com"
+    assert scraping._domain_for_url(
+        "https://alert.shop-bell.com/x") == "alert.shop-bell.com"
+    assert scraping._domain_for_url("https://shop-bell.com/x") == "shop-bell.com"
+    assert scraping._domain_for_url(
+        "https://z-lib.gd/book/1") == "z-lib.fm,z-lib.gd"
+    # Hosts only appearing in the path or query must not match.
+    assert scraping._domain_for_url(
+        "https://evil.example/?next=royalroad.com") is None
+    assert scraping._domain_for_url("https://notroyalroad.com/") is None
+
+
+def test_domain_index_rebuilds_when_registry_changes(monkeypatch):
+    plugin = {"scraper": lambda url, free_only=False: None}
+    monkeypatch.setattr(scraping, "SCRAPERS", {"example.com": plugin})
+    assert scraping._domain_for_url("https://example.com/a") == "example.com"
+    monkeypatch.setattr(scraping, "SCRAPERS", {"other.com": plugin})
+    assert scraping._domain_for_url("https://example.com/a") is None
+    assert scraping._domain_for_url("https://other.com/a") == "other.com"
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.heap = 0
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("disconnected")
+        return "about:blank"
+
+    def execute_script(self, script):
+        return self.heap
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def browser_pool(monkeypatch):
+    manager = scraping.BrowserManager
+    created = []
+
+    def create():
+        driver = _FakeDriver()
+        created.append(driver)
+        return driver
+
+    monkeypatch.setattr(manager, "_create_driver", classmethod(lambda cls: create()))
+    monkeypatch.setattr(manager, "_start_reaper", classmethod(lambda cls: None))
+    monkeypatch.setattr(manager, "_idle", [])
+    monkeypatch.setattr(manager, "_total", 0)
+    monkeypatch.setattr(manager, "_generation", 0)
+    monkeypatch.setattr(manager, "pool_size", 2)
+    monkeypatch.setattr(manager, "max_uses", 3)
+    monkeypatch.setattr(manager, "max_memory_mb", 100)
+    return manager, created
+
+
+def test_browser_pool_reuses_drivers_and_bounds_size(browser_pool):
+    manager, created = browser_pool
+    with manager.checkout() as first:
+        with manager.checkout() as second:
+            assert first is not second
+            blocked = threading.Event()
+            got = []
+
+            def borrow():
+                blocked.set()
+                with manager.checkout() as driver:
+                    got.append(driver)
+
+            worker = threading.Thread(target=borrow)
+            worker.start()
+            blocked.wait()
+            time.sleep(0.05)
+            assert got == []
+    worker.join(timeout=1)
+    assert got and got[0] in (first, second)
+    assert len(created) == 2
+
+
+def test_browser_pool_recycles_worn_unhealthy_and_heavy_drivers(browser_pool):
+    manager, created = browser_pool
+    for _ in range(3):
+        with manager.checkout():
+            pass
+    assert len(created) == 1 and created[0].quit_called
+
+    with manager.checkout() as driver:
+        driver.heap = 200 * 1024 * 1024
+    assert driver.quit_called
+
+    with manager.checkout() as driver:
+        pass
+    driver.alive = False
+    with manager.checkout() as replacement:
+        assert replacement is not driver
+    assert driver.quit_called
+    assert manager._total == 1
+
+
+def test_quit_driver_stops_idle_and_retires_checked_out(browser_pool):
+    manager, created = browser_pool
+    with manager.checkout() as busy:
+        with manager.checkout() as idle:
+            pass
+        manager.quit_driver()
+        assert idle.quit_called and not busy.quit_called
+    assert busy.quit_called
+    assert manager._total == 0
+
+
+def test_reset_during_release_retires_the_driver(browser_pool, monkeypatch):
+    manager, created = browser_pool
+    memory_mb = manager.memory_mb
+
+    def reset_while_checking(entry):
+        # quit_driver() lands while the returning driver is being checked.
+        manager.quit_driver()
+        return memory_mb(entry)
+
+    monkeypatch.setattr(manager, "memory_mb", reset_while_checking)
+    with manager.checkout() as driver:
+        pass
+
+    assert driver.quit_called
+    assert manager._idle == [] and manager._total == 0
+
+
+def test_importing_scraping_does_not_load_browser_stack():
+    code = (
+        "import sys, scraping; "
+        "print(any(m.split('.')[0] in ('selenium', 'webdriver_manager') for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=str(ROOT), capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+
+def test_chromedriver_path_cached_until_chrome_version_changes(monkeypatch, tmp_path):
+    driver = tmp_path / "chromedriver"
+    driver.write_text("")
+    installs = []
+
+    class FakeManager:
+        def install(self):
+            installs.append(1)
+            return str(driver)
+
+    monkeypatch.setattr(
+        sys.modules["webdriver_manager.chrome"], "ChromeDriverManager", FakeManager)
+    version = {"value": "120.0"}
+    monkeypatch.setattr(scraping, "_installed_chrome_version", lambda: version["value"])
+    cache = str(tmp_path / "chromedriver.json")
+
+    assert scraping.resolve_chromedriver_path(cache) == str(driver)
+    assert scraping.resolve_chromedriver_path(cache) == str(driver)
+    assert len(installs) == 1
+    version["value"] = "121.0"
+    scraping.resolve_chromedriver_path(cache)
+    assert len(installs) == 2
+
+
+def _unavailable_response(status=503):
+    # What scraper_utils.http_request records for a response it got.
+    scraper_utils._track(response=SimpleNamespace(status_code=status, content=b""))
+
+
+def test_open_circuit_fails_fast_without_scraping(monkeypatch):
+    calls = []
+
+    def scrape(url, free_only=False):
+        calls.append(url)
+        _unavailable_response()
+        return "No data", "2025/11/17", False, "HTTP 503"
+
+    monkeypatch.setattr(scraping, "SCRAPERS", {"down.example": {"scraper": scrape}})
+    monkeypatch.setattr(scraping, "circuit_breaker", CircuitBreaker(failure_threshold=2))
+    results = [
+        scraping.process_link({"url": f"https://down.example/{i}"}, {}, True)
+        for i in range(4)
+    ]
+
+    assert len(calls) == 2
+    assert all(data is None for data, _ in results)
+    assert "circuit open" in results[-1][1]["https://down.example/3"]["error"]
+
+
+def test_content_failures_do_not_open_the_circuit(monkeypatch):
+    calls = []
+
+    def scrape(url, free_only=False):
+        calls.append(url)
+        if url.endswith("removed"):
+            _unavailable_response(404)
+        return "No data", "2025/11/17", False, "No chapters found"
+
+    monkeypatch.setattr(scraping, "SCRAPERS", {"up.example": {"scraper": scrape}})
+    monkeypatch.setattr(scraping, "circuit_breaker", CircuitBreaker(failure_threshold=2))
+    for name in ("a", "removed", "b", "removed", "c", "d"):
+        data, failure = scraping.process_link({"url": f"https://up.example/{name}"}, {}, True)
+        assert data is None and "circuit open" not in failure[f"https://up.example/{name}"]["error"]
+
+    assert len(calls) == 6
+    assert scraping.is_site_failure("ReadTimeout") and scraping.is_site_failure("HTTP 429")
+    assert not scraping.is_site_failure("HTTP 404") and not scraping.is_site_failure(None)
+
+
+def test_scrape_attempts_are_recorded_in_one_batch(monkeypatch):
+    def scrape(url, free_only=False):
+        if url.endswith("boom"):
+            raise ValueError("layout changed")
+        return "Chapter 1", "2025/11/17", url.endswith("ok"), "no chapters"
+
+    class Store:
+        batches = []
+
+        def record_scrape_attempts(self, attempts):
+            self.batches.append(list(attempts))
+
+    store = Store()
+    monkeypatch.setattr(scraping, "telemetry_store", store)
+    monkeypatch.setattr(scraping, "SCRAPERS", {
+        "site.example": {"scraper": scrape, "display_name": "Site"},
+    })
+    links = [{"url": f"https://www.site.example/{name}"} for name in ("ok", "empty", "boom")]
+
+    scraping.scrape_all_links(links, {}, force_update=True)
+
+    assert len(store.batches) == 1
+    attempts = {attempt["url"].rsplit("/", 1)[1]: attempt for attempt in store.batches[0]}
+    assert {a["plugin"] for a in attempts.values()} == {"Site"}
+    assert {a["domain"] for a in attempts.values()} == {"www.site.example"}
+    assert (attempts["ok"]["outcome"], attempts["ok"]["error_class"]) == ("success", None)
+    assert (attempts["empty"]["outcome"], attempts["empty"]["error_class"]) == ("failure", "ScrapeFailed")
+    assert (attempts["boom"]["outcome"], attempts["boom"]["error_class"]) == ("error", "ValueError")
+    assert all(a["duration_ms"] >= 0 and a["requests"] == 0 for a in attempts.values())
+
+    scraping.process_link({"url": "https://www.site.example/ok"}, {}, True)
+    assert len(store.batches) == 2 and store.batches[1][0]["outcome"] == "success"
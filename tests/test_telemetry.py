@@ -0,0 +1,24 @@
+import telemetry
+
+
+def test_percentiles_interpolate_within_buckets():
+    counts = telemetry.histogram([50] * 50 + [400] * 45 + [9000] * 5)
+    assert telemetry.percentile(counts, 50) == 100
+    assert telemetry.percentile(counts, 95) == 500
+    assert 7500 < telemetry.percentile(counts, 99) <= 10000
+    assert telemetry.percentile(telemetry.histogram([]), 50) is None
+
+
+def test_summarize_reports_failure_rate_and_percentiles():
+    group = {
+        "attempts": 4,
+        "failures": 1,
+        "requests": 6,
+        "bytes": 1024,
+        "histogram": telemetry.histogram([80, 90, 95, 10 ** 6]),
+    }
+    summary = telemetry.summarize(group)
+    assert summary["failure_rate"] == 0.25
+    assert summary["p50_ms"] <= 100
+    # The open-ended bucket reports its lower bound.
+    assert summary["p99_ms"] == 120000
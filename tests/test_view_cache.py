@@ -0,0 +1,38 @@
+from view_cache import GLOBAL_SCOPE, ViewCache
+
+
+def test_get_builds_once_until_invalidated():
+    cache = ViewCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {"rows": len(builds)}
+
+    assert cache.get("manga", "view", build) == {"rows": 1}
+    assert cache.get("manga", "view", build) == {"rows": 1}
+    cache.invalidate({"novel"})
+    assert cache.get("manga", "view", build) == {"rows": 1}
+    cache.invalidate({"manga"})
+    assert cache.get("manga", "view", build) == {"rows": 2}
+    assert len(builds) == 2
+
+
+def test_category_invalidation_also_drops_global_scope():
+    cache = ViewCache()
+    cache.get(GLOBAL_SCOPE, "nav", lambda: "old")
+    cache.invalidate({"manga"})
+    assert cache.get(GLOBAL_SCOPE, "nav", lambda: "new") == "new"
+    cache.invalidate()
+    assert cache.get(GLOBAL_SCOPE, "nav", lambda: "newest") == "newest"
+
+
+def test_value_built_during_invalidation_is_not_stored():
+    cache = ViewCache()
+
+    def build():
+        cache.invalidate({"manga"})
+        return "stale"
+
+    assert cache.get("manga", "view", build) == "stale"
+    assert cache.get("manga", "view", lambda: "fresh") == "fresh"
@@ -0,0 +1,298 @@
+"""Time every public ChapterDatabase method on synthetic databases.
+
+For each scale (``links x entries x categories``) a database is generated
+with tools/synthetic_db.py, every public method is run ``--rounds`` times
+and the median is reported together with the statements it issued and
+their ``EXPLAIN QUERY PLAN``. Statements that read a whole table are
+flagged; ``--json`` writes everything, plans included, for comparison
+between runs.
+
+    python tools/db_bench.py --scale 1000x10x3 --scale 20000x50x8 --json bench.json
+"""
+import argparse
+import datetime
+import importlib.util
+import json
+import re
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+TOOLS = Path(__file__).resolve().parent
+# Loaded by path so importing this module (e.g. from tests) leaves sys.path
+# alone; synthetic_db puts the app on sys.path when run as a script.
+_spec = importlib.util.spec_from_file_location("synthetic_db", TOOLS / "synthetic_db.py")
+synthetic_db = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(synthetic_db)
+
+from db_store import ChapterDatabase  # noqa: E402
+
+DEFAULT_SCALES = ("1000x10x3", "10000x20x5", "50000x40x8")
+# Read on every page view or after every scrape; these must stay indexed.
+HOT_METHODS = (
+    "get_scraped_data",
+    "get_category_unsaved_counts",
+    "get_link_history",
+    "mark_saved",
+    "get_links",
+    "get_due_links",
+    "merge_scraped",
+    "update_scraped_entry",
+    "record_failures",
+    "claim_scrape_links",
+    "heartbeat_scrape_worker",
+    "get_active_scrape_jobs",
+    "get_updating_categories",
+)
+# Public methods that never touch the database.
+NOT_QUERIES = {"add_change_listener", "set_query_observer", "close"}
+
+_SCAN = re.compile(r"^SCAN (\S+)(.*)$")
+_SKIPPED_STATEMENTS = ("PRAGMA", "BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE")
+
+
+def full_scans(plan):
+    """Plan lines that read every row of a table.
+
+    Scans of a covering index, table-valued functions such as ``json_each``
+    and constant rows are not counted.
+    """
+    scans = []
+    for detail in plan:
+        match = _SCAN.match(detail)
+        if not match or match.group(1) == "CONSTANT":
+            continue
+        rest = match.group(2)
+        if "COVERING INDEX" in rest or "VIRTUAL TABLE" in rest:
+            continue
+        scans.append(detail)
+    return scans
+
+
+class QueryRecorder:
+    """Collect the SQL a ChapterDatabase runs, with bound values expanded."""
+
+    def __init__(self, db):
+        self.db = db
+        self.statements = []
+        self._explainer = sqlite3.connect(db.db_path)
+        open_connection = db._open_connection
+
+        def traced():
+            conn = open_connection()
+            conn.set_trace_callback(self.statements.append)
+            return conn
+
+        db._open_connection = traced
+        # Drop connections opened before tracing so they are reopened traced.
+        db.close()
+
+    def record(self, func, *args, **kwargs):
+        """Run ``func`` and return ``(result, statements)``."""
+        del self.statements[:]
+        result = func(*args, **kwargs)
+        statements = [
+            sql.strip() for sql in self.statements
+            if not sql.lstrip().upper().startswith(_SKIPPED_STATEMENTS)
+        ]
+        return result, statements
+
+    def explain(self, sql):
+        rows = self._explainer.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        return [row[3] for row in rows]
+
+    def close(self):
+        self._explainer.close()
+
+
+def _cases(db, links):
+    """``{method: callable(round)}`` exercising every public method.
+
+    Writes are arranged so repeated rounds keep working: added links are
+    removed again, deleted history entries differ per round and so on.
+    """
+    url = synthetic_db.link_url
+    category = synthetic_db.category_name(1 if links > 1 else 0)
+    now = synthetic_db.NOW.timestamp()
+
+    with sqlite3.connect(db.db_path) as conn:
+        oldest = dict(conn.execute(
+            """
+            SELECT l.url, MIN(se.id) FROM links l JOIN scraped_entries se ON se.link_id = l.id
+            WHERE l.url IN (SELECT value FROM json_each(?)) GROUP BY l.url
+            """,
+            (json.dumps([url(index) for index in range(min(links, 64))]),),
+        ).fetchall())
+    conn.close()
+
+    def history_entry(round_):
+        return oldest.get(url(round_ % links))
+
+    def delete_history_entry(round_):
+        entry_id = history_entry(round_)
+        return db.delete_history_entry(url(round_ % links), entry_id) if entry_id else False
+
+    def scraped(round_):
+        return {
+            url(index): {
+                "last_found": f"Chapter bench {round_}",
+                "last_found_url": f"{url(index)}chapter/bench-{round_}/",
+                "timestamp": "2025/11/17",
+            }
+            for index in range(round_ * 50 % links, min(links, round_ * 50 % links + 50))
+        }
+
+    def bench_category(round_):
+        return f"bench_{round_}"
+
+    def complete_scrape_links(round_):
+        batch = db.claim_scrape_links(f"bench-{round_}", limit=20)
+        return batch and db.complete_scrape_links(f"bench-{round_}", batch["job_id"], batch["urls"])
+
+    return {
+        "get_links": lambda r: db.get_links(category),
+        "add_link": lambda r: db.add_link(f"Bench {r}", f"https://bench.example/{r}", category, 1, False),
+        "update_link": lambda r: db.update_link(
+            f"https://bench.example/{r}", f"https://bench.example/{r}", f"Bench {r}!", 2, False),
+        "remove_link": lambda r: db.remove_link(f"https://bench.example/{r}"),
+        "get_scraped_data": lambda r: db.get_scraped_data(category),
+        "get_link_schedule": lambda r: db.get_link_schedule(category),
+        "get_backed_off_links": lambda r: db.get_backed_off_links(),
+        "reset_failures": lambda r: db.reset_failures([url(r * 20 % links)]),
+        "get_due_links": lambda r: db.get_due_links(category, now=now, limit=100),
+        "get_link_history": lambda r: db.get_link_history(url(r % links)),
+        "get_history_entry": lambda r: db.get_history_entry(url(r % links), history_entry(r)),
+        "delete_history_entry": delete_history_entry,
+        "update_scraped_entry": lambda r: db.update_scraped_entry(
+            url(r % links), f"Chapter single {r}", "2025/11/17"),
+        "record_failures": lambda r: db.record_failures(
+            {url(index): {"error": "HTTP 503"} for index in range(r, min(links, r + 50))}),
+        "record_success": lambda r: db.record_success(url(r % links)),
+        "mark_saved": lambda r: db.mark_saved(url(r % links)),
+        "set_last_saved": lambda r: db.set_last_saved(url(r % links), "Chapter 1"),
+        "update_link_metadata": lambda r: db.update_link_metadata(url(r % links), favorite=bool(r % 2)),
+        "merge_scraped": lambda r: db.merge_scraped(scraped(r)),
+        "refresh_schedule": lambda r: db.refresh_schedule(),
+        "get_categories": lambda r: db.get_categories(),
+        "get_category": lambda r: db.get_category(category),
+        "get_category_names": lambda r: db.get_category_names(),
+        "set_category_last_checked": lambda r: db.set_category_last_checked(
+            category, datetime.datetime.now().isoformat()),
+        "get_category_unsaved_counts": lambda r: db.get_category_unsaved_counts(),
+        "create_category": lambda r: db.create_category(bench_category(r)),
+        "update_category_entry": lambda r: db.update_category_entry(
+            bench_category(r), display_name=f"Bench {r}"),
+        "reorder_categories": lambda r: db.reorder_categories(db.get_category_names()[::-1]),
+        "delete_category": lambda r: db.delete_category(bench_category(r)),
+        "store_feed_cache": lambda r: db.store_feed_cache(url(r % links), f'"{r}"', None, ["x", "y", True]),
+        "get_feed_cache": lambda r: db.get_feed_cache(url(r % links)),
+        "record_scrape_attempts": lambda r: db.record_scrape_attempts([
+            {"url": url(index), "plugin": "Bench", "domain": "bench.example",
+             "started_at": now - 86400 * 2 + index, "duration_ms": 120.0 + index,
+             "requests": 1, "bytes": 2048, "outcome": "success", "error_class": None}
+            for index in range(100)
+        ]),
+        "rollup_scrape_attempts": lambda r: db.rollup_scrape_attempts(now=now),
+        "get_scrape_metrics": lambda r: db.get_scrape_metrics(now - 86400 * 3),
+        "enqueue_scrape_job": lambda r: db.enqueue_scrape_job(category, [url(r % links)]),
+        "register_scrape_worker": lambda r: db.register_scrape_worker(f"bench-{r}", "bench", r),
+        "claim_scrape_links": lambda r: db.claim_scrape_links(f"bench-{r}", limit=20),
+        "heartbeat_scrape_worker": lambda r: db.heartbeat_scrape_worker(f"bench-{r}"),
+        "complete_scrape_links": complete_scrape_links,
+        "unregister_scrape_worker": lambda r: db.unregister_scrape_worker(f"bench-{r}"),
+        "get_scrape_workers": lambda r: db.get_scrape_workers(),
+        "get_active_scrape_jobs": lambda r: db.get_active_scrape_jobs(),
+        "get_updating_categories": lambda r: db.get_updating_categories(),
+        "get_scrape_queue_stats": lambda r: db.get_scrape_queue_stats(),
+        "update_setting": lambda r: db.update_setting("bench_round", r),
+        "get_settings": lambda r: db.get_settings(),
+    }
+
+
+def public_methods():
+    return sorted(
+        name for name in vars(ChapterDatabase)
+        if not name.startswith("_") and callable(getattr(ChapterDatabase, name))
+    )
+
+
+def bench_database(db, links, rounds=5, methods=None):
+    """Benchmark ``methods`` (default: all) on ``db``; results keyed by method.
+
+    Each result holds the median and per-round timings in ms plus the
+    statements of the first round with their query plans and full scans.
+    """
+    recorder = QueryRecorder(db)
+    cases = _cases(db, links)
+    results = {}
+    try:
+        for name, case in cases.items():
+            if methods is not None and name not in methods:
+                continue
+            timings = []
+            statements = []
+            for round_ in range(rounds):
+                started = time.perf_counter()
+                _, issued = recorder.record(case, round_)
+                timings.append((time.perf_counter() - started) * 1000)
+                if round_ == 0:
+                    statements = issued
+            queries = []
+            for sql in dict.fromkeys(statements):
+                plan = recorder.explain(sql)
+                queries.append({"sql": sql, "plan": plan, "full_scans": full_scans(plan)})
+            results[name] = {
+                "median_ms": round(statistics.median(timings), 3),
+                "timings_ms": [round(value, 3) for value in timings],
+                "statements": len(statements),
+                "queries": queries,
+            }
+    finally:
+        recorder.close()
+    return results
+
+
+def parse_scale(text):
+    links, entries, categories = (int(part) for part in text.lower().split("x"))
+    return links, entries, categories
+
+
+def print_report(scale, results):
+    print(f"\n== {scale}")
+    print(f"{'method':<30} {'median ms':>10} {'stmts':>6}  full scans")
+    for name, result in sorted(results.items(), key=lambda item: -item[1]["median_ms"]):
+        scans = sorted({scan for query in result["queries"] for scan in query["full_scans"]})
+        print(f"{name:<30} {result['median_ms']:>10.2f} {result['statements']:>6}  {'; '.join(scans)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scale", action="append",
+        help=f"LINKSxENTRIESxCATEGORIES, repeatable (default: {' '.join(DEFAULT_SCALES)})")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="write results and query plans here")
+    args = parser.parse_args(argv)
+
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scale or DEFAULT_SCALES:
+            links, entries, categories = parse_scale(scale)
+            started = time.perf_counter()
+            db = synthetic_db.generate(Path(tmp) / f"{scale}.db", links, entries, categories, args.seed)
+            print(f"Generated {scale} in {time.perf_counter() - started:.1f}s")
+            try:
+                report[scale] = bench_database(db, links, args.rounds)
+            finally:
+                db.close()
+            print_report(scale, report[scale])
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
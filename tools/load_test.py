@@ -0,0 +1,340 @@
+"""Load-test a full category update against a local stub of every supported site.
+
+A local HTTP server answers for every plugin with the canned pages used by
+the plugin benchmarks (tests/bench/plugin_fixtures.py), with configurable
+latency, error rate and per-site throttling. A synthetic database with
+``--links`` links spread over all plugins is scraped end to end through
+``run_update_job`` and the run is summarised.
+
+    python tools/load_test.py --links 10000 --latency-ms 80 --error-rate 0.01 \\
+        --throttle-rps 50 --workers 16 --per-domain 4
+
+Nothing leaves the machine: the shared HTTP session is swapped for one that
+sends every request to the stub server, and the app runs on a throwaway data
+directory instead of data/.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STUB_HOST_HEADER = "X-Stub-Host"
+CATEGORY = "loadtest"
+
+
+class StubSites:
+    """Canned responses per plugin plus the misbehaviour to inject."""
+
+    def __init__(self, cases, resolve, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0,
+                 throttle_rps=0.0, retry_after=1, clock=time.monotonic):
+        self.resolve = resolve
+        self.clock = clock
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rps = throttle_rps
+        self.retry_after = retry_after
+        self.routes = {}
+        for domain, case in cases.items():
+            for url, body in case["responses"].items():
+                parts = urlsplit(url)
+                self.routes[(domain, parts.path, parts.query)] = body
+        self.stats = Counter()
+        self._windows = Counter()
+        self._lock = threading.Lock()
+        self._random = random.Random(0)
+
+    def _throttled(self, domain):
+        if not self.throttle_rps:
+            return False
+        window = (domain, int(self.clock()))
+        with self._lock:
+            self._windows[window] += 1
+            return self._windows[window] > self.throttle_rps
+
+    def respond(self, host, path, query):
+        domain = self.resolve(f"https://{host}/")
+        with self._lock:
+            self.stats["requests"] += 1
+            failing = self._random.random() < self.error_rate
+            delay = self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if self._throttled(domain):
+            self._count(429)
+            return 429, {"Retry-After": str(self.retry_after)}, b"Too Many Requests"
+        if failing:
+            self._count(500)
+            return 500, {}, b"Internal Server Error"
+        body = self.routes.get((domain, path, query))
+        if body is None:
+            body = self.routes.get((domain, path, ""))
+        if body is None:
+            self._count(404)
+            return 404, {}, b"Not Found"
+        self._count(200)
+        return 200, {}, body
+
+    def _count(self, status):
+        with self._lock:
+            self.stats[status] += 1
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _serve(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        parts = urlsplit(self.path)
+        status, headers, body = self.server.sites.respond(
+            self.headers.get(STUB_HOST_HEADER, ""), parts.path, parts.query)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _serve
+    do_POST = _serve
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(sites):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.request_queue_size = 256
+    server.sites = sites
+    threading.Thread(target=server.serve_forever, name="stub-server", daemon=True).start()
+    return server
+
+
+class RoutingSession(requests.Session):
+    """Session that sends every request to the stub server, keeping the host in a header."""
+
+    def __init__(self, netloc, pool_size):
+        super().__init__()
+        self.netloc = netloc
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        parts = urlsplit(url)
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers[STUB_HOST_HEADER] = parts.hostname or ""
+        local = urlunsplit(("http", self.netloc, parts.path or "/", parts.query, ""))
+        return super().request(method, local, *args, headers=headers, **kwargs)
+
+
+def link_url(case_url, index):
+    # A unique subdomain keeps URLs distinct while plugins still see the
+    # path and query they expect; domain lookup matches on suffix.
+    parts = urlsplit(case_url)
+    return urlunsplit((parts.scheme, f"l{index}.{parts.netloc}", parts.path, parts.query, ""))
+
+
+def build_database(db, cases, links):
+    db.create_category(CATEGORY, update_interval_hours=1)
+    domains = sorted(cases)
+    for index in range(links):
+        case = cases[domains[index % len(domains)]]
+        db.add_link(f"Series {index}", link_url(case["url"], index), CATEGORY, 1, False)
+
+
+def peak_rss_mb():
+    """Process memory high-water mark in MB, or None if unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return _windows_peak_rss_mb()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _windows_peak_rss_mb():
+    try:
+        import ctypes
+        from ctypes import wintypes
+    except ImportError:
+        return None
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    try:
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return None
+    except (AttributeError, OSError):
+        return None
+    return counters.PeakWorkingSetSize / (1024 * 1024)
+
+
+def run(args):
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+        # The app opens its database and log in the data directory on import.
+        os.environ["CHAPTER_TRACKER_DATA_DIR"] = str(Path(args.data_dir or tmp).resolve())
+        import new_chapters
+        import scraper_utils
+        import scraping
+        from plugin_fixtures import CASES
+
+        # new_chapters sets up logging on import; quieten it unless asked.
+        logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+        sites = StubSites(
+            CASES,
+            scraping._domain_for_url,
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            throttle_rps=args.throttle_rps,
+            retry_after=args.retry_after,
+        )
+        server = start_stub_server(sites)
+        session = RoutingSession(f"127.0.0.1:{server.server_address[1]}", pool_size=args.workers * 2)
+        scraper_utils.get_session = lambda *a, **k: session
+
+        db = new_chapters.db
+        setup_started = time.perf_counter()
+        build_database(db, CASES, args.links)
+        setup_seconds = time.perf_counter() - setup_started
+
+        for key, value in {
+            "scrape_max_workers": args.workers,
+            "scrape_max_per_domain": args.per_domain,
+            "rate_limit_rps": args.rate_limit_rps,
+            "rate_limit_burst": max(1, int(args.rate_limit_rps)),
+            "rate_limit_overrides": "{}",
+        }.items():
+            db.update_setting(key, str(value))
+
+        writes = {"count": 0, "seconds": 0.0}
+        writes_lock = threading.Lock()
+
+        def observe(operation, kind, seconds):
+            if kind == "write":
+                with writes_lock:
+                    writes["count"] += 1
+                    writes["seconds"] += seconds
+
+        new_chapters.configure_scraper_runtime(db.get_settings())
+        db.set_query_observer(observe)
+
+        started = time.perf_counter()
+        new_chapters.run_update_job(CATEGORY, force_update=args.force)
+        wall = time.perf_counter() - started
+        db.set_query_observer(None)
+
+        plugins = db.get_scrape_metrics(0)["plugins"]
+        scraped = sum(plugin["attempts"] for plugin in plugins.values())
+        report = {
+            "links": args.links,
+            "scraped": scraped,
+            "failed": sum(plugin["failures"] for plugin in plugins.values()),
+            "setup_seconds": round(setup_seconds, 2),
+            "wall_seconds": round(wall, 2),
+            "links_per_second": round(scraped / wall, 1) if wall else None,
+            "db_write_seconds": round(writes["seconds"], 3),
+            "db_writes": writes["count"],
+            "peak_rss_mb": _round(peak_rss_mb()),
+            "plugins": {
+                name: {key: plugin[key] for key in ("attempts", "failure_rate", "p50_ms", "p95_ms")}
+                for name, plugin in plugins.items()
+            },
+            "server": {str(key): value for key, value in sorted(sites.stats.items(), key=str)},
+            "settings": {
+                "workers": args.workers,
+                "per_domain": args.per_domain,
+                "rate_limit_rps": args.rate_limit_rps,
+                "latency_ms": args.latency_ms,
+                "error_rate": args.error_rate,
+                "throttle_rps": args.throttle_rps,
+            },
+        }
+        db.close()
+        server.shutdown()
+    return report
+
+
+def _round(value):
+    return round(value, 1) if value is not None else None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--links", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=8, help="scrape_max_workers")
+    parser.add_argument("--per-domain", type=int, default=2, help="scrape_max_per_domain")
+    parser.add_argument("--rate-limit-rps", type=float, default=1000.0,
+                        help="client-side requests per second per site")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="share of requests answered with HTTP 500")
+    parser.add_argument("--throttle-rps", type=float, default=0.0,
+                        help="per-site requests per second before the stub answers 429")
+    parser.add_argument("--retry-after", type=int, default=1,
+                        help="Retry-After seconds sent with 429 responses")
+    parser.add_argument("--force", action="store_true",
+                        help="scrape every link instead of only the due ones")
+    parser.add_argument("--data-dir", help="keep the app's data directory (database, log) here")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # run() imports the app and the plugin fixtures.
+    for path in (str(ROOT), str(ROOT / "tests" / "bench")):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    report = run(args)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"links scraped     {report['scraped']} / {report['links']} ({report['failed']} failed)")
+    print(f"wall time         {report['wall_seconds']}s (setup {report['setup_seconds']}s)")
+    print(f"throughput        {report['links_per_second']} links/s")
+    print(f"db write time     {report['db_write_seconds']}s over {report['db_writes']} writes")
+    print(f"peak memory       {report['peak_rss_mb']} MB")
+    print(f"stub server       {report['server']}")
+    for name, plugin in sorted(report["plugins"].items()):
+        print(f"  {name:<20} {plugin['attempts']:>6} links  p50 {plugin['p50_ms']}ms  "
+              f"p95 {plugin['p95_ms']}ms  failures {plugin['failure_rate']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Generate a synthetic chapter database of a given size.
+
+Builds ``--links`` links spread over ``--categories`` categories, each with
+``--entries`` rows of scrape history, directly in SQLite so large databases
+take seconds rather than hours. The schema comes from ``ChapterDatabase``
+itself and ``next_check_at`` is computed by it, so the result looks like a
+database the app has been using for a long time.
+
+    python tools/synthetic_db.py data/synthetic.db --links 50000 --entries 40 --categories 8
+"""
+import argparse
+import datetime
+import random
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from db_store import ChapterDatabase  # noqa: E402
+
+SITES = (
+    "www.royalroad.com", "www.scribblehub.com", "nyaa.si", "kemono.cr",
+    "manga.nicovideo.jp", "ichicomi.com", "www.novelupdates.com", "rawkuma.net",
+)
+NOW = datetime.datetime(2025, 11, 17, 12, 0)
+BATCH = 5000
+
+
+def category_name(index):
+    return "main" if index == 0 else f"category_{index}"
+
+
+def link_url(index):
+    return f"https://{SITES[index % len(SITES)]}/series/{index}/"
+
+
+def generate(path, links, entries, categories=1, seed=0):
+    """Create ``path`` with the requested shape and return a ChapterDatabase on it.
+
+    Roughly a third of links have unsaved chapters, one in twenty is failing
+    and history rows are spaced a few days apart ending near ``NOW``.
+    """
+    path = Path(path)
+    if path.exists():
+        raise FileExistsError(f"{path} already exists")
+    rng = random.Random(seed)
+    ChapterDatabase(path).close()
+
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO categories (name, update_interval_hours, display_name, sort_order)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (category_name(index), rng.choice((1, 2, 6, 24)),
+                     category_name(index).replace("_", " ").title(), index)
+                    for index in range(categories)
+                ],
+            )
+            for start in range(0, links, BATCH):
+                _insert_batch(conn, rng, range(start, min(links, start + BATCH)), entries, categories)
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO latest_entries (link_id, entry_id, last_found, last_found_url, timestamp)
+                SELECT link_id, id, last_found, last_found_url, timestamp
+                FROM scraped_entries
+                WHERE id IN (SELECT MAX(id) FROM scraped_entries GROUP BY link_id)
+                """
+            )
+            # Saved links point at their newest chapter, the rest lag behind.
+            conn.execute(
+                """
+                UPDATE links
+                SET (last_saved, last_saved_url) = (
+                    SELECT last_found, last_found_url FROM latest_entries WHERE link_id = links.id
+                )
+                WHERE id % 3 <> 0
+                """
+            )
+    finally:
+        conn.close()
+
+    db = ChapterDatabase(path)
+    db.refresh_schedule()
+    return db
+
+
+def _insert_batch(conn, rng, indexes, entries, categories):
+    link_rows = []
+    entry_rows = []
+    for index in indexes:
+        added = NOW - datetime.timedelta(days=entries * 3 + rng.randint(0, 30))
+        failing = index % 20 == 0
+        link_rows.append((
+            index + 1,
+            link_url(index),
+            f"Series {index}",
+            category_name(index % categories),
+            rng.choice((1, 1, 1, 2, 7)),
+            int(rng.random() < 0.1),
+            "N/A",
+            added.isoformat(),
+            int(rng.random() < 0.05),
+            (NOW - datetime.timedelta(hours=rng.randint(0, 48))).isoformat(),
+            "HTTP 503" if failing else None,
+            rng.randint(1, 6) if failing else 0,
+        ))
+        for number in range(1, entries + 1):
+            found = added + datetime.timedelta(days=number * 3, hours=rng.randint(0, 23))
+            entry_rows.append((
+                index + 1,
+                f"Chapter {number}",
+                f"{link_url(index)}chapter/{number}/",
+                found.strftime("%Y/%m/%d"),
+                found.isoformat(),
+            ))
+    conn.executemany(
+        """
+        INSERT INTO links (
+            id, url, name, category, update_frequency, free_only, last_saved,
+            added_at, favorite, last_attempt, last_error, failure_count
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        link_rows,
+    )
+    conn.executemany(
+        """
+        INSERT INTO scraped_entries (link_id, last_found, last_found_url, timestamp, retrieved_at)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        entry_rows,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path, help="database file to create")
+    parser.add_argument("--links", type=int, default=10000)
+    parser.add_argument("--entries", type=int, default=20, help="history rows per link")
+    parser.add_argument("--categories", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    generate(args.path, args.links, args.entries, args.categories, args.seed).close()
+    print(
+        f"Wrote {args.links} links x {args.entries} entries in {args.categories} categories "
+        f"to {args.path} in {time.perf_counter() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
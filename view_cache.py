@@ -0,0 +1,39 @@
+import threading
+
+# Scope for values that span categories (e.g. nav unsaved counts); it is
+# dropped on every invalidation.
+GLOBAL_SCOPE = "*"
+
+
+class ViewCache:
+    """Per-category cache of computed view models and rendered fragments."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._versions = {}
+        self._epoch = 0
+
+    def get(self, scope, key, build):
+        with self._lock:
+            entries = self._entries.get(scope)
+            if entries is not None and key in entries:
+                return entries[key]
+            version = (self._epoch, self._versions.get(scope, 0))
+        value = build()
+        with self._lock:
+            # Skip storing if the scope was invalidated while building.
+            if (self._epoch, self._versions.get(scope, 0)) == version:
+                self._entries.setdefault(scope, {})[key] = value
+        return value
+
+    def invalidate(self, categories=None):
+        """Drop cached values for ``categories``; ``None`` drops everything."""
+        with self._lock:
+            if categories is None:
+                self._entries.clear()
+                self._epoch += 1
+                return
+            for scope in set(categories) | {GLOBAL_SCOPE}:
+                self._entries.pop(scope, None)
+                self._versions[scope] = self._versions.get(scope, 0) + 1